@@ -31,12 +31,12 @@ setup(
         "spaceone-core",
         "spaceone-api",
         "schematics",
-        "pandas",
         "packaging",
     ],
     package_data={
         "spaceone": [
             "repository/managed_resource/plugin/*.yaml",
+            "repository/managed_resource/plugin.snapshot",
             "repository/managed_resource/policy/*.yaml",
             "repository/managed_resource/schema/*.yaml",
         ]
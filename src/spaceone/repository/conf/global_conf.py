@@ -24,6 +24,12 @@ CONNECTORS = {
         "image_prefix": "",
         "verify": True,
     },
+    "OCIRegistryConnector": {
+        "base_url": "",  # default: https://{REGISTRY_INFO.OCI_REGISTRY.url}
+        "username": "",
+        "password": "",
+        "verify": True,
+    },
     "GithubContainerRegistryConnector": {
         "github_token": "",
         "owner_type": "",  # USER | ORGANIZATION
@@ -37,7 +43,17 @@ CONNECTORS = {
     "SpaceConnector": {
         "backend": "spaceone.core.connector.space_connector.SpaceConnector",
         "endpoints": {"identity": "grpc+ssl://localhost:50051"},
-    }
+    },
+    # Channels to remote repositories are pooled per endpoint (seconds)
+    "RemoteRepositoryConnector": {
+        "connect_timeout": 3,
+        "timeout": 180,
+        "keepalive_time": 300,  # must not be shorter than the server allows
+        "keepalive_timeout": 20,
+        "keepalive_permit_without_calls": False,
+        "hedge_delay": 0,  # resend list requests not answered in N seconds (0: disable)
+        "hedge_workers": 32,
+    },
 }
 
 # 2. 인증 핸들러 설정 (필수)
@@ -61,11 +77,24 @@ REGISTRY_INFO = {
     "HARBOR": {"url": "", "image_pull_secrets": ""},
     "GITHUB": {"url": "ghcr.io"},
     "GCP_PRIVATE_GCR": {"url": ""},
+    "OCI_REGISTRY": {"url": ""},
 }
 
+# Registry tag lookups are cached in CACHES['default'] (seconds, 0: disable)
+REGISTRY_TAGS_CACHE_TTL = 300
+# Serve expired tags immediately and refresh them in the background
+REGISTRY_TAGS_CACHE_SERVE_STALE = False
+REGISTRY_TAGS_CACHE_MAX_STALE = 3600  # seconds until stale tags are evicted
+REGISTRY_TAGS_REFRESH_WORKERS = 4
+
 # Use managed repository (Read Only), if you can not use plugin marketplace
 ENABLE_MANAGED_REPOSITORY = False
-DEFAULT_REGISTRY = "DOCKER_HUB"  # DOCKER_HUB | AWS_PRIVATE_ECR | HARBOR | GCP_PRIVATE_GCR
+DEFAULT_REGISTRY = "DOCKER_HUB"  # DOCKER_HUB | AWS_PRIVATE_ECR | HARBOR | GCP_PRIVATE_GCR | OCI_REGISTRY
+
+# Extensions of the Plugin API requested with gRPC metadata (the protos have no RPCs for them)
+#   Plugin.get_versions + "version-constraint": one version matching the constraint
+#   Plugin.list + "suggest-prefix": suggestions as JSON in the "suggestions" trailing metadata
+ENABLE_PLUGIN_METADATA_EXTENSIONS = False
 
 ROOT_TOKEN = ""
 ROOT_TOKEN_INFO = {}
@@ -73,6 +102,23 @@ ROOT_TOKEN_INFO = {}
 MANAGED_REGISTRY_TYPE = "DOCKER_HUB"
 MANAGED_REGISTRY_CONFIG = {}
 MANAGED_PLUGIN_IMAGE_PREFIX = "cloudforet"
+# Reload managed_resource/plugin when files change (polling seconds, 0: disable)
+MANAGED_PLUGIN_RELOAD_INTERVAL = 0
+
+# Keyword search/suggest indexes of local plugins, kept in the memory of each process.
+# An index is rebuilt from a scan of the domain's plugins after TTL seconds, or at once
+# when a plugin is changed. Changes are shared through CACHES['default']; without it,
+# other replicas may return stale keyword results for up to TTL seconds.
+LOCAL_PLUGIN_SEARCH_INDEX_TTL = 60
+
+# Repository of each plugin_id for Plugin.get (seconds, misses are kept shorter).
+# Dropped on every replica when a local plugin changes, if CACHES['default'] is set.
+PLUGIN_LOCATION_CACHE_TTL = 300
+PLUGIN_LOCATION_MISSING_TTL = 60
+# IDs that no repository has are cached in process (seconds, 0: disable).
+# Dropped on every replica when the resource is registered, if CACHES['default'] is set.
+NOT_FOUND_CACHE_TTL = 30
+NOT_FOUND_CACHE_SIZE = 10000
 
 # System Token
 TOKEN = ""
@@ -96,3 +142,46 @@ REPOSITORIES = [
         "repository_type": "LOCAL",
     },
 ]
+
+# Requests across all repositories are sent concurrently
+REPOSITORY_FAN_OUT_WORKERS = 16
+REPOSITORY_TIMEOUT = 10  # seconds to wait for each remote repository, its calls are cut off then
+# Kept from the caller's gRPC deadline to merge and send the response (seconds)
+REPOSITORY_DEADLINE_MARGIN = 0.5
+
+# Plugin.list and DashboardTemplate.list responses of remote repositories (seconds, 0: disable)
+REMOTE_REPOSITORY_CACHE_TTL = 60
+REMOTE_REPOSITORY_CACHE_SIZE = 1000
+# After the TTL, reuse the response if the remote count and last update did not change
+REMOTE_REPOSITORY_REVISION_CHECK = False
+
+# Mirror of REMOTE repositories in MongoDB, synced by RemoteRepositorySyncScheduler.
+# Reads use the mirror while the last sync is younger than REMOTE_MIRROR_MAX_AGE
+# (seconds) and fall back to it while the remote repository is unreachable.
+REMOTE_MIRROR_MAX_AGE = 3600
+REMOTE_MIRROR_PAGE_SIZE = 500
+# Time of the last sync is cached in each process (seconds, keep it near the sync interval)
+REMOTE_MIRROR_STATE_CACHE_TTL = 300
+
+# Scheduler and worker ("spaceone run scheduler spaceone.repository")
+# QUEUES = {
+#     "repository_q": {
+#         "backend": "spaceone.core.queue.redis_queue.RedisQueue",
+#         "host": "redis",
+#         "port": 6379,
+#         "channel": "repository_job",
+#     },
+# }
+# SCHEDULERS = {
+#     "remote_repository_sync": {
+#         "backend": "spaceone.repository.interface.task.v1.remote_repository_sync_scheduler.RemoteRepositorySyncScheduler",
+#         "queue": "repository_q",
+#         "interval": 300,
+#     },
+# }
+# WORKERS = {
+#     "repository_worker": {
+#         "backend": "spaceone.core.scheduler.worker.BaseWorker",
+#         "queue": "repository_q",
+#     },
+# }
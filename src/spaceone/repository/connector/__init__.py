@@ -1 +1,2 @@
 from spaceone.repository.connector.registry_connector import *
+from spaceone.repository.connector.remote_repository_connector import *
@@ -1,26 +1,104 @@
 import abc
+import hashlib
+import heapq
 import requests
 import logging
+import re
+import threading
+import urllib.parse
+import time
 import boto3
-from packaging.version import parse
 import base64
+import datetime
 import json
+import google.auth.transport.requests
 from google.oauth2 import service_account
 from google.cloud import artifactregistry_v1
 
 from spaceone.core.connector import BaseConnector
 from spaceone.repository.error import *
+from spaceone.repository.lib.version import parse_version, sort_tags
 
 __all__ = [
     "DockerHubConnector",
     "AWSPrivateECRConnector",
+    "OCIRegistryConnector",
     "HarborConnector",
     "GithubContainerRegistryConnector",
     "GCPPrivateGCRConnector",
 ]
 
 _LOGGER = logging.getLogger(__name__)
-_DEFAULT_PAGE_SIZE = 10
+_DEFAULT_PAGE_SIZE = 100
+_DEFAULT_TIMEOUT = 10
+_HTTP_POOL_MAXSIZE = 50
+_GITHUB_PER_PAGE = 100
+_GITHUB_RATE_LIMIT_MAX_WAIT = 3
+_ECR_PAGE_SIZE = 1000
+_GCP_TAGS_PAGE_SIZE = 1000
+_OCI_DEFAULT_TOKEN_EXPIRES_IN = 60
+_OCI_TOKEN_EXPIRY_MARGIN = 10
+_OCI_MAX_PAGES = 100
+_GCP_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+_GCP_TOKEN_REFRESH_MARGIN = 300
+_GCP_TOKEN_REFRESH_INTERVAL = 60
+
+_HTTP_SESSION_LOCK = threading.Lock()
+_HTTP_SESSION = None
+
+# github_token -> (X-RateLimit-Remaining, X-RateLimit-Reset)
+_GITHUB_RATE_LIMIT_LOCK = threading.Lock()
+_GITHUB_RATE_LIMITS = {}
+
+# base_url -> WWW-Authenticate challenge, (realm, service, scope, auth hash) -> (token, expires_at)
+_OCI_AUTH_CHALLENGES = {}
+_OCI_TOKEN_LOCK = threading.Lock()
+_OCI_TOKENS = {}
+
+# (aws_access_key_id, secret hash, region_name) -> boto3 ECR client
+_ECR_CLIENT_LOCK = threading.Lock()
+_ECR_CLIENTS = {}
+
+# (project_id, location, repository_id, key hash) -> (client, project, credentials)
+_GCP_CLIENT_LOCK = threading.Lock()
+_GCP_CLIENTS = {}
+_GCP_CREDENTIALS_REFRESHER = None
+
+
+def _get_http_session() -> requests.Session:
+    # One keep-alive session per process so registry calls reuse TCP/TLS connections
+    global _HTTP_SESSION
+
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=_HTTP_POOL_MAXSIZE,
+                    pool_maxsize=_HTTP_POOL_MAXSIZE,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _HTTP_SESSION = session
+
+    return _HTTP_SESSION
+
+
+def _get_ecr_client(aws_access_key_id, aws_secret_access_key, region_name):
+    secret_hash = hashlib.sha256(aws_secret_access_key.encode("utf-8")).hexdigest()
+    client_key = (aws_access_key_id, secret_hash, region_name)
+
+    # boto3 clients are thread-safe, but creating them from the default session is not
+    with _ECR_CLIENT_LOCK:
+        if client_key not in _ECR_CLIENTS:
+            _ECR_CLIENTS[client_key] = boto3.client(
+                "ecr",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+            )
+
+        return _ECR_CLIENTS[client_key]
 
 
 class RegistryConnector(BaseConnector):
@@ -31,41 +109,211 @@ class RegistryConnector(BaseConnector):
 
 class DockerHubConnector(RegistryConnector):
     def get_tags(self, registry_url, image):
+        return list(self.iter_tags(registry_url, image))
+
+    def iter_tags(self, registry_url, image):
+        session = _get_http_session()
+        timeout = self.config.get("timeout", _DEFAULT_TIMEOUT)
+
         url = f"https://{registry_url}/v2/repositories/{image}/tags"
+        params = {"page_size": self.config.get("page_size", _DEFAULT_PAGE_SIZE)}
 
-        response = requests.get(url)
+        while url:
+            response = session.get(url, params=params, timeout=timeout)
 
-        if response.status_code == 200:
-            image_tags = []
-            results = response.json().get("results", [])
-            for tag in results:
-                image_tags.append(tag["name"])
+            if response.status_code != 200:
+                _LOGGER.error(
+                    f"[iter_tags] request error: {response.status_code} ({url})"
+                )
+                raise ERROR_NO_IMAGE_IN_REGISTRY(
+                    registry_type="DOCKER_HUB", image=image
+                )
 
-            return image_tags
+            response_data = response.json()
+            for tag in response_data.get("results", []):
+                yield tag["name"]
 
-        else:
-            raise ERROR_NO_IMAGE_IN_REGISTRY(registry_type="DOCKER_HUB", image=image)
+            # The next link already carries page and page_size
+            url = response_data.get("next")
+            params = None
 
 
-class HarborConnector(RegistryConnector):
+class OCIRegistryConnector(RegistryConnector):
+    """Registry connector for the OCI Distribution Spec (/v2/<name>/tags/list)
+
+    Bearer tokens negotiated through WWW-Authenticate are cached until they
+    expire and tags are paged with n/last over the pooled session.
+    """
+
+    registry_type = "OCI_REGISTRY"
+
     def get_tags(self, registry_url, image):
-        base_url = self.config.get("base_url")
-        verify = self.config.get("verify", True)
+        return list(self.iter_tags(registry_url, image))
+
+    def iter_tags(self, registry_url, image):
+        base_url = self.config.get("base_url") or f"https://{registry_url}"
+        base_url = base_url.rstrip("/")
+        page_size = self.config.get("page_size", _DEFAULT_PAGE_SIZE)
 
-        headers = {"authorization": f'Basic {self.config["token"]}'}
+        max_pages = self.config.get("max_pages", _OCI_MAX_PAGES)
 
         url = f"{base_url}/v2/{image}/tags/list"
+        params = {"n": page_size}
+
+        for _ in range(max_pages):
+            response = self._request(base_url, url, params, image)
+
+            if response.status_code != 200:
+                _LOGGER.error(
+                    f"[iter_tags] request error: {response.status_code} ({url})"
+                )
+                raise ERROR_NO_IMAGE_IN_REGISTRY(
+                    registry_type=self.registry_type, image=image
+                )
+
+            image_tags = response.json().get("tags") or []
+
+            # A registry that ignores last returns a page with the last tag again
+            if params and params.get("last") in image_tags:
+                _LOGGER.warning(
+                    f"[iter_tags] registry ignores last, stop paging: {base_url}"
+                )
+                return
+
+            yield from image_tags
+
+            if next_url := response.links.get("next", {}).get("url"):
+                url = urllib.parse.urljoin(base_url, next_url)
+                params = None
+            elif len(image_tags) >= page_size:
+                # Registries without Link headers are paged with the last tag
+                params = {"n": page_size, "last": image_tags[-1]}
+            else:
+                return
+
+        _LOGGER.warning(
+            f"[iter_tags] stop paging after {max_pages} pages: {base_url}/v2/{image}"
+        )
 
-        response = requests.get(url, headers=headers, verify=verify)
+    def _request(self, base_url, url, params, image):
+        session = _get_http_session()
+        verify = self.config.get("verify", True)
+        timeout = self.config.get("timeout", _DEFAULT_TIMEOUT)
+        scope = f"repository:{image}:pull"
 
-        if response.status_code == 200:
-            image_tags = response.json().get("tags", [])
-            image_tags.sort(key=parse, reverse=True)
-            return image_tags
+        challenge = _OCI_AUTH_CHALLENGES.get(base_url)
+        headers = self._make_auth_headers(challenge, scope)
+        response = session.get(
+            url, params=params, headers=headers, verify=verify, timeout=timeout
+        )
+
+        if response.status_code == 401:
+            challenge = self._parse_auth_challenge(
+                response.headers.get("WWW-Authenticate", "")
+            )
+            if challenge is None:
+                return response
+
+            # Remember the challenge so that later calls skip the 401 round-trip
+            _OCI_AUTH_CHALLENGES[base_url] = challenge
+            headers = self._make_auth_headers(challenge, scope, refresh=True)
+            response = session.get(
+                url, params=params, headers=headers, verify=verify, timeout=timeout
+            )
+
+        return response
+
+    def _make_auth_headers(self, challenge, scope, refresh=False):
+        if challenge is None:
+            return {}
+        elif challenge["scheme"] == "basic":
+            if basic_auth := self._get_basic_auth():
+                return {"authorization": f"Basic {basic_auth}"}
+            return {}
         else:
-            _LOGGER.error(f"[get_tags] request error: {response.json()}")
+            token = self._get_bearer_token(challenge, scope, refresh)
+            return {"authorization": f"Bearer {token}"}
+
+    def _get_bearer_token(self, challenge, scope, refresh=False):
+        basic_auth = self._get_basic_auth()
+        token_key = (
+            challenge["realm"],
+            challenge.get("service"),
+            scope,
+            hashlib.sha256((basic_auth or "").encode("utf-8")).hexdigest(),
+        )
+
+        with _OCI_TOKEN_LOCK:
+            token, expires_at = _OCI_TOKENS.get(token_key, (None, 0))
+
+        if token and not refresh and expires_at > time.time():
+            return token
+
+        params = {"scope": scope}
+        if service := challenge.get("service"):
+            params["service"] = service
+
+        headers = {}
+        if basic_auth:
+            headers["authorization"] = f"Basic {basic_auth}"
 
-        raise ERROR_NO_IMAGE_IN_REGISTRY(registry_type="HARBOR", image=image)
+        response = _get_http_session().get(
+            challenge["realm"],
+            params=params,
+            headers=headers,
+            verify=self.config.get("verify", True),
+            timeout=self.config.get("timeout", _DEFAULT_TIMEOUT),
+        )
+
+        if response.status_code != 200:
+            _LOGGER.error(
+                f"[_get_bearer_token] token request error: {response.status_code}"
+            )
+            raise ERROR_REGISTRY_SETTINGS(registry_type=self.registry_type)
+
+        token_info = response.json()
+        token = token_info.get("token") or token_info.get("access_token")
+        expires_in = token_info.get("expires_in", _OCI_DEFAULT_TOKEN_EXPIRES_IN)
+
+        with _OCI_TOKEN_LOCK:
+            _OCI_TOKENS[token_key] = (
+                token,
+                time.time() + expires_in - _OCI_TOKEN_EXPIRY_MARGIN,
+            )
+
+        return token
+
+    def _get_basic_auth(self):
+        if token := self.config.get("token"):
+            return token
+
+        username = self.config.get("username")
+        password = self.config.get("password")
+        if username and password:
+            return base64.b64encode(f"{username}:{password}".encode("utf-8")).decode(
+                "utf-8"
+            )
+
+        return None
+
+    @staticmethod
+    def _parse_auth_challenge(www_authenticate):
+        scheme, _, params = www_authenticate.partition(" ")
+        scheme = scheme.lower()
+
+        if scheme == "basic":
+            return {"scheme": scheme}
+        elif scheme == "bearer":
+            challenge = dict(re.findall(r'(\w+)="([^"]*)"', params))
+            if "realm" in challenge:
+                challenge["scheme"] = scheme
+                return challenge
+
+        return None
+
+
+class HarborConnector(OCIRegistryConnector):
+    registry_type = "HARBOR"
 
 
 class AWSPrivateECRConnector(RegistryConnector):
@@ -80,32 +328,45 @@ class AWSPrivateECRConnector(RegistryConnector):
         if not all([aws_access_key_id, aws_secret_access_key]):
             raise ERROR_CONNECTOR_CONFIGURATION(connector="AWSPrivateECRConnector")
 
-        self.client = boto3.client(
-            "ecr",
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name,
+        self.client = _get_ecr_client(
+            aws_access_key_id, aws_secret_access_key, region_name
         )
 
     def get_tags(self, registry_url, image):
+        # 0 lists every tag, otherwise only tags of the N images with the
+        # highest versions are kept (the order RegistryManager returns them in)
+        max_images = self.config.get("max_images", 0)
+
         try:
             paginator = self.client.get_paginator("describe_images")
             response_iterator = paginator.paginate(
-                repositoryName=image, registryId=self.config.get("account_id")
+                repositoryName=image,
+                registryId=self.config.get("account_id"),
+                filter={"tagStatus": "TAGGED"},
+                PaginationConfig={"PageSize": _ECR_PAGE_SIZE},
             )
+
+            # ECR returns images in no particular order, so keep only the tags
+            # and a bounded heap of the images with the highest versions
             images_info = []
             for data in response_iterator:
-                images_info.extend(data.get("imageDetails", []))
-
-            image_tags = []
-            sorted_images_info = sorted(
-                images_info, key=lambda k: k["imagePushedAt"], reverse=True
-            )
-            for image_info in sorted_images_info:
-                if "imageTags" in image_info:
-                    image_tags.extend(image_info["imageTags"])
-
-            return image_tags
+                for image_detail in data.get("imageDetails", []):
+                    tags = image_detail.get("imageTags", [])
+                    image_info = (
+                        self._make_image_order_key(
+                            tags, image_detail["imagePushedAt"]
+                        ),
+                        len(images_info),
+                        tags,
+                    )
+                    if max_images <= 0:
+                        images_info.append(image_info)
+                    elif len(images_info) < max_images:
+                        heapq.heappush(images_info, image_info)
+                    elif image_info[0] > images_info[0][0]:
+                        heapq.heapreplace(images_info, image_info)
+
+            return sort_tags([tag for _, _, tags in images_info for tag in tags])
 
         except Exception as e:
             _LOGGER.error(f"[get_tags] boto3 describe_image_tags error: {e}")
@@ -114,10 +375,25 @@ class AWSPrivateECRConnector(RegistryConnector):
             )
 
 
+    @staticmethod
+    def _make_image_order_key(tags: list, pushed_at) -> tuple:
+        # Images with a version tag rank above the others (latest, sha-...),
+        # which are ordered by push time
+        versions = [version for version in map(parse_version, tags) if version]
+        if versions:
+            return 1, max(versions), pushed_at
+
+        return 0, pushed_at
+
+
 class GithubContainerRegistryConnector(RegistryConnector):
     def get_tags(self, registry_url, image):
+        return list(self.iter_tags(registry_url, image))
+
+    def iter_tags(self, registry_url, image):
         owner_type = self.config.get("owner_type")
         github_token = self.config.get("github_token")
+        timeout = self.config.get("timeout", _DEFAULT_TIMEOUT)
         name, package_name = image.split("/", 1)
         registry_url = "api.github.com"
 
@@ -131,91 +407,189 @@ class GithubContainerRegistryConnector(RegistryConnector):
         else:
             url = f"https://api.github.com/orgs/{name}/packages/container/{package_name}/versions"
 
-        response = requests.get(url, headers=headers)
+        session = _get_http_session()
+        params = {"per_page": _GITHUB_PER_PAGE}
 
-        if response.status_code == 200:
-            image_tags = []
-            results = response.json()
-            for result in results:
+        # The wait for a rate limit reset blocks the request thread, so all
+        # pages of one call share a small budget
+        wait_budget = self.config.get("rate_limit_max_wait", _GITHUB_RATE_LIMIT_MAX_WAIT)
+
+        while url:
+            wait_budget -= self._wait_for_rate_limit(github_token, image, wait_budget)
+            response = session.get(url, headers=headers, params=params, timeout=timeout)
+            self._update_rate_limit(github_token, response.headers)
+
+            if response.status_code != 200:
+                _LOGGER.error(
+                    f"[iter_tags] request error: {response.status_code} ({url})"
+                )
+                raise ERROR_NO_IMAGE_IN_REGISTRY(registry_type="GITHUB", image=image)
+
+            for result in response.json():
                 _tags = result.get("metadata", {}).get("container", {}).get("tags", [])
-                image_tags.extend(_tags)
+                yield from _tags
 
-            return image_tags
+            # The next link (Link: <...>; rel="next") already carries per_page
+            url = response.links.get("next", {}).get("url")
+            params = None
 
-        else:
-            raise ERROR_NO_IMAGE_IN_REGISTRY(registry_type="GITHUB", image=image)
+    def _wait_for_rate_limit(self, github_token, image, max_wait) -> float:
+        threshold = self.config.get("rate_limit_threshold", 10)
+
+        with _GITHUB_RATE_LIMIT_LOCK:
+            remaining, reset_at = _GITHUB_RATE_LIMITS.get(github_token, (None, 0))
+
+        if remaining is None or remaining > threshold:
+            return 0
+
+        wait_seconds = reset_at - time.time()
+        if wait_seconds <= 0:
+            return 0
+
+        if wait_seconds > max_wait:
+            raise ERROR_REGISTRY_RATE_LIMITED(
+                registry_type="GITHUB", image=image, retry_after=int(wait_seconds)
+            )
+
+        _LOGGER.warning(
+            f"[_wait_for_rate_limit] {remaining} requests left, "
+            f"wait {wait_seconds:.1f}s for rate limit reset"
+        )
+        time.sleep(wait_seconds)
+        return wait_seconds
+
+    @staticmethod
+    def _update_rate_limit(github_token, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_at = headers.get("X-RateLimit-Reset")
+
+        if remaining is None or reset_at is None:
+            return
+
+        with _GITHUB_RATE_LIMIT_LOCK:
+            _GITHUB_RATE_LIMITS[github_token] = (int(remaining), int(reset_at))
 
 
 class GCPPrivateGCRConnector(RegistryConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        
-        # GCP 인증 설정
-        credentials = None
-        project = None
-        repository_id = None
-        location = None
-        
-        # 서비스 계정 키 JSON 사용
-        try:
-            self.repository_id = self.config.get("repository_id")
-            self.location = self.config.get("location")
-            
-            service_account_key = self.config.get("service_account_key")
-            decoded_key = base64.b64decode(service_account_key).decode('utf-8')
-            key_info = json.loads(decoded_key)
 
-            credentials = service_account.Credentials.from_service_account_info(key_info)
-            project = credentials.project_id
-            _LOGGER.info("[GCPPrivateGCRConnector] Using service account key")
+        self.repository_id = self.config.get("repository_id")
+        self.location = self.config.get("location")
 
-        except Exception as e:
-            _LOGGER.error(f"[GCPPrivateGCRConnector] Failed to load service account key: {e}")
-            raise ERROR_CONNECTOR_CONFIGURATION(connector="GCPPrivateGCRConnector")
-        if not credentials:
-            raise ERROR_CONNECTOR_CONFIGURATION(connector="GCPPrivateGCRConnector")
-        
-        # 설정에서 프로젝트 ID 가져오기 (우선순위: 설정 > 자격증명에서 추출)
-        config_project_id = self.config.get("project_id")
-        if config_project_id:
-            project = config_project_id
-        
-        self.client = artifactregistry_v1.ArtifactRegistryClient(credentials=credentials)
-        self.project = project
+        # 서비스 계정 키 JSON 사용 (프로세스 내에서 클라이언트/자격증명 재사용)
+        self.client, self.project = _get_artifact_registry_client(
+            self.config.get("service_account_key"),
+            self.config.get("project_id"),
+            self.location,
+            self.repository_id,
+        )
 
     def get_tags(self, registry_url, image):
         try:
             # 이미지 경로에서 repository와 package 정보 추출
             # projects/spaceone-aramco-project/locations/asia-northeast3/repositories/space-cloudops/packages/plugin-http-file-cost-datasource
-            
+
             # Artifact Registry API를 사용하여 태그 목록 가져오기
             parent = f"projects/{self.project}/locations/{self.location}/repositories/{self.repository_id}/packages/{image}"
-            
-            # print(f"#### parent: {parent}")
-            
-            request = artifactregistry_v1.ListTagsRequest(parent=parent)
+
+            request = artifactregistry_v1.ListTagsRequest(
+                parent=parent,
+                page_size=self.config.get("page_size", _GCP_TAGS_PAGE_SIZE),
+            )
             tags_result = self.client.list_tags(request=request)
-            
+
             image_tags = []
-            
+
             for tag in tags_result:
                 tag_name = tag.name.split('/')[-1]
-                image_tags.append(tag_name)    
-        
-        
-            try:
-                image_tags.sort(key=parse, reverse=True)
-            except Exception as e:
-                _LOGGER.warning(f"[get_tags] Version sorting failed: {e}, using original order")
-                pass
-            
+                image_tags.append(tag_name)
+
             return image_tags
-        
+
         except Exception as e:
             _LOGGER.error(f"[get_tags] GCP Artifact Registry error: {e}")
             raise ERROR_NO_IMAGE_IN_REGISTRY(registry_type="GCP_Private_GCR", image=image)
 
 
+def _get_artifact_registry_client(
+    service_account_key, project_id, location, repository_id
+):
+    key_hash = hashlib.sha256((service_account_key or "").encode("utf-8")).hexdigest()
+    client_key = (project_id, location, repository_id, key_hash)
+
+    with _GCP_CLIENT_LOCK:
+        if client_key not in _GCP_CLIENTS:
+            credentials, project = _load_gcp_credentials(service_account_key)
+
+            # 설정에서 프로젝트 ID 가져오기 (우선순위: 설정 > 자격증명에서 추출)
+            if project_id:
+                project = project_id
+
+            # One client (and gRPC channel) per key for the life of the process
+            client = artifactregistry_v1.ArtifactRegistryClient(credentials=credentials)
+            _GCP_CLIENTS[client_key] = (client, project, credentials)
+            _start_gcp_credentials_refresher()
+
+        client, project, _ = _GCP_CLIENTS[client_key]
+        return client, project
+
+
+def _load_gcp_credentials(service_account_key):
+    try:
+        decoded_key = base64.b64decode(service_account_key).decode('utf-8')
+        key_info = json.loads(decoded_key)
+
+        # Scoped credentials are used by the client as is, so refreshing
+        # them in the background also refreshes the client's token
+        credentials = service_account.Credentials.from_service_account_info(
+            key_info, scopes=_GCP_SCOPES
+        )
+        _LOGGER.info("[GCPPrivateGCRConnector] Using service account key")
+
+    except Exception as e:
+        _LOGGER.error(f"[GCPPrivateGCRConnector] Failed to load service account key: {e}")
+        raise ERROR_CONNECTOR_CONFIGURATION(connector="GCPPrivateGCRConnector")
+
+    if not credentials:
+        raise ERROR_CONNECTOR_CONFIGURATION(connector="GCPPrivateGCRConnector")
+
+    return credentials, credentials.project_id
+
+
+def _start_gcp_credentials_refresher():
+    global _GCP_CREDENTIALS_REFRESHER
+
+    if _GCP_CREDENTIALS_REFRESHER is None:
+        _GCP_CREDENTIALS_REFRESHER = threading.Thread(
+            target=_refresh_gcp_credentials,
+            name="gcp-credentials-refresher",
+            daemon=True,
+        )
+        _GCP_CREDENTIALS_REFRESHER.start()
+
+
+def _refresh_gcp_credentials():
+    # Refresh tokens before they expire so that token refresh never lands on a request
+    while True:
+        with _GCP_CLIENT_LOCK:
+            credentials_list = [credentials for _, _, credentials in _GCP_CLIENTS.values()]
+
+        for credentials in credentials_list:
+            expiry = credentials.expiry
+            if credentials.token and expiry:
+                now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+                remaining = (expiry - now).total_seconds()
+                if remaining > _GCP_TOKEN_REFRESH_MARGIN:
+                    continue
+
+            try:
+                credentials.refresh(google.auth.transport.requests.Request())
+            except Exception as e:
+                _LOGGER.warning(f"[_refresh_gcp_credentials] failed to refresh token: {e}")
+
+        time.sleep(_GCP_TOKEN_REFRESH_INTERVAL)
+
 
 if __name__ == "__main__":
     docker_hub_conn = DockerHubConnector()
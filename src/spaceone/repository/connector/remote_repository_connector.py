@@ -0,0 +1,253 @@
+import collections
+import logging
+import threading
+import time
+
+import grpc
+from google.protobuf.json_format import MessageToDict
+from opentelemetry import context, trace
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+from spaceone.core.connector import BaseConnector
+from spaceone.core.error import *
+from spaceone.core.pygrpc.client import GRPCClient
+from spaceone.core.utils import parse_grpc_endpoint
+
+from spaceone.repository.lib.fan_out import FanOut, get_deadline
+from spaceone.repository.lib.single_flight import SingleFlight
+
+__all__ = ["RemoteRepositoryConnector"]
+
+_LOGGER = logging.getLogger(__name__)
+_TRACER = trace.get_tracer(__name__)
+_MAX_MESSAGE_LENGTH = 1024 * 1024 * 256
+_DEFAULT_CONNECT_TIMEOUT = 3
+_DEFAULT_KEEPALIVE_TIME = 300
+_DEFAULT_KEEPALIVE_TIMEOUT = 20
+_DEFAULT_HEDGE_WORKERS = 32
+_MIN_CALL_TIMEOUT = 0.01
+
+# endpoint : _PooledChannel
+_CHANNEL_POOL = {}
+_CHANNEL_POOL_LOCK = threading.Lock()
+_CHANNEL_SINGLE_FLIGHT = SingleFlight()
+_HEDGE_FAN_OUT = None
+_HEDGE_FAN_OUT_LOCK = threading.Lock()
+
+
+class _CallDetails(
+    collections.namedtuple(
+        "_CallDetails",
+        ["method", "timeout", "metadata", "credentials", "wait_for_ready", "compression"],
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+class _DeadlineInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Shortens the timeout of a call to the deadline of the fan-out call
+
+    GRPCClient sets its own timeout on every call, so this interceptor sits
+    between GRPCClient and the channel.
+    """
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        deadline = get_deadline()
+        if deadline is None:
+            return continuation(client_call_details, request)
+
+        timeout = max(deadline - time.monotonic(), _MIN_CALL_TIMEOUT)
+        if client_call_details.timeout is not None:
+            timeout = min(timeout, client_call_details.timeout)
+
+        return continuation(
+            _CallDetails(
+                client_call_details.method,
+                timeout,
+                client_call_details.metadata,
+                client_call_details.credentials,
+                client_call_details.wait_for_ready,
+                getattr(client_call_details, "compression", None),
+            ),
+            request,
+        )
+
+
+class _PooledChannel(object):
+    def __init__(self, channel: grpc.Channel, client: GRPCClient):
+        self.channel = channel
+        self.client = client
+
+
+class RemoteRepositoryConnector(BaseConnector):
+    """gRPC client of a remote (marketplace) repository
+
+    Channels are kept per endpoint and shared by all requests and threads,
+    so the TCP/TLS handshake and the reflection of the remote API happen
+    once instead of on every call. The token is sent in the metadata of each
+    call, so repositories with different tokens on one endpoint share the
+    channel. A channel is rebuilt when a call fails to reach the endpoint.
+
+    dispatch(..., hedge=True) sends a read request once more when it has not
+    been answered after hedge_delay seconds (0: disabled). Calls made within
+    a FanOut call end at its deadline instead of the connector timeout.
+    """
+
+    def __init__(self, *args, endpoint: str = None, token: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._endpoint = endpoint
+        self._token = token
+
+        if not self._endpoint:
+            raise ERROR_CONNECTOR_LOAD(
+                connector="RemoteRepositoryConnector", reason="endpoint is required."
+            )
+
+    def dispatch(self, method: str, params: dict = None, hedge: bool = False) -> dict:
+        params = params or {}
+        parent_context = context.get_current()
+        hedge_delay = self.config.get("hedge_delay", 0)
+
+        if hedge and hedge_delay > 0:
+            return self._get_hedge_fan_out().hedge(
+                self._call_api_in_span, (method, params, parent_context), hedge_delay
+            )
+
+        return self._call_api_in_span(method, params, parent_context)
+
+    def _call_api_in_span(self, method: str, params: dict, parent_context) -> dict:
+        # Hedged calls run in other threads, so the parent span is passed on
+        with _TRACER.start_as_current_span(
+            method, context=parent_context, kind=SpanKind.CLIENT
+        ):
+            return self._call_api(method, params)
+
+    def _call_api(self, method: str, params: dict) -> dict:
+        resource, verb = method.split(".", 1)
+        pooled_channel = self._get_pooled_channel()
+
+        if verb not in pooled_channel.client.api_resources.get(resource, []):
+            raise ERROR_CONNECTOR(
+                connector="RemoteRepositoryConnector",
+                reason=f"Method not supported. (endpoint = {self._endpoint}, method = {method})",
+            )
+
+        deadline = get_deadline()
+        if deadline is not None and time.monotonic() >= deadline:
+            raise ERROR_GRPC_TIMEOUT()
+
+        try:
+            response = getattr(getattr(pooled_channel.client, resource), verb)(
+                params, metadata=self._get_metadata()
+            )
+        except ERROR_BASE as e:
+            if e.error_code == "ERROR_GRPC_CONNECTION":
+                self._discard_pooled_channel(pooled_channel)
+            raise e
+
+        return MessageToDict(response, preserving_proto_field_name=True)
+
+    def _get_metadata(self) -> list:
+        metadata = []
+
+        if self._token:
+            metadata.append(("token", self._token))
+
+        carrier = {}
+        TraceContextTextMapPropagator().inject(carrier)
+
+        if traceparent := carrier.get("traceparent"):
+            metadata.append(("traceparent", traceparent))
+
+        return metadata
+
+    def _get_pooled_channel(self) -> _PooledChannel:
+        pooled_channel = _CHANNEL_POOL.get(self._endpoint)
+        if pooled_channel is not None:
+            return pooled_channel
+
+        # Concurrent requests to a new endpoint share one connection attempt
+        return _CHANNEL_SINGLE_FLIGHT.do(self._endpoint, self._create_pooled_channel)
+
+    def _create_pooled_channel(self) -> _PooledChannel:
+        pooled_channel = _CHANNEL_POOL.get(self._endpoint)
+        if pooled_channel is not None:
+            return pooled_channel
+
+        e = parse_grpc_endpoint(self._endpoint)
+        options = self._make_channel_options()
+
+        if e["ssl_enabled"]:
+            channel = grpc.secure_channel(
+                e["endpoint"], grpc.ssl_channel_credentials(), options=options
+            )
+        else:
+            channel = grpc.insecure_channel(e["endpoint"], options=options)
+
+        try:
+            grpc.channel_ready_future(channel).result(
+                timeout=self.config.get("connect_timeout", _DEFAULT_CONNECT_TIMEOUT)
+            )
+            client = GRPCClient(
+                grpc.intercept_channel(channel, _DeadlineInterceptor()),
+                {},
+                e["endpoint"],
+                self.config.get("timeout"),
+            )
+        except Exception as error:
+            channel.close()
+            message = error.details() if hasattr(error, "details") else str(error)
+            raise ERROR_GRPC_CONNECTION(
+                channel=self._endpoint, message=message or "Channel is not ready."
+            )
+
+        pooled_channel = _PooledChannel(channel, client)
+
+        # The replaced channel is not closed here since other threads may still
+        # use it; it is closed when it is garbage collected.
+        with _CHANNEL_POOL_LOCK:
+            _CHANNEL_POOL[self._endpoint] = pooled_channel
+
+        _LOGGER.debug(f"[_create_pooled_channel] connected to {self._endpoint}")
+        return pooled_channel
+
+    def _discard_pooled_channel(self, pooled_channel: _PooledChannel) -> None:
+        with _CHANNEL_POOL_LOCK:
+            if _CHANNEL_POOL.get(self._endpoint) is pooled_channel:
+                _LOGGER.warning(
+                    f"[_discard_pooled_channel] channel failed, reconnect next time: "
+                    f"{self._endpoint}"
+                )
+                del _CHANNEL_POOL[self._endpoint]
+
+    def _get_hedge_fan_out(self) -> FanOut:
+        global _HEDGE_FAN_OUT
+
+        with _HEDGE_FAN_OUT_LOCK:
+            if _HEDGE_FAN_OUT is None:
+                _HEDGE_FAN_OUT = FanOut(
+                    self.config.get("hedge_workers", _DEFAULT_HEDGE_WORKERS),
+                    thread_name_prefix="remote-repository-hedge",
+                )
+
+            return _HEDGE_FAN_OUT
+
+    def _make_channel_options(self) -> list:
+        keepalive_time = self.config.get("keepalive_time", _DEFAULT_KEEPALIVE_TIME)
+        keepalive_timeout = self.config.get(
+            "keepalive_timeout", _DEFAULT_KEEPALIVE_TIMEOUT
+        )
+
+        return [
+            ("grpc.max_send_message_length", _MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", _MAX_MESSAGE_LENGTH),
+            ("grpc.keepalive_time_ms", keepalive_time * 1000),
+            ("grpc.keepalive_timeout_ms", keepalive_timeout * 1000),
+            (
+                "grpc.keepalive_permit_without_calls",
+                int(self.config.get("keepalive_permit_without_calls", False)),
+            ),
+            ("grpc.http2.max_pings_without_data", 0),
+        ]
@@ -23,3 +23,15 @@ class ERROR_NO_IMAGE_IN_REGISTRY(ERROR_UNKNOWN):
 
 class ERROR_REGISTRY_SETTINGS(ERROR_UNKNOWN):
     _message = 'Registry settings are not ready. (registry_type = {registry_type})'
+
+
+class ERROR_REGISTRY_RATE_LIMITED(ERROR_UNKNOWN):
+    _message = 'Registry rate limit is exceeded. (registry_type = {registry_type}, image = {image}, retry_after = {retry_after}s)'
+
+
+class ERROR_INVALID_VERSION_CONSTRAINT(ERROR_INVALID_ARGUMENT):
+    _message = 'Version constraint is invalid. (constraint = {constraint})'
+
+
+class ERROR_NO_MATCHING_VERSION(ERROR_INVALID_ARGUMENT):
+    _message = 'No version matches the constraint. (constraint = {constraint})'
@@ -45,7 +45,16 @@ class DashboardTemplate(BaseAPI, dashboard_template_pb2_grpc.DashboardTemplateSe
 
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
+
+        # Cursor pagination is requested and returned with the next-token metadata
+        if 'next-token' in metadata:
+            params['next_token'] = metadata['next-token']
+
         with self.locator.get_service('DashboardTemplateService', metadata) as template_svc:
             templates_data, total_count = template_svc.list(params)
+
+            if template_svc.next_token is not None:
+                context.set_trailing_metadata((('next-token', template_svc.next_token),))
+
             return self.locator.get_info('DashboardTemplatesInfo', templates_data, total_count, minimal=self.get_minimal(params))
 
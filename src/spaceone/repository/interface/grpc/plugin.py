@@ -1,4 +1,7 @@
+import json
+
 from spaceone.api.repository.v1 import plugin_pb2, plugin_pb2_grpc
+from spaceone.core import config
 from spaceone.core.pygrpc import BaseAPI
 
 
@@ -40,6 +43,12 @@ class Plugin(BaseAPI, plugin_pb2_grpc.PluginServicer):
     def get_versions(self, request, context):
         params, metadata = self.parse_request(request, context)
         with self.locator.get_service('PluginService', metadata) as plugin_svc:
+            # A version constraint (latest-stable, >=1.12,<2, ...) is resolved to one version
+            if self._is_extension_enabled() and 'version-constraint' in metadata:
+                params['version'] = metadata['version-constraint']
+                version = plugin_svc.resolve_version(params)
+                return self.locator.get_info('VersionsInfo', [version])
+
             version_list = plugin_svc.get_versions(params)
             return self.locator.get_info('VersionsInfo', version_list)
 
@@ -51,7 +60,52 @@ class Plugin(BaseAPI, plugin_pb2_grpc.PluginServicer):
 
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
+
+        # Cursor pagination is requested and returned with the next-token metadata
+        if 'next-token' in metadata:
+            params['next_token'] = metadata['next-token']
+
+        # Repositories are waited for only until the caller's deadline
+        params['time_remaining'] = context.time_remaining()
+
         with self.locator.get_service('PluginService', metadata) as plugin_svc:
+            # Names, labels and providers starting with the prefix are returned instead of plugins
+            if self._is_extension_enabled() and 'suggest-prefix' in metadata:
+                suggestions = plugin_svc.suggest(self._make_suggest_params(params, metadata['suggest-prefix']))
+                context.set_trailing_metadata((('suggestions', json.dumps(suggestions)),))
+                return self.locator.get_info('PluginsInfo', [], 0)
+
             plugins_data, total_count = plugin_svc.list(params)
+
+            trailing_metadata = []
+            if plugin_svc.next_token is not None:
+                trailing_metadata.append(('next-token', plugin_svc.next_token))
+
+            # Repositories missing from the results or answered from an outdated mirror
+            if plugin_svc.skipped_repositories:
+                trailing_metadata.append(('skipped-repositories', ','.join(plugin_svc.skipped_repositories)))
+
+            if plugin_svc.partial_repositories:
+                trailing_metadata.append(('partial-repositories', ','.join(plugin_svc.partial_repositories)))
+
+            if trailing_metadata:
+                context.set_trailing_metadata(tuple(trailing_metadata))
+
             return self.locator.get_info('PluginsInfo', plugins_data, total_count, minimal=self.get_minimal(params))
 
+    @staticmethod
+    def _make_suggest_params(params, prefix):
+        suggest_params = {'prefix': prefix}
+        for key in ['resource_type', 'repository_id', 'domain_id']:
+            if params.get(key):
+                suggest_params[key] = params[key]
+
+        limit = params.get('query', {}).get('page', {}).get('limit')
+        if limit:
+            suggest_params['limit'] = limit
+
+        return suggest_params
+
+    @staticmethod
+    def _is_extension_enabled():
+        return config.get_global('ENABLE_PLUGIN_METADATA_EXTENSIONS', False)
@@ -0,0 +1,38 @@
+import logging
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core.scheduler import IntervalScheduler
+
+__all__ = ["RemoteRepositorySyncScheduler"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RemoteRepositorySyncScheduler(IntervalScheduler):
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if not self._token:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+    def create_task(self) -> list:
+        return [
+            {
+                "name": "remote_repository_sync_schedule",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "RemoteRepositorySyncService",
+                        "metadata": {"token": self._token},
+                        "method": "sync",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+        ]
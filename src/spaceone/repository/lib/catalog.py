@@ -0,0 +1,292 @@
+import copy
+import logging
+
+from spaceone.repository.error import *
+from spaceone.repository.lib.cursor import compare_keyset
+from spaceone.repository.lib.query import MISSING, get_value, make_matcher, project
+from spaceone.repository.lib.search import SearchIndex
+
+__all__ = ["Catalog"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Catalog(object):
+    """Immutable in-memory catalog with hash indexes
+
+    Records are normalized once (missing keys are filled with "") and are
+    never modified. Lookups on indexed keys are dict lookups, filters are
+    intersections of index entries, and only the selected records are copied
+    when they are materialized.
+    """
+
+    def __init__(
+        self,
+        records: list,
+        index_keys: list,
+        generation: int = 0,
+        search_fields: dict = None,
+    ):
+        self._generation = generation
+
+        keys = []
+        for record in records:
+            for key in record.keys():
+                if key not in keys:
+                    keys.append(key)
+
+        self._keys = tuple(keys)
+        self._records = tuple(
+            {key: self._fill_value(record.get(key)) for key in keys}
+            for record in records
+        )
+        self._indexes = {}
+
+        for key in index_keys:
+            index = {}
+            for position, record in enumerate(self._records):
+                index.setdefault(record.get(key, ""), []).append(position)
+
+            self._indexes[key] = {
+                value: tuple(positions) for value, positions in index.items()
+            }
+
+        self._search_index = None
+        if search_fields:
+            self._search_index = SearchIndex(enumerate(self._records), search_fields)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def generation(self) -> int:
+        """Incremented whenever a reloaded catalog replaces this one"""
+        return self._generation
+
+    @property
+    def keys(self) -> tuple:
+        return self._keys
+
+    @property
+    def index_keys(self) -> tuple:
+        return tuple(self._indexes.keys())
+
+    def get_record(self, position: int) -> dict:
+        return self._records[position]
+
+    def lookup(self, key: str, value) -> tuple:
+        """Positions of records whose key equals value"""
+
+        if index := self._indexes.get(key):
+            return index.get(value, ())
+
+        return tuple(
+            position
+            for position, record in enumerate(self._records)
+            if record.get(key) == value
+        )
+
+    def filter(self, keyword: str = None, **conditions) -> list:
+        """Positions of records matching all conditions, in catalog order
+
+        Conditions with None values are ignored. keyword is matched against
+        the search index if the catalog has one, otherwise it is matched
+        case-insensitively against the name.
+        """
+
+        positions = None
+        for key, value in conditions.items():
+            if value is None:
+                continue
+
+            matched = self.lookup(key, value)
+            if positions is None:
+                positions = set(matched)
+            else:
+                positions &= set(matched)
+
+            if not positions:
+                return []
+
+        if positions is None:
+            positions = range(len(self._records))
+        else:
+            positions = sorted(positions)
+
+        if keyword and self._search_index:
+            scores = self._search_index.scores(keyword)
+            positions = [position for position in positions if position in scores]
+        elif keyword:
+            keyword = keyword.lower()
+            positions = [
+                position
+                for position in positions
+                if keyword in str(self._records[position].get("name", "")).lower()
+            ]
+
+        return list(positions)
+
+    def query(
+        self,
+        positions: list = None,
+        filter: list = None,
+        filter_or: list = None,
+        fields: dict = None,
+    ) -> list:
+        """Positions of records matching the spaceone Query filter and filter_or
+
+        fields maps top-level keys that are not stored in the catalog to
+        functions computing them from a record (e.g. values added to the
+        response). eq and in conditions on indexed keys are answered from the
+        indexes, the other conditions are evaluated only on the candidates.
+        """
+
+        filter = filter or []
+        filter_or = filter_or or []
+        fields = fields or {}
+        get_value_fn = self._make_value_getter(fields)
+
+        matchers = []
+        for condition in filter:
+            indexed_positions = self._lookup_condition(condition, fields)
+            if indexed_positions is None:
+                matchers.append(make_matcher(condition, get_value_fn))
+            elif positions is None:
+                positions = sorted(indexed_positions)
+            else:
+                positions = [
+                    position for position in positions if position in indexed_positions
+                ]
+
+        or_matchers = [make_matcher(condition, get_value_fn) for condition in filter_or]
+
+        if positions is None:
+            positions = range(len(self._records))
+
+        results = []
+        for position in positions:
+            record = self._records[position]
+            if all(matcher(record) for matcher in matchers) and (
+                not or_matchers or any(matcher(record) for matcher in or_matchers)
+            ):
+                results.append(position)
+
+        return results
+
+    def sort(self, positions: list, sort: list, fields: dict = None) -> list:
+        """Positions ordered by all sort keys, in priority order"""
+
+        fields = fields or {}
+        get_value_fn = self._make_value_getter(fields)
+
+        sort_conditions = []
+        for sort_condition in sort:
+            if sort_key := sort_condition.get("key"):
+                root_key = sort_key.split(".", 1)[0]
+                if root_key not in self._keys and root_key not in fields:
+                    raise ERROR_SORT_KEY(sort_key=sort_key)
+
+                sort_conditions.append((sort_key, sort_condition.get("desc", False)))
+
+        # Stable sorts from the last key to the first give a multi-key ordering
+        positions = list(positions)
+        for sort_key, desc in reversed(sort_conditions):
+            try:
+                positions.sort(
+                    key=lambda position: self._sort_value(
+                        get_value_fn(self._records[position], sort_key)
+                    ),
+                    reverse=desc,
+                )
+            except Exception as e:
+                raise ERROR_SORT_KEY(sort_key=sort_key)
+
+        return positions
+
+    def seek(
+        self, positions: list, sort: list, cursor: dict, id_key: str, fields: dict = None
+    ) -> list:
+        """Positions after a keyset cursor, positions are sorted by sort and id_key"""
+
+        get_value_fn = self._make_value_getter(fields or {})
+        low, high = 0, len(positions)
+
+        while low < high:
+            middle = (low + high) // 2
+            record = self._records[positions[middle]]
+            if compare_keyset(record, cursor, sort, id_key, get_value_fn) > 0:
+                high = middle
+            else:
+                low = middle + 1
+
+        return positions[low:]
+
+    def rank(self, positions: list, keyword: str) -> list:
+        """Positions ordered by the relevance to keyword"""
+
+        if not self._search_index:
+            return positions
+
+        return self._search_index.rank(self._search_index.scores(keyword), positions)
+
+    @staticmethod
+    def page(positions: list, page: dict) -> list:
+        if limit := page.get("limit"):
+            start = page.get("start", 1) - 1
+            return positions[start : start + limit]
+        else:
+            return positions
+
+    def materialize(self, positions: list, only: list = None) -> list:
+        # Deep copies, so callers can change nested tags, labels and capability
+        if only:
+            return [
+                copy.deepcopy(project(self._records[position], only))
+                for position in positions
+            ]
+
+        return [copy.deepcopy(self._records[position]) for position in positions]
+
+    def _lookup_condition(self, condition: dict, fields: dict):
+        key = condition.get("key", condition.get("k"))
+        value = condition.get("value", condition.get("v"))
+        operator = condition.get("operator", condition.get("o"))
+
+        if key not in self._indexes or key in fields:
+            return None
+
+        try:
+            if operator == "eq" and not isinstance(value, list):
+                return set(self._indexes[key].get(value, ()))
+            elif operator == "in" and isinstance(value, list):
+                positions = set()
+                for item in value:
+                    positions.update(self._indexes[key].get(item, ()))
+                return positions
+        except TypeError:
+            # Unhashable values are evaluated record by record
+            return None
+
+        return None
+
+    @staticmethod
+    def _make_value_getter(fields: dict):
+        if not fields:
+            return get_value
+
+        def _get_value(record: dict, key: str):
+            root_key = key.split(".", 1)[0]
+            if root_key in fields:
+                return get_value({root_key: fields[root_key](record)}, key)
+
+            return get_value(record, key)
+
+        return _get_value
+
+    @staticmethod
+    def _sort_value(value):
+        return "" if value is MISSING or value is None else value
+
+    @staticmethod
+    def _fill_value(value):
+        return "" if value is None else value
@@ -0,0 +1,99 @@
+"""Precompiled snapshot of the managed resource YAML files
+
+The snapshot is built at image build time:
+
+    python -m spaceone.repository.lib.catalog_snapshot
+
+and is loaded with a single read at startup. It is used only while the
+content hash of the YAML files matches, otherwise the YAML files are parsed.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+
+from spaceone.core import utils
+
+__all__ = [
+    "MANAGED_PLUGIN_DIR",
+    "MANAGED_PLUGIN_SNAPSHOT_PATH",
+    "compute_source_hash",
+    "load_yaml_records",
+    "build_snapshot",
+    "load_records",
+]
+
+_LOGGER = logging.getLogger(__name__)
+_SNAPSHOT_VERSION = 1
+_MANAGED_RESOURCE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "managed_resource"
+)
+
+MANAGED_PLUGIN_DIR = os.path.join(_MANAGED_RESOURCE_DIR, "plugin")
+MANAGED_PLUGIN_SNAPSHOT_PATH = os.path.join(_MANAGED_RESOURCE_DIR, "plugin.snapshot")
+
+
+def _list_yaml_files(base_dir: str) -> list:
+    return sorted(
+        filename for filename in os.listdir(base_dir) if filename.endswith(".yaml")
+    )
+
+
+def compute_source_hash(base_dir: str) -> str:
+    source_hash = hashlib.sha256()
+
+    for filename in _list_yaml_files(base_dir):
+        source_hash.update(filename.encode("utf-8"))
+        with open(os.path.join(base_dir, filename), "rb") as f:
+            source_hash.update(f.read())
+
+    return source_hash.hexdigest()
+
+
+def load_yaml_records(base_dir: str) -> list:
+    records = []
+    for filename in _list_yaml_files(base_dir):
+        records.append(utils.load_yaml_from_file(os.path.join(base_dir, filename)))
+
+    return records
+
+
+def build_snapshot(base_dir: str, snapshot_path: str) -> str:
+    source_hash = compute_source_hash(base_dir)
+    snapshot = {
+        "version": _SNAPSHOT_VERSION,
+        "source_hash": source_hash,
+        "records": load_yaml_records(base_dir),
+    }
+
+    with open(snapshot_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return source_hash
+
+
+def load_records(base_dir: str, snapshot_path: str) -> list:
+    if os.path.exists(snapshot_path):
+        try:
+            with open(snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+
+            if (
+                snapshot.get("version") == _SNAPSHOT_VERSION
+                and snapshot.get("source_hash") == compute_source_hash(base_dir)
+            ):
+                return snapshot["records"]
+
+            _LOGGER.info(
+                f"[load_records] snapshot is outdated, load yaml files: {base_dir}"
+            )
+        except Exception as e:
+            _LOGGER.warning(f"[load_records] failed to load snapshot: {e}")
+
+    return load_yaml_records(base_dir)
+
+
+if __name__ == "__main__":
+    snapshot_hash = build_snapshot(MANAGED_PLUGIN_DIR, MANAGED_PLUGIN_SNAPSHOT_PATH)
+    print(f"{MANAGED_PLUGIN_SNAPSHOT_PATH} (source_hash = {snapshot_hash})")
@@ -0,0 +1,281 @@
+"""Cursor (keyset) pagination across repositories
+
+A next_token is an opaque, url-safe string holding the position of every
+repository: the sort values and id of the last row returned from it, or an
+offset for repositories that can only page by offset. The next page asks
+each repository for the rows after its position, so page N costs the same
+as page 1.
+"""
+
+import base64
+import copy
+import datetime
+import hashlib
+import json
+
+from bson import ObjectId
+from mongoengine.queryset.visitor import Q
+from spaceone.core.error import *
+
+from spaceone.repository.lib.merge import compare_values, merge_results
+from spaceone.repository.lib.query import MISSING, get_value
+
+__all__ = [
+    "CursorPage",
+    "encode_token",
+    "decode_token",
+    "make_cursor",
+    "make_keyset_filter",
+    "query_by_keyset",
+    "compare_keyset",
+]
+
+_TOKEN_VERSION = 1
+_DEFAULT_SORT = [{"key": "name"}]
+_DEFAULT_LIMIT = 100
+
+
+def _encode_value(value):
+    if isinstance(value, datetime.datetime):
+        return {"$date": value.isoformat()}
+    elif isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+
+    raise TypeError(f"{type(value)} is not serializable")
+
+
+def _decode_value(value: dict):
+    if "$date" in value:
+        return datetime.datetime.fromisoformat(value["$date"])
+    elif "$oid" in value:
+        return ObjectId(value["$oid"])
+
+    return value
+
+
+def encode_token(state: dict) -> str:
+    data = json.dumps(state, default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def decode_token(token: str) -> dict:
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        return json.loads(data, object_hook=_decode_value)
+    except Exception:
+        raise ERROR_INVALID_PARAMETER(key="next_token", reason="invalid token")
+
+
+def make_cursor(row: dict, sort: list, id_key: str) -> dict:
+    """Keyset position of a row: its sort values and id"""
+
+    values = [get_value(row, sort_condition["key"]) for sort_condition in sort]
+
+    return {
+        "values": [None if value is MISSING else value for value in values],
+        "id": row.get(id_key),
+    }
+
+
+def compare_keyset(
+    row: dict, cursor: dict, sort: list, id_key: str, get_value_fn=get_value
+) -> int:
+    """Order of a row relative to a keyset position (<0: before, >0: after)"""
+
+    for sort_condition, value in zip(sort, cursor["values"]):
+        result = compare_values(get_value_fn(row, sort_condition["key"]), value)
+        if result != 0:
+            return -result if sort_condition.get("desc", False) else result
+
+    return compare_values(get_value_fn(row, id_key), cursor["id"])
+
+
+def make_keyset_filter(sort: list, cursor: dict) -> Q:
+    """MongoDB condition of the rows after a keyset position
+
+    Rows are ordered by the sort keys and then by id, like MongoModel.query.
+    """
+
+    conditions = None
+    equals = Q()
+
+    for sort_condition, value in zip(sort, cursor["values"]):
+        field = sort_condition["key"].replace(".", "__")
+        after = equals & _make_after_condition(
+            field, value, sort_condition.get("desc", False)
+        )
+        conditions = after if conditions is None else conditions | after
+        equals = equals & Q(**{field: value})
+
+    after_id = equals & Q(id__gt=ObjectId(str(cursor["id"])))
+    return after_id if conditions is None else conditions | after_id
+
+
+def _make_after_condition(field: str, value, desc: bool) -> Q:
+    # null is the lowest value in MongoDB and comparison operators never match it
+    if value is None:
+        return Q(pk__in=[]) if desc else Q(**{f"{field}__ne": None})
+    elif desc:
+        return Q(**{f"{field}__lt": value}) | Q(**{field: None})
+    else:
+        return Q(**{f"{field}__gt": value})
+
+
+def query_by_keyset(model, query: dict, cursor: dict = None) -> tuple:
+    """Rows of a MongoModel after a keyset position, with the total count"""
+
+    sort = query.get("sort", [])
+    limit = query.get("page", {}).get("limit", _DEFAULT_LIMIT)
+
+    _filter = model._make_filter(
+        query.get("filter", []), query.get("filter_or", []), None
+    )
+    vos = model.objects.filter(_filter) if _filter is not None else model.objects.all()
+
+    try:
+        total_count = vos.count()
+
+        if cursor:
+            vos = vos.filter(make_keyset_filter(sort, cursor))
+
+        order_by = [
+            f"-{sort_condition['key']}"
+            if sort_condition.get("desc", False)
+            else sort_condition["key"]
+            for sort_condition in sort
+        ]
+        vos = vos.order_by(*order_by, "id")
+
+        if only := query.get("only"):
+            vos = vos.only(*only, *[sort_condition["key"] for sort_condition in sort])
+
+        return vos[:limit], total_count
+    except Exception as e:
+        raise ERROR_DB_QUERY(reason=e)
+
+
+class CursorPage(object):
+    """One page of a cursor listing across repositories
+
+    Tokens are bound to the query (filter, keyword and sort), so a token
+    can not be reused with another query.
+    """
+
+    def __init__(self, query: dict, next_token: str = None):
+        self.sort = query.get("sort") or _DEFAULT_SORT
+        self.limit = query.get("page", {}).get("limit") or _DEFAULT_LIMIT
+        self.query_hash = self._make_query_hash(query, self.sort)
+
+        self.repo_query = copy.deepcopy(query)
+        self.repo_query["sort"] = self.sort
+        self.repo_query["page"] = {"limit": self.limit}
+
+        if only := self.repo_query.get("only"):
+            for sort_condition in self.sort:
+                if sort_condition["key"] not in only:
+                    only.append(sort_condition["key"])
+
+        self._repositories = {}
+        if next_token:
+            state = decode_token(next_token)
+            if (
+                state.get("version") != _TOKEN_VERSION
+                or state.get("query_hash") != self.query_hash
+            ):
+                raise ERROR_INVALID_PARAMETER(
+                    key="next_token", reason="token does not match the query"
+                )
+
+            self._repositories = state.get("repositories", {})
+
+    def get_cursor(self, repository_id: str):
+        return self._repositories.get(repository_id, {}).get("cursor")
+
+    def is_done(self, repository_id: str) -> bool:
+        return self._repositories.get(repository_id, {}).get("done", False)
+
+    def merge(self, repos_info: list, responses: list, advance_cursor) -> tuple:
+        """
+        Args:
+            repos_info (list): repositories in merge order
+            responses (list): (results, total_count) of each repository, None if skipped
+            advance_cursor (callable): fn(repo_info, cursor, consumed_rows) -> cursor
+
+        Returns:
+            results (list), total_count (int), next_token (str, '' on the last page)
+        """
+
+        total_count = 0
+        results_list = []
+        for repo_info, response in zip(repos_info, responses):
+            repository_id = repo_info["repository_id"]
+            repository = self._repositories.get(repository_id, {})
+
+            if repository.get("done"):
+                total_count += repository.get("total_count", 0)
+                results_list.append([])
+            elif response is None:
+                results_list.append([])
+            else:
+                results, repo_total_count = response
+                repository["total_count"] = repo_total_count
+                total_count += repo_total_count
+                results_list.append(results)
+
+            self._repositories[repository_id] = repository
+
+        owners = {
+            id(row): index for index, results in enumerate(results_list) for row in results
+        }
+        page_results = merge_results(results_list, self.sort, {"limit": self.limit})
+
+        consumed_rows = [[] for _ in results_list]
+        for row in page_results:
+            consumed_rows[owners[id(row)]].append(row)
+
+        has_more = False
+        for repo_info, results, consumed, response in zip(
+            repos_info, results_list, consumed_rows, responses
+        ):
+            repository = self._repositories[repo_info["repository_id"]]
+            if repository.get("done"):
+                continue
+
+            if consumed:
+                repository["cursor"] = advance_cursor(
+                    repo_info, repository.get("cursor"), consumed
+                )
+
+            # A repository is done when it returned a short page and all of it was used
+            if response is not None and (
+                len(results) < self.limit and len(consumed) == len(results)
+            ):
+                repository["done"] = True
+            else:
+                has_more = True
+
+        next_token = ""
+        if has_more:
+            next_token = encode_token(
+                {
+                    "version": _TOKEN_VERSION,
+                    "query_hash": self.query_hash,
+                    "repositories": self._repositories,
+                }
+            )
+
+        return page_results, total_count, next_token
+
+    @staticmethod
+    def _make_query_hash(query: dict, sort: list) -> str:
+        data = json.dumps(
+            {
+                "filter": query.get("filter", []),
+                "filter_or": query.get("filter_or", []),
+                "keyword": query.get("keyword"),
+                "sort": sort,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed, wait
+
+from spaceone.core.transaction import (
+    create_transaction,
+    delete_transaction,
+    get_transaction,
+)
+
+__all__ = ["FanOut", "FanOutTimeout", "get_deadline"]
+
+_LOGGER = logging.getLogger(__name__)
+_CALL_DEADLINE = threading.local()
+
+
+class FanOutTimeout(Exception):
+    pass
+
+
+def get_deadline():
+    """time.monotonic() deadline of the fan-out call running in this thread, or None
+
+    Connectors use it to cut their requests off at the deadline, so a slow
+    upstream does not keep holding a worker after the caller gave up.
+    """
+
+    return getattr(_CALL_DEADLINE, "value", None)
+
+
+class FanOut(object):
+    """Run calls concurrently on a bounded thread pool
+
+    Transactions are thread-local, so every call runs in a copy of the
+    caller's transaction (same id and meta) that is removed afterwards.
+    Results are returned in the order of the calls; a call that does not
+    finish before the deadline gets a FanOutTimeout. A call that has not
+    started by then is cancelled. A running call can not be stopped and is
+    left to finish on its worker, so it should cut its own requests off at
+    get_deadline(). Fast calls that should never wait for a worker behind
+    slow ones are run inline on the calling thread.
+
+    hedge() sends a slow call once more and takes whichever finishes first,
+    which cuts the tail latency of idempotent remote requests.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "fan-out"):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def run(self, calls: list, timeout: float = None, inline: list = None) -> list:
+        """
+        Args:
+            calls (list): [(fn, args), ...]
+            timeout (float): seconds to wait for all calls
+            inline (list): indexes of the calls run on the calling thread,
+                while the other calls run on the pool
+
+        Returns:
+            [(result, error), ...] in the order of the calls
+        """
+
+        inline = set(inline or [])
+
+        # A single call without a deadline does not need another thread
+        if len(calls) == 1 and timeout is None:
+            inline = {0}
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        transaction = get_transaction()
+        futures = {}
+        for index, (fn, args) in enumerate(calls):
+            if index not in inline:
+                futures[index] = self._get_executor().submit(
+                    self._call_in_transaction, transaction, deadline, fn, args
+                )
+
+        # Inline calls run while the pool works on the others
+        inline_responses = {
+            index: self._call_inline(deadline, *calls[index]) for index in inline
+        }
+
+        responses = []
+        for index in range(len(calls)):
+            if index in inline_responses:
+                responses.append(inline_responses[index])
+                continue
+
+            future = futures[index]
+            try:
+                wait_timeout = (
+                    None if deadline is None else max(deadline - time.monotonic(), 0)
+                )
+                responses.append((future.result(timeout=wait_timeout), None))
+            except TimeoutError:
+                future.cancel()
+                responses.append((None, FanOutTimeout(f"timed out after {timeout}s")))
+            except Exception as e:
+                responses.append((None, e))
+
+        return responses
+
+    def hedge(self, fn, args: tuple, delay: float):
+        """Call fn and call it again if it has not finished after delay
+
+        Returns:
+            the result of the first call that succeeds; the error of the
+            last call if both fail
+        """
+
+        executor = self._get_executor()
+        transaction = get_transaction()
+        deadline = get_deadline()
+        futures = [
+            executor.submit(self._call_in_transaction, transaction, deadline, fn, args)
+        ]
+
+        done, _ = wait(futures, timeout=delay)
+        if not done and (deadline is None or time.monotonic() < deadline):
+            futures.append(
+                executor.submit(
+                    self._call_in_transaction, transaction, deadline, fn, args
+                )
+            )
+
+        error = None
+        for future in as_completed(futures):
+            try:
+                return future.result()
+            except Exception as e:
+                error = e
+
+        raise error
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix=self._thread_name_prefix,
+                )
+
+            return self._executor
+
+    @staticmethod
+    def _call_inline(deadline, fn, args) -> tuple:
+        previous_deadline = get_deadline()
+        _CALL_DEADLINE.value = deadline
+
+        try:
+            return fn(*args), None
+        except Exception as e:
+            return None, e
+        finally:
+            _CALL_DEADLINE.value = previous_deadline
+
+    @staticmethod
+    def _call_in_transaction(transaction, deadline, fn, args):
+        if deadline is not None and time.monotonic() >= deadline:
+            raise FanOutTimeout("deadline passed before the call started")
+
+        if transaction is not None:
+            create_transaction(
+                transaction.service,
+                transaction.resource,
+                transaction.verb,
+                transaction.id,
+                transaction.meta,
+                thread_id=str(threading.current_thread().ident),
+            )
+        _CALL_DEADLINE.value = deadline
+
+        try:
+            return fn(*args)
+        finally:
+            _CALL_DEADLINE.value = None
+            if transaction is not None:
+                delete_transaction()
@@ -0,0 +1,44 @@
+"""Generations of caches kept in the memory of each process
+
+A writer bumps the generation of a name after a change, and a process
+drops its entries built at another generation on the next read. The
+generation is kept in CACHES['default'], so a change through one replica
+is seen by every replica at once. Without a configured cache it is kept in
+the process, and other replicas only see the change when their entries
+expire.
+"""
+
+import uuid
+
+from spaceone.core import cache
+
+__all__ = ["get_generation", "bump_generation"]
+
+_GENERATION_CACHE_KEY_PREFIX = "repository:generation"
+
+# name : generation, when no cache is configured
+_LOCAL_GENERATIONS = {}
+
+
+def get_generation(name: str):
+    """Current generation of name, None until it is bumped"""
+
+    if cache.is_set():
+        return cache.get(_make_cache_key(name))
+
+    return _LOCAL_GENERATIONS.get(name)
+
+
+def bump_generation(name: str) -> str:
+    generation = uuid.uuid4().hex
+
+    if cache.is_set():
+        cache.set(_make_cache_key(name), generation)
+    else:
+        _LOCAL_GENERATIONS[name] = generation
+
+    return generation
+
+
+def _make_cache_key(name: str) -> str:
+    return f"{_GENERATION_CACHE_KEY_PREFIX}:{name}"
@@ -0,0 +1,143 @@
+"""Merge of sorted and paged results from several repositories
+
+Each repository is asked for the first start + limit - 1 rows in the
+query's sort order. The sorted streams are k-way merged with a heap and
+only the requested window is taken, so the result equals sorting and
+paging the union of all repositories.
+"""
+
+import copy
+import datetime
+import functools
+import heapq
+import itertools
+import numbers
+
+from spaceone.repository.lib.query import MISSING, get_value
+
+__all__ = [
+    "make_repository_query",
+    "merge_results",
+    "remove_added_keys",
+    "compare_values",
+]
+
+
+def make_repository_query(query: dict) -> dict:
+    repo_query = copy.deepcopy(query)
+
+    if limit := repo_query.get("page", {}).get("limit"):
+        start = repo_query["page"].get("start", 1)
+        repo_query["page"] = {"start": 1, "limit": start - 1 + limit}
+
+    # Sort keys are needed in the results to merge them
+    if only := repo_query.get("only"):
+        for sort_condition in repo_query.get("sort", []):
+            if (sort_key := sort_condition.get("key")) and sort_key not in only:
+                only.append(sort_key)
+
+    return repo_query
+
+
+def merge_results(results_list: list, sort: list = None, page: dict = None) -> list:
+    """Results of all repositories ordered by sort, then sliced by page
+
+    Without sort, results are concatenated in repository order. Equal rows
+    keep the repository order.
+    """
+
+    sort = [
+        (sort_condition["key"], sort_condition.get("desc", False))
+        for sort_condition in sort or []
+        if sort_condition.get("key")
+    ]
+
+    if sort:
+        merged = heapq.merge(
+            *results_list, key=functools.cmp_to_key(_make_compare(sort))
+        )
+    else:
+        merged = itertools.chain(*results_list)
+
+    page = page or {}
+    if limit := page.get("limit"):
+        start = page.get("start", 1) - 1
+        return list(itertools.islice(merged, start, start + limit))
+
+    return list(merged)
+
+
+def remove_added_keys(results: list, only: list, keys: list) -> list:
+    """Remove keys that were added to only to merge or page the results
+
+    Nothing is removed when only is empty, as every key was requested.
+    """
+
+    if only:
+        for key in keys:
+            if key not in only:
+                for result in results:
+                    result.pop(key, None)
+
+    return results
+
+
+def _type_order(value) -> int:
+    # Same relative order as MongoDB: null < numbers < strings < others
+    if value is MISSING or value is None:
+        return 0
+    elif isinstance(value, numbers.Number) and not isinstance(value, bool):
+        return 1
+    elif isinstance(value, str):
+        return 2
+    else:
+        return 3
+
+
+def _to_datetime(value):
+    if isinstance(value, datetime.datetime):
+        dt = value
+    elif isinstance(value, str):
+        try:
+            dt = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    # Naive datetimes of MongoDB are in UTC
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    return dt
+
+
+def compare_values(a, b) -> int:
+    # Remote repositories return datetimes as ISO strings
+    if isinstance(a, datetime.datetime) or isinstance(b, datetime.datetime):
+        a_datetime, b_datetime = _to_datetime(a), _to_datetime(b)
+        if a_datetime is not None and b_datetime is not None:
+            a, b = a_datetime, b_datetime
+
+    a_order, b_order = _type_order(a), _type_order(b)
+    if a_order != b_order:
+        return -1 if a_order < b_order else 1
+    elif a_order == 0:
+        return 0
+
+    try:
+        return (a > b) - (a < b)
+    except TypeError:
+        return (str(a) > str(b)) - (str(a) < str(b))
+
+
+def _make_compare(sort: list):
+    def _compare(a: dict, b: dict) -> int:
+        for sort_key, desc in sort:
+            result = compare_values(get_value(a, sort_key), get_value(b, sort_key))
+            if result != 0:
+                return -result if desc else result
+
+        return 0
+
+    return _compare
@@ -0,0 +1,232 @@
+"""In-memory evaluation of spaceone Query conditions
+
+Conditions use the same format and operators as the MongoModel queries
+({'k': key, 'v': value, 'o': operator}), so the managed catalog can answer
+the same filter, filter_or, sort and only as the local repository.
+"""
+
+import copy
+import datetime
+import re
+
+from spaceone.core import utils
+from spaceone.core.error import *
+
+__all__ = ["FILTER_OPERATORS", "MISSING", "get_value", "make_matcher", "project"]
+
+MISSING = object()
+
+
+def get_value(record: dict, key: str):
+    """Value of a (dotted) key, lists are traversed like in MongoDB"""
+
+    value = record
+    for sub_key in key.split("."):
+        if isinstance(value, dict):
+            value = value.get(sub_key, MISSING)
+        elif isinstance(value, list):
+            values = [get_value(item, sub_key) for item in value]
+            value = [item for item in values if item is not MISSING]
+        else:
+            return MISSING
+
+        if value is MISSING:
+            return MISSING
+
+    return value
+
+
+def _is_empty(value) -> bool:
+    # The catalog fills missing fields with "", which is treated as not existing
+    return value is MISSING or value is None or value == ""
+
+
+def _values(value) -> list:
+    if isinstance(value, list):
+        return value
+    elif _is_empty(value):
+        return []
+    else:
+        return [value]
+
+
+def _eq(value, target) -> bool:
+    if isinstance(value, list) and not isinstance(target, list):
+        return target in value
+    return value == target
+
+
+def _compare(compare):
+    def _matcher(value, target) -> bool:
+        for item in _values(value):
+            try:
+                if compare(item, target):
+                    return True
+            except TypeError:
+                continue
+        return False
+
+    return _matcher
+
+
+def _contain(value, target) -> bool:
+    target = str(target).lower()
+    return any(target in str(item).lower() for item in _values(value))
+
+
+def _match(value, target) -> bool:
+    return any(
+        isinstance(item, dict) and all(_eq(item.get(k), v) for k, v in target.items())
+        for item in _values(value)
+    )
+
+
+def _to_datetime(value):
+    if isinstance(value, datetime.datetime):
+        return value
+
+    try:
+        return utils.iso8601_to_datetime(value)
+    except ValueError:
+        return None
+
+
+def _make_datetime_compare(compare):
+    def _matcher(value, target) -> bool:
+        return _compare(compare)(
+            [_to_datetime(item) for item in _values(value)], target
+        )
+
+    return _matcher
+
+
+_OPERATORS = {
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+}
+
+FILTER_OPERATORS = {
+    # operator : (matcher, is_multiple)
+    "lt": (_compare(_OPERATORS["lt"]), False),
+    "lte": (_compare(_OPERATORS["lte"]), False),
+    "gt": (_compare(_OPERATORS["gt"]), False),
+    "gte": (_compare(_OPERATORS["gte"]), False),
+    "eq": (_eq, False),
+    "not": (lambda value, target: not _eq(value, target), False),
+    "exists": (lambda value, target: (not _is_empty(value)) == target, False),
+    "contain": (_contain, False),
+    "not_contain": (lambda value, target: not _contain(value, target), False),
+    "in": (lambda value, targets: any(_eq(value, t) for t in targets), True),
+    "not_in": (lambda value, targets: not any(_eq(value, t) for t in targets), True),
+    "contain_in": (
+        lambda value, targets: any(_contain(value, t) for t in targets),
+        True,
+    ),
+    "not_contain_in": (
+        lambda value, targets: not any(_contain(value, t) for t in targets),
+        True,
+    ),
+    "match": (_match, False),
+    "regex": (
+        lambda value, pattern: any(
+            pattern.search(str(item)) for item in _values(value)
+        ),
+        False,
+    ),
+    "regex_in": (
+        lambda value, patterns: any(
+            pattern.search(str(item)) for item in _values(value) for pattern in patterns
+        ),
+        True,
+    ),
+}
+
+for _operator in ["lt", "lte", "gt", "gte"]:
+    FILTER_OPERATORS[f"datetime_{_operator}"] = (
+        _make_datetime_compare(_OPERATORS[_operator]),
+        False,
+    )
+    FILTER_OPERATORS[f"timediff_{_operator}"] = (
+        _make_datetime_compare(_OPERATORS[_operator]),
+        False,
+    )
+
+
+def make_matcher(condition: dict, get_value_fn=get_value):
+    """Compile a query condition to a function of a record"""
+
+    key = condition.get("key", condition.get("k"))
+    value = condition.get("value", condition.get("v"))
+    operator = condition.get("operator", condition.get("o"))
+
+    if operator not in FILTER_OPERATORS:
+        raise ERROR_DB_QUERY(
+            reason=f"Filter operator is not supported. (operator = "
+            f"{FILTER_OPERATORS.keys()})"
+        )
+
+    if not key:
+        raise ERROR_DB_QUERY(
+            reason="Filter condition should have key, value and operator."
+        )
+
+    matcher, is_multiple = FILTER_OPERATORS[operator]
+
+    if is_multiple and not isinstance(value, list):
+        raise ERROR_OPERATOR_LIST_VALUE_TYPE(operator=operator, condition=condition)
+    elif not is_multiple and isinstance(value, list):
+        raise ERROR_OPERATOR_VALUE_TYPE(operator=operator, condition=condition)
+
+    # Operator values are converted once, not for every record
+    if operator == "exists" and not isinstance(value, bool):
+        raise ERROR_OPERATOR_BOOLEAN_TYPE(operator=operator, condition=condition)
+    elif operator == "match" and not isinstance(value, dict):
+        raise ERROR_OPERATOR_DICT_VALUE_TYPE(operator=operator, condition=condition)
+    elif operator == "regex":
+        value = _compile_regex(value)
+    elif operator == "regex_in":
+        value = [_compile_regex(pattern) for pattern in value]
+    elif operator.startswith("datetime_"):
+        if (value := _to_datetime(value)) is None:
+            raise ERROR_DB_QUERY(
+                reason=f"The value of {operator} operator is required ISO 8601 format."
+            )
+    elif operator.startswith("timediff_"):
+        try:
+            value = utils.parse_timediff_query(value)
+        except Exception:
+            raise ERROR_DB_QUERY(
+                reason=f"The value of {operator} operator is invalid. (value = {value})"
+            )
+
+    return lambda record: matcher(get_value_fn(record, key), value)
+
+
+def _compile_regex(pattern: str):
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ERROR_DB_QUERY(reason=f"Invalid regex pattern. ({pattern}: {e})")
+
+
+def project(record: dict, only: list) -> dict:
+    """Copy of record with only the given (dotted) keys"""
+
+    projected = {}
+    for key in only:
+        value = get_value(record, key)
+        if value is MISSING:
+            continue
+
+        sub_keys = key.split(".")
+        target = projected
+        for sub_key in sub_keys[:-1]:
+            target = target.setdefault(sub_key, {})
+            if not isinstance(target, dict):
+                break
+        else:
+            target[sub_keys[-1]] = copy.deepcopy(value)
+
+    return projected
@@ -0,0 +1,120 @@
+"""TTL cache of remote repository responses
+
+Responses are cached per repository, token and normalized query. When an entry
+expires and a revision function is given, the revision of the remote is
+checked first: if it did not change, the cached response is kept for
+another TTL without transferring it again.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from spaceone.repository.lib.single_flight import SingleFlight
+
+__all__ = ["ResponseCache", "make_cache_key"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def make_cache_key(repo_info: dict, method: str, query: dict) -> tuple:
+    # Tokens on one endpoint may see different resources; only a hash is kept
+    token_hash = hashlib.sha256(str(repo_info.get("token")).encode("utf-8")).hexdigest()
+
+    # Equal queries with a different key order share an entry
+    return (
+        repo_info["endpoint"],
+        repo_info["repository_id"],
+        token_hash,
+        method,
+        json.dumps(query, sort_keys=True, default=str),
+    )
+
+
+class _Entry(object):
+    def __init__(self, response, revision, expires_at: float):
+        self.response = response
+        self.revision = revision
+        self.expires_at = expires_at
+
+
+class ResponseCache(object):
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+    def get(
+        self,
+        key: tuple,
+        fetch_fn,
+        ttl: float,
+        max_size: int = 1000,
+        revision_fn=None,
+    ):
+        """
+        Args:
+            key (tuple): see make_cache_key
+            fetch_fn (callable): fn() -> response
+            ttl (float): seconds to serve a response without asking the remote
+            max_size (int): max number of entries
+            revision_fn (callable): fn() -> revision of the remote, optional
+
+        Returns:
+            response
+        """
+
+        if ttl <= 0:
+            return fetch_fn()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.time():
+            return entry.response
+
+        # Concurrent misses of the same key share one remote call
+        return self._single_flight.do(
+            key, self._refresh, key, entry, fetch_fn, ttl, max_size, revision_fn
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh(
+        self, key: tuple, entry: _Entry, fetch_fn, ttl: float, max_size: int, revision_fn
+    ):
+        revision = None
+        if revision_fn is not None:
+            try:
+                revision = revision_fn()
+            except Exception as e:
+                _LOGGER.warning(f"[_refresh] failed to check revision: {e}")
+
+        if entry is not None and revision is not None and revision == entry.revision:
+            entry.expires_at = time.time() + ttl
+            return entry.response
+
+        # The revision is read before the response, so a change in between
+        # is detected by the next check instead of being missed
+        response = fetch_fn()
+        self._set(key, _Entry(response, revision, time.time() + ttl), max_size)
+        return response
+
+    def _set(self, key: tuple, entry: _Entry, max_size: int) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= max_size:
+                now = time.time()
+                for expired_key in [
+                    k for k, e in self._entries.items() if e.expires_at <= now
+                ]:
+                    del self._entries[expired_key]
+
+                if len(self._entries) >= max_size:
+                    oldest_key = min(
+                        self._entries, key=lambda k: self._entries[k].expires_at
+                    )
+                    del self._entries[oldest_key]
+
+            self._entries[key] = entry
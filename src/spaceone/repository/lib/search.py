@@ -0,0 +1,155 @@
+"""Tokenized inverted index for plugin keyword search
+
+Text fields are split into lower-cased word tokens (any script). A keyword
+matches a document when every keyword token is a prefix of one of the
+document tokens, and documents are ranked by the weighted, idf scaled
+matches of each field. The keyword is also matched as a substring of the
+fields (e.g. "ws" finds "AWS"), like the name search the index replaced,
+and those matches are added with a lower weight.
+"""
+
+import bisect
+import math
+import re
+
+from spaceone.repository.lib.query import get_value
+
+__all__ = ["PLUGIN_SEARCH_FIELDS", "tokenize", "SearchIndex"]
+
+# field : weight
+PLUGIN_SEARCH_FIELDS = {
+    "name": 4.0,
+    "labels": 2.0,
+    "tags.description": 1.0,
+    "tags.long_description": 0.5,
+}
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_PREFIX_MATCH_WEIGHT = 0.5
+_SUBSTRING_MATCH_WEIGHT = 0.25
+
+
+def tokenize(text) -> list:
+    if isinstance(text, (list, tuple)):
+        return [token for item in text for token in tokenize(item)]
+    elif not isinstance(text, str):
+        return []
+
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _to_text(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(_to_text(item) for item in value)
+    elif not isinstance(value, str):
+        return ""
+
+    return value.lower()
+
+
+class SearchIndex(object):
+    def __init__(self, documents, fields: dict = None):
+        """
+        Args:
+            documents: iterable of (doc_id, record)
+            fields (dict): {'field': weight}, dotted keys are allowed
+        """
+
+        self._fields = fields or PLUGIN_SEARCH_FIELDS
+        self._postings = {}
+        self._order = {}
+
+        # doc_id : [(weight, lower-cased text), ...] for substring matches
+        self._texts = {}
+
+        for doc_id, record in documents:
+            self._order[doc_id] = len(self._order)
+            self._texts[doc_id] = []
+
+            for field, weight in self._fields.items():
+                value = get_value(record, field)
+                if text := _to_text(value):
+                    self._texts[doc_id].append((weight, text))
+
+                for token in tokenize(value):
+                    postings = self._postings.setdefault(token, {})
+                    postings[doc_id] = postings.get(doc_id, 0.0) + weight
+
+        self._vocabulary = sorted(self._postings.keys())
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def scores(self, keyword: str) -> dict:
+        """{doc_id: score} of the documents matching all keyword tokens or the substring"""
+
+        scores = self._score_tokens(keyword)
+        if keyword and keyword.strip():
+            substring_scores = self._score_substring(keyword.strip().lower())
+            for doc_id, score in substring_scores.items():
+                scores[doc_id] = max(scores.get(doc_id, 0.0), score)
+
+        return scores
+
+    def search(self, keyword: str) -> list:
+        """doc_ids of the matched documents, most relevant first"""
+
+        return self.rank(self.scores(keyword))
+
+    def rank(self, scores: dict, doc_ids=None) -> list:
+        if doc_ids is None:
+            doc_ids = scores.keys()
+
+        return sorted(
+            doc_ids,
+            key=lambda doc_id: (-scores.get(doc_id, 0.0), self._order.get(doc_id, 0)),
+        )
+
+    def _score_tokens(self, keyword: str) -> dict:
+        scores = None
+        for query_token in set(tokenize(keyword)):
+            token_scores = self._score_token(query_token)
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    doc_id: score + token_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in token_scores
+                }
+
+            if not scores:
+                return {}
+
+        return scores or {}
+
+    def _score_substring(self, keyword: str) -> dict:
+        scores = {}
+        for doc_id, texts in self._texts.items():
+            score = sum(weight for weight, text in texts if keyword in text)
+            if score > 0:
+                scores[doc_id] = score * _SUBSTRING_MATCH_WEIGHT
+
+        return scores
+
+    def _score_token(self, query_token: str) -> dict:
+        token_scores = {}
+        index = bisect.bisect_left(self._vocabulary, query_token)
+
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(
+            query_token
+        ):
+            token = self._vocabulary[index]
+            postings = self._postings[token]
+            idf = math.log(1.0 + len(self._order) / len(postings))
+
+            if token != query_token:
+                idf *= _PREFIX_MATCH_WEIGHT
+
+            for doc_id, weight in postings.items():
+                token_scores[doc_id] = max(token_scores.get(doc_id, 0.0), weight * idf)
+
+            index += 1
+
+        return token_scores
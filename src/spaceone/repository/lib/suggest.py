@@ -0,0 +1,104 @@
+"""Sorted-array prefix index for plugin type-ahead
+
+Every word start of plugin names, labels and providers is kept in a sorted
+list of lower-cased terms, so the suggestions of a prefix are the contiguous
+range found with two binary searches.
+"""
+
+import bisect
+import heapq
+
+__all__ = ["SuggestIndex", "rank_key"]
+
+_SUGGEST_TYPES = ["name", "label", "provider"]
+_TYPE_ORDER = {suggest_type: order for order, suggest_type in enumerate(_SUGGEST_TYPES)}
+
+
+def rank_key(prefix: str, suggestion: dict) -> tuple:
+    """Sort key of a suggestion, values starting with the prefix come first"""
+
+    value = suggestion["value"].lower()
+    return (
+        0 if value.startswith(prefix.lower()) else 1,
+        _TYPE_ORDER.get(suggestion["type"], len(_TYPE_ORDER)),
+        len(value),
+        value,
+    )
+
+
+class SuggestIndex(object):
+    def __init__(self, records):
+        """
+        Args:
+            records: iterable of plugin dicts (plugin_id, name, labels, provider, resource_type)
+        """
+
+        self._suggestions = []
+        self._resource_types = []
+        suggestion_map = {}
+
+        for record in records:
+            resource_type = record.get("resource_type") or ""
+            values = [("name", record.get("name"), record.get("plugin_id"))]
+            values += [("label", label, None) for label in record.get("labels") or []]
+            values.append(("provider", record.get("provider"), None))
+
+            for suggest_type, value, plugin_id in values:
+                if not value or not isinstance(value, str):
+                    continue
+
+                key = (suggest_type, value, plugin_id)
+                if key not in suggestion_map:
+                    suggestion = {"type": suggest_type, "value": value}
+                    if plugin_id:
+                        suggestion["plugin_id"] = plugin_id
+
+                    suggestion_map[key] = len(self._suggestions)
+                    self._suggestions.append(suggestion)
+                    self._resource_types.append(set())
+
+                self._resource_types[suggestion_map[key]].add(resource_type)
+
+        entries = []
+        for position, suggestion in enumerate(self._suggestions):
+            for term in self._make_terms(suggestion["value"]):
+                entries.append((term, position))
+
+        entries.sort()
+        self._terms = [term for term, position in entries]
+        self._positions = [position for term, position in entries]
+
+    def __len__(self) -> int:
+        return len(self._suggestions)
+
+    def suggest(self, prefix: str, limit: int = 10, resource_type: str = None) -> list:
+        prefix = (prefix or "").strip().lower()
+        if not prefix:
+            return []
+
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\uffff", lo=start)
+
+        positions = set()
+        for index in range(start, end):
+            position = self._positions[index]
+            if resource_type is None or resource_type in self._resource_types[position]:
+                positions.add(position)
+
+        suggestions = heapq.nsmallest(
+            limit,
+            (self._suggestions[position] for position in positions),
+            key=lambda suggestion: rank_key(prefix, suggestion),
+        )
+        return [dict(suggestion) for suggestion in suggestions]
+
+    @staticmethod
+    def _make_terms(value: str) -> set:
+        value = value.lower()
+        terms = {value}
+
+        for index in range(1, len(value)):
+            if not value[index - 1].isalnum() and value[index].isalnum():
+                terms.add(value[index:])
+
+        return terms
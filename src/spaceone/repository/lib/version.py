@@ -0,0 +1,80 @@
+import functools
+
+from packaging.specifiers import SpecifierSet, InvalidSpecifier
+from packaging.version import Version, InvalidVersion
+
+from spaceone.repository.error import *
+
+__all__ = ["parse_version", "sort_tags", "resolve_version"]
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_version(tag: str):
+    """Parse an image tag as a PEP 440 version, None if it is not a version"""
+
+    try:
+        return Version(tag)
+    except (InvalidVersion, TypeError):
+        return None
+
+
+def sort_tags(tags: list) -> list:
+    """Sort image tags, newest version first
+
+    Version tags come first in descending order. Other tags (latest, sha-...)
+    follow in name order, so the result is deterministic for any tag list.
+    """
+
+    version_tags = []
+    other_tags = []
+
+    for tag in tags:
+        version = parse_version(tag)
+        if version is None:
+            other_tags.append(tag)
+        else:
+            version_tags.append((version, tag))
+
+    version_tags.sort(reverse=True)
+    other_tags.sort()
+
+    return [tag for _, tag in version_tags] + other_tags
+
+
+def resolve_version(tags: list, constraint: str = "latest") -> str:
+    """Pick one tag for a version constraint
+
+    constraint:
+        latest: the highest version, including pre-releases
+        latest-stable: the highest version without pre/dev releases
+        specifier set (>=1.12,<2): the highest version that satisfies it
+        exact tag (1.12.0, sha-...): the tag itself if it exists
+    """
+
+    constraint = (constraint or "latest").strip()
+    version_tags = [tag for tag in sort_tags(tags) if parse_version(tag) is not None]
+
+    if constraint == "latest":
+        matched_tags = version_tags
+    elif constraint == "latest-stable":
+        matched_tags = [
+            tag
+            for tag in version_tags
+            if not (parse_version(tag).is_prerelease or parse_version(tag).is_devrelease)
+        ]
+    elif constraint in tags:
+        matched_tags = [constraint]
+    else:
+        try:
+            specifier_set = SpecifierSet(constraint)
+        except InvalidSpecifier:
+            raise ERROR_INVALID_VERSION_CONSTRAINT(constraint=constraint)
+
+        matched_tags = [
+            tag for tag in version_tags if specifier_set.contains(parse_version(tag))
+        ]
+
+    if len(matched_tags) == 0:
+        raise ERROR_NO_MATCHING_VERSION(constraint=constraint)
+
+    return matched_tags[0]
@@ -1,4 +1,5 @@
 from spaceone.repository.manager.identity_manager import *
+from spaceone.repository.manager.registry_manager import *
 from spaceone.repository.manager.repository_manager import *
 from spaceone.repository.manager.repository_manager.local_repository_manager import (
     LocalRepositoryManager,
@@ -12,6 +13,9 @@ from spaceone.repository.manager.plugin_manager.local_plugin_manager import (
 from spaceone.repository.manager.plugin_manager.remote_plugin_manager import (
     RemotePluginManager,
 )
+from spaceone.repository.manager.plugin_location_manager import PluginLocationManager
+from spaceone.repository.manager.not_found_cache_manager import NotFoundCacheManager
+from spaceone.repository.manager.remote_mirror_manager import RemoteMirrorManager
 
 from spaceone.repository.manager.dashboard_template_manager.local_dashboard_template_manager import (
     LocalDashboardTemplateManager,
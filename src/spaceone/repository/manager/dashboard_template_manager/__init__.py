@@ -31,6 +31,17 @@ class DashboardTemplateManager(BaseManager):
     def list_templates(self, repo_info: dict, query: dict, params: dict):
         pass
 
+    def list_templates_by_cursor(
+        self, repo_info: dict, query: dict, params: dict, cursor: dict = None
+    ):
+        # Repositories without keyset support continue from an offset
+        offset = (cursor or {}).get("offset", 0)
+        query["page"] = {"start": offset + 1, "limit": query["page"]["limit"]}
+        return self.list_templates(repo_info, query, params)
+
+    def advance_cursor(self, cursor: dict, sort: list, consumed_rows: list) -> dict:
+        return {"offset": (cursor or {}).get("offset", 0) + len(consumed_rows)}
+
     @staticmethod
     def change_response(
             info: dict, repo_info: dict = None
@@ -1,7 +1,9 @@
 import logging
 
+from spaceone.repository.lib.cursor import make_cursor, query_by_keyset
 from spaceone.repository.model.dashboard_template_model import DashboardTemplate
 from spaceone.repository.manager.dashboard_template_manager import DashboardTemplateManager
+from spaceone.repository.manager.not_found_cache_manager import NotFoundCacheManager
 from spaceone.repository.manager.repository_manager import RepositoryManager
 
 __all__ = ["LocalDashboardTemplateManager"]
@@ -21,6 +23,9 @@ class LocalDashboardTemplateManager(DashboardTemplateManager):
 
         template_vo: DashboardTemplate = self.template_model.create(params)
         self.transaction.add_rollback(_rollback, template_vo)
+        NotFoundCacheManager.delete_not_found(
+            "DashboardTemplate", template_vo.template_id
+        )
 
         template_info = template_vo.to_dict()
         return self.change_response(template_info, self.repo_info)
@@ -62,14 +67,7 @@ class LocalDashboardTemplateManager(DashboardTemplateManager):
         return self.change_response(template_info, self.repo_info)
 
     def list_templates(self, repos_info: dict, query: dict, params: dict):
-        domain_id = params.get("domain_id")
-        keyword = query.get("keyword")
-        query_filter = query.get("filter", [])
-        query_filter_or = query.get("filter_or", [])
-        query["filter"] = self._append_domain_filter(query_filter, domain_id)
-        query["filter_or"] = self._append_keyword_filter(query_filter_or, keyword)
-        if "repository" in query.get("only", []):
-            query["only"].remove("repository")
+        self._make_template_query(query, params)
 
         template_vos, total_count = self.template_model.query(**query)
         results = []
@@ -79,6 +77,32 @@ class LocalDashboardTemplateManager(DashboardTemplateManager):
 
         return results, total_count
 
+    def list_templates_by_cursor(
+        self, repo_info: dict, query: dict, params: dict, cursor: dict = None
+    ):
+        self._make_template_query(query, params)
+        template_vos, total_count = query_by_keyset(self.template_model, query, cursor)
+
+        results = []
+        for template_vo in template_vos:
+            template_info = template_vo.to_dict()
+            results.append(self.change_response(template_info, repo_info))
+
+        return results, total_count
+
+    def advance_cursor(self, cursor: dict, sort: list, consumed_rows: list) -> dict:
+        return make_cursor(consumed_rows[-1], sort, "_id")
+
+    def _make_template_query(self, query: dict, params: dict) -> None:
+        domain_id = params.get("domain_id")
+        keyword = query.get("keyword")
+        query_filter = query.get("filter", [])
+        query_filter_or = query.get("filter_or", [])
+        query["filter"] = self._append_domain_filter(query_filter, domain_id)
+        query["filter_or"] = self._append_keyword_filter(query_filter_or, keyword)
+        if "repository" in query.get("only", []):
+            query["only"].remove("repository")
+
     @staticmethod
     def _append_domain_filter(query_filter, domain_id=None):
         if domain_id:
@@ -1,52 +1,144 @@
 import logging
 
-from spaceone.core.connector.space_connector import SpaceConnector
-
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE
+
+from spaceone.repository.connector.remote_repository_connector import (
+    RemoteRepositoryConnector,
+)
+from spaceone.repository.lib.response_cache import ResponseCache, make_cache_key
+from spaceone.repository.manager.remote_mirror_manager import RemoteMirrorManager
 from spaceone.repository.manager.dashboard_template_manager import DashboardTemplateManager
 
 __all__ = ["RemoteDashboardTemplateManager"]
 
 _LOGGER = logging.getLogger(__name__)
+_RESPONSE_CACHE = ResponseCache()
+_UNREACHABLE_ERROR_CODES = ["ERROR_GRPC_CONNECTION", "ERROR_GRPC_TIMEOUT"]
 
 
 class RemoteDashboardTemplateManager(DashboardTemplateManager):
     def get_template(self, repo_info: dict, template_id: str, domain_id: str = None):
+        mirror_mgr: RemoteMirrorManager = self.locator.get_manager("RemoteMirrorManager")
+        repository_id = repo_info["repository_id"]
+
+        if mirror_mgr.is_fresh(repository_id, "DashboardTemplate"):
+            template_info = mirror_mgr.get_resource(
+                repository_id, "DashboardTemplate", template_id
+            )
+            if template_info:
+                return self.change_response(template_info, repo_info)
+
+        try:
+            template_info = self._get_remote_template(repo_info, template_id)
+        except ERROR_BASE as e:
+            # Serve an outdated mirror while the remote repository is unreachable
+            if e.error_code in _UNREACHABLE_ERROR_CODES:
+                template_info = mirror_mgr.get_resource(
+                    repository_id, "DashboardTemplate", template_id
+                )
+                if template_info:
+                    return self.change_response(template_info, repo_info)
+            raise e
+
+        return self.change_response(template_info, repo_info)
+
+    def _get_remote_template(self, repo_info: dict, template_id: str) -> dict:
         endpoint = repo_info["endpoint"]
         market_place_token = repo_info["token"]
 
-        remote_repo_conn: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token=market_place_token
+        remote_repo_conn: RemoteRepositoryConnector = self.locator.get_connector(
+            "RemoteRepositoryConnector", endpoint=endpoint, token=market_place_token
         )
 
-        template_info: dict = remote_repo_conn.dispatch(
+        return remote_repo_conn.dispatch(
             "DashboardTemplate.get", {"template_id": template_id, "repository_id": "repo-local"}
         )
 
-        return self.change_response(template_info, repo_info)
-
     def list_templates(self, repo_info: dict, query: dict, params: dict):
+        mirror_mgr: RemoteMirrorManager = self.locator.get_manager("RemoteMirrorManager")
+        repository_id = repo_info["repository_id"]
+
+        # Keyword search is ranked by the remote repository
+        use_mirror = not query.get("keyword")
+
+        if use_mirror and mirror_mgr.is_fresh(repository_id, "DashboardTemplate"):
+            return self._list_mirror_templates(mirror_mgr, repo_info, query)
+
         try:
             endpoint = repo_info["endpoint"]
             market_place_token = repo_info["token"]
 
             _LOGGER.debug(f"[list_templates] Remote Repository endpoint: {endpoint}")
 
-            remote_repo_conn: SpaceConnector = self.locator.get_connector(
-                SpaceConnector, endpoint=endpoint, token=market_place_token
+            remote_repo_conn: RemoteRepositoryConnector = self.locator.get_connector(
+                "RemoteRepositoryConnector", endpoint=endpoint, token=market_place_token
             )
 
-            response = remote_repo_conn.dispatch(
-                "DashboardTemplate.list", {"query": query, "repository_id": "repo-local"}
-            )
-
-            plugins_info = response.get("results", [])
+            response = self._list_with_cache(remote_repo_conn, repo_info, query)
+            templates_info = response.get("results", [])
             total_count = response.get("total_count", 0)
             results = []
 
-            for template_info in plugins_info:
-                results.append(self.change_response(template_info, repo_info))
+            for template_info in templates_info:
+                results.append(self.change_response(dict(template_info), repo_info))
 
             return results, total_count
         except Exception as e:
             _LOGGER.error(f"[list_templates] {e}")
+
+            # Serve an outdated mirror while the remote repository is unreachable
+            if use_mirror and mirror_mgr.has_mirror(repository_id, "DashboardTemplate"):
+                return self._list_mirror_templates(mirror_mgr, repo_info, query)
+
             return [], 0
+
+    def _list_mirror_templates(
+        self, mirror_mgr: RemoteMirrorManager, repo_info: dict, query: dict
+    ) -> tuple:
+        templates_info, total_count = mirror_mgr.list_resources(
+            repo_info["repository_id"], "DashboardTemplate", query
+        )
+        return [
+            self.change_response(template_info, repo_info) for template_info in templates_info
+        ], total_count
+
+    @staticmethod
+    def _list_with_cache(
+        remote_repo_conn: RemoteRepositoryConnector, repo_info: dict, query: dict
+    ) -> dict:
+        def _fetch():
+            return remote_repo_conn.dispatch(
+                "DashboardTemplate.list",
+                {"query": query, "repository_id": "repo-local"},
+                hedge=True,
+            )
+
+        def _get_revision():
+            # Count and last update of the remote catalog, one row transferred
+            response = remote_repo_conn.dispatch(
+                "DashboardTemplate.list",
+                {
+                    "query": {
+                        "sort": [{"key": "updated_at", "desc": True}],
+                        "page": {"limit": 1},
+                        "only": ["updated_at"],
+                    },
+                    "repository_id": "repo-local",
+                },
+            )
+            results = response.get("results", [])
+            return (
+                response.get("total_count", 0),
+                results[0].get("updated_at") if results else None,
+            )
+
+        return _RESPONSE_CACHE.get(
+            make_cache_key(repo_info, "DashboardTemplate.list", query),
+            _fetch,
+            config.get_global("REMOTE_REPOSITORY_CACHE_TTL", 60),
+            config.get_global("REMOTE_REPOSITORY_CACHE_SIZE", 1000),
+            _get_revision
+            if config.get_global("REMOTE_REPOSITORY_REVISION_CHECK", False)
+            else None,
+        )
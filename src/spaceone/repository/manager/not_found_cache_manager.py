@@ -0,0 +1,125 @@
+import logging
+import threading
+import time
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE
+from spaceone.core.manager import BaseManager
+
+from spaceone.repository.lib.generation import bump_generation, get_generation
+
+__all__ = ["NotFoundCacheManager", "is_not_found_error"]
+
+_LOGGER = logging.getLogger(__name__)
+_NOT_FOUND_ERROR_CODES = [
+    "ERROR_NOT_FOUND",
+    "ERROR_NO_PLUGIN",
+    "ERROR_NO_DASHBOARD_TEMPLATE",
+]
+
+# (resource_type, resource_id, repository_id, domain_id) : (expires_at, generation)
+_NOT_FOUND = {}
+_NOT_FOUND_LOCK = threading.Lock()
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """Errors that prove a repository does not have the resource"""
+
+    if not isinstance(error, ERROR_BASE):
+        return False
+
+    # Remote repositories return the error code in the message
+    return error.error_code in _NOT_FOUND_ERROR_CODES or any(
+        error_code in str(error.message) for error_code in _NOT_FOUND_ERROR_CODES
+    )
+
+
+class NotFoundCacheManager(BaseManager):
+    """Short-lived in-process cache of IDs that no repository has
+
+    Misses are cached only when every repository answered "not found", so
+    a timeout never hides an existing resource. Entries live for
+    NOT_FOUND_CACHE_TTL seconds. Registering a resource bumps its
+    generation in CACHES['default'], which drops its entries on every
+    replica; without a configured cache, other processes see the resource
+    at the latest after the TTL.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.not_found_cache_ttl = config.get_global("NOT_FOUND_CACHE_TTL", 30)
+        self.not_found_cache_size = config.get_global("NOT_FOUND_CACHE_SIZE", 10000)
+
+        # (resource_type, resource_id) : generations read by is_not_found
+        self._generations = {}
+
+    def is_not_found(
+        self, resource_type: str, resource_id: str, repo_id: str, domain_id: str
+    ) -> bool:
+        if self.not_found_cache_ttl <= 0:
+            return False
+
+        generation = self._get_generation(resource_type, resource_id, refresh=True)
+        key = (resource_type, resource_id, repo_id, domain_id)
+        expires_at, not_found_generation = _NOT_FOUND.get(key, (0, None))
+        return expires_at > time.time() and not_found_generation == generation
+
+    def set_not_found(
+        self, resource_type: str, resource_id: str, repo_id: str, domain_id: str
+    ) -> None:
+        if self.not_found_cache_ttl <= 0:
+            return
+
+        now = time.time()
+        with _NOT_FOUND_LOCK:
+            if len(_NOT_FOUND) >= self.not_found_cache_size:
+                self._evict(now)
+
+            # A resource registered during the lookup bumped the generation,
+            # so the miss is recorded at the generation read before it
+            _NOT_FOUND[(resource_type, resource_id, repo_id, domain_id)] = (
+                now + self.not_found_cache_ttl,
+                self._get_generation(resource_type, resource_id),
+            )
+
+    @staticmethod
+    def delete_not_found(resource_type: str, resource_id: str = None) -> None:
+        # Other replicas drop their entries when they see the new generation
+        bump_generation(_make_generation_name(resource_type, resource_id))
+
+        with _NOT_FOUND_LOCK:
+            for key in list(_NOT_FOUND):
+                if key[0] == resource_type and resource_id in (None, key[1]):
+                    del _NOT_FOUND[key]
+
+    def _get_generation(
+        self, resource_type: str, resource_id: str, refresh: bool = False
+    ) -> tuple:
+        # Deleting all IDs of a type bumps the generation of the type
+        key = (resource_type, resource_id)
+        if refresh or key not in self._generations:
+            self._generations[key] = (
+                get_generation(_make_generation_name(resource_type)),
+                get_generation(_make_generation_name(resource_type, resource_id)),
+            )
+
+        return self._generations[key]
+
+    @staticmethod
+    def _evict(now: float) -> None:
+        expired_keys = [
+            key for key, (expires_at, _) in _NOT_FOUND.items() if expires_at <= now
+        ]
+        for key in expired_keys:
+            del _NOT_FOUND[key]
+
+        # Many distinct unknown IDs: keep the cache bounded
+        if not expired_keys:
+            _NOT_FOUND.clear()
+
+
+def _make_generation_name(resource_type: str, resource_id: str = None) -> str:
+    if resource_id is None:
+        return f"not-found:{resource_type}"
+
+    return f"not-found:{resource_type}:{resource_id}"
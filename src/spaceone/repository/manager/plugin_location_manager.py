@@ -0,0 +1,137 @@
+import logging
+import threading
+import time
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+
+from spaceone.repository.lib.generation import bump_generation, get_generation
+from spaceone.repository.manager.not_found_cache_manager import is_not_found_error
+
+__all__ = ["PluginLocationManager"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# (plugin_id, domain_id) : {'repository_id': (str, expires_at), 'missing': {repository_id: expires_at},
+#                          'generation': str}
+_LOCATIONS = {}
+_LOCATION_GENERATION_NAME = "plugin-location"
+_UNREAD = object()
+_LOCATIONS_LOCK = threading.Lock()
+
+
+class PluginLocationManager(BaseManager):
+    """Cached plugin_id -> repository_id locations
+
+    Repositories that own a plugin are tried first and repositories known
+    not to have it are skipped. The managed catalog is always asked
+    directly, since its lookups are in-memory and follow catalog reloads.
+    Locations are kept in each process and dropped on every replica when a
+    local plugin changes, through a generation in CACHES['default'].
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.location_ttl = config.get_global("PLUGIN_LOCATION_CACHE_TTL", 300)
+        self.missing_ttl = config.get_global("PLUGIN_LOCATION_MISSING_TTL", 60)
+        self._generation = _UNREAD
+        self._managed_plugin_mgr = None
+
+    def sort_repositories(
+        self, repos_info: list, plugin_id: str, domain_id: str = None
+    ) -> list:
+        """Repositories to probe for a plugin, the owning repository first"""
+
+        # Probe results are recorded at the generation read before probing,
+        # so a plugin registered in the meantime is never marked missing
+        self._generation = get_generation(_LOCATION_GENERATION_NAME)
+
+        location = self._get_location(plugin_id, domain_id, self._generation)
+        owner_repos_info = []
+        other_repos_info = []
+
+        for repo_info in repos_info:
+            repository_id = repo_info["repository_id"]
+
+            if repo_info["repository_type"] == "MANAGED":
+                if self._get_managed_plugin_manager().has_plugin(plugin_id):
+                    owner_repos_info.append(repo_info)
+            elif repository_id == location["repository_id"]:
+                owner_repos_info.append(repo_info)
+            elif repository_id not in location["missing"]:
+                other_repos_info.append(repo_info)
+
+        return owner_repos_info + other_repos_info
+
+    def set_location(self, plugin_id: str, domain_id: str, repository_id: str) -> None:
+        with _LOCATIONS_LOCK:
+            location = self._get_location_entry(plugin_id, domain_id)
+            location["repository_id"] = (
+                repository_id,
+                time.time() + self.location_ttl,
+            )
+            location["missing"].pop(repository_id, None)
+
+    def set_missing(self, plugin_id: str, domain_id: str, repository_id: str) -> None:
+        with _LOCATIONS_LOCK:
+            location = self._get_location_entry(plugin_id, domain_id)
+            location["missing"][repository_id] = time.time() + self.missing_ttl
+
+            if location.get("repository_id", (None,))[0] == repository_id:
+                del location["repository_id"]
+
+    @staticmethod
+    def delete_location(plugin_id: str, domain_id: str = None) -> None:
+        # Other replicas drop their locations when they see the new generation
+        bump_generation(_LOCATION_GENERATION_NAME)
+
+        with _LOCATIONS_LOCK:
+            _LOCATIONS.pop((plugin_id, domain_id), None)
+
+            # Lookups without a domain may have seen plugins of any domain
+            _LOCATIONS.pop((plugin_id, None), None)
+
+    @staticmethod
+    def is_not_found(error: Exception) -> bool:
+        """Errors that prove a repository does not have the plugin"""
+
+        return is_not_found_error(error)
+
+    def _get_managed_plugin_manager(self):
+        if self._managed_plugin_mgr is None:
+            self._managed_plugin_mgr = self.locator.get_manager("ManagedPluginManager")
+
+        return self._managed_plugin_mgr
+
+    def _get_location_entry(self, plugin_id: str, domain_id: str) -> dict:
+        if self._generation is _UNREAD:
+            self._generation = get_generation(_LOCATION_GENERATION_NAME)
+
+        location = _LOCATIONS.get((plugin_id, domain_id))
+        if location is None or location["generation"] != self._generation:
+            location = {"missing": {}, "generation": self._generation}
+            _LOCATIONS[(plugin_id, domain_id)] = location
+
+        return location
+
+    @staticmethod
+    def _get_location(plugin_id: str, domain_id: str, generation: str) -> dict:
+        now = time.time()
+
+        with _LOCATIONS_LOCK:
+            location = _LOCATIONS.get((plugin_id, domain_id))
+            if location is None or location["generation"] != generation:
+                location = {"missing": {}}
+
+            repository_id, expires_at = location.get("repository_id", (None, 0))
+
+            return {
+                "repository_id": repository_id if expires_at > now else None,
+                "missing": {
+                    missing_repository_id
+                    for missing_repository_id, missing_expires_at in location[
+                        "missing"
+                    ].items()
+                    if missing_expires_at > now
+                },
+            }
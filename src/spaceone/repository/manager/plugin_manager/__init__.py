@@ -8,6 +8,9 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PluginManager(BaseManager):
+    # Set when list_plugins returned outdated results instead of failing
+    partial = False
+
     def create_plugin(self, params):
         pass
 
@@ -35,6 +38,20 @@ class PluginManager(BaseManager):
     def get_plugin_versions(self, repo_info: dict, plugin_id, domain_id):
         pass
 
+    def suggest_plugins(self, repo_info: dict, prefix: str, limit: int, params: dict):
+        return []
+
+    def list_plugins_by_cursor(
+        self, repo_info: dict, query: dict, params: dict, cursor: dict = None
+    ):
+        # Repositories without keyset support continue from an offset
+        offset = (cursor or {}).get("offset", 0)
+        query["page"] = {"start": offset + 1, "limit": query["page"]["limit"]}
+        return self.list_plugins(repo_info, query, params)
+
+    def advance_cursor(self, cursor: dict, sort: list, consumed_rows: list) -> dict:
+        return {"offset": (cursor or {}).get("offset", 0) + len(consumed_rows)}
+
     @staticmethod
     def change_response(
             info: dict, repo_info: dict = None
@@ -1,35 +1,49 @@
 import logging
+import threading
+import time
 
 from spaceone.core import config
 from spaceone.repository.error import *
+from spaceone.repository.lib.cursor import make_cursor, query_by_keyset
+from spaceone.repository.lib.generation import bump_generation, get_generation
+from spaceone.repository.lib.search import PLUGIN_SEARCH_FIELDS, SearchIndex
+from spaceone.repository.lib.suggest import SuggestIndex
 from spaceone.repository.model.plugin_model import Plugin
 from spaceone.repository.manager.plugin_manager import PluginManager
+from spaceone.repository.manager.not_found_cache_manager import NotFoundCacheManager
+from spaceone.repository.manager.plugin_location_manager import PluginLocationManager
+from spaceone.repository.manager.registry_manager import RegistryManager
 from spaceone.repository.manager.repository_manager import RepositoryManager
 
 __all__ = ["LocalPluginManager"]
 
 _LOGGER = logging.getLogger(__name__)
-_REGISTRY_CONNECTOR_MAP = {
-    "DOCKER_HUB": "DockerHubConnector",
-    "AWS_PRIVATE_ECR": "AWSPrivateECRConnector",
-    "HARBOR": "HarborConnector",
-    "GITHUB": "GithubContainerRegistryConnector",
-    "GCP_PRIVATE_GCR": "GCPPrivateGCRConnector"
-}
+
+# domain_id : (SearchIndex, SuggestIndex, generation, built_at)
+# Per process, rebuilt when a change on any replica bumps the generation of the domain
+_SEARCH_INDEXES = {}
+_SEARCH_INDEX_LOCK = threading.Lock()
 
 
 class LocalPluginManager(PluginManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.plugin_model: Plugin = self.locator.get_model("Plugin")
+        self.registry_mgr: RegistryManager = self.locator.get_manager("RegistryManager")
         self.repo_info = RepositoryManager.get_repositories(repository_type="LOCAL")[0]
+        self.search_index_ttl = config.get_global("LOCAL_PLUGIN_SEARCH_INDEX_TTL", 60)
 
     def create_plugin(self, params: dict):
         def _rollback(vo: Plugin):
             vo.delete()
+            self.delete_search_index(vo.domain_id)
+            PluginLocationManager.delete_location(vo.plugin_id, vo.domain_id)
 
         plugin_vo: Plugin = self.plugin_model.create(params)
         self.transaction.add_rollback(_rollback, plugin_vo)
+        self.delete_search_index(plugin_vo.domain_id)
+        PluginLocationManager.delete_location(plugin_vo.plugin_id, plugin_vo.domain_id)
+        NotFoundCacheManager.delete_not_found("Plugin", plugin_vo.plugin_id)
 
         versions = self.get_plugin_versions(
             self.repo_info, plugin_vo.plugin_id, plugin_vo.domain_id
@@ -63,15 +77,20 @@ class LocalPluginManager(PluginManager):
                 f'[ROLLBACK] Revert Plugin Data : {old_data["name"]} ({old_data["plugin_id"]})'
             )
             plugin_vo.update(old_data)
+            self.delete_search_index(plugin_vo.domain_id)
 
         self.transaction.add_rollback(_rollback, plugin_vo.to_dict())
         plugin_vo = plugin_vo.update(params)
+        self.delete_search_index(plugin_vo.domain_id)
         plugin_info = plugin_vo.to_dict()
         return self.change_response(plugin_info, self.repo_info)
 
     def delete_plugin(self, plugin_id, domain_id):
         plugin_vo = self.plugin_model.get(plugin_id=plugin_id, domain_id=domain_id)
+        self.registry_mgr.delete_tags_cache(plugin_vo.registry_type, plugin_vo.image)
         plugin_vo.delete()
+        self.delete_search_index(domain_id)
+        PluginLocationManager.delete_location(plugin_id, domain_id)
 
     def get_plugin(self, repo_info: dict, plugin_id, domain_id: str):
         plugin_vo = self.plugin_model.get(plugin_id=plugin_id, domain_id=domain_id)
@@ -80,16 +99,15 @@ class LocalPluginManager(PluginManager):
         return self.change_response(plugin_info, self.repo_info)
 
     def list_plugins(self, repos_info: dict, query: dict, params: dict):
-        domain_id = params.get("domain_id")
         keyword = query.get("keyword")
-        query_filter = query.get("filter", [])
-        query_filter_or = query.get("filter_or", [])
-        query["filter"] = self._append_domain_filter(query_filter, domain_id)
-        query["filter_or"] = self._append_keyword_filter(query_filter_or, keyword)
-        if "repository" in query.get("only", []):
-            query["only"].remove("repository")
+        scores = self._make_plugin_query(query, params)
+
+        # Without sort, keyword results are ordered by relevance and paged here
+        if keyword and not query.get("sort"):
+            plugin_vos, total_count = self._list_plugins_by_relevance(query, scores)
+        else:
+            plugin_vos, total_count = self.plugin_model.query(**query)
 
-        plugin_vos, total_count = self.plugin_model.query(**query)
         results = []
         for plugin_vo in plugin_vos:
             plugin_info = plugin_vo.to_dict()
@@ -97,24 +115,142 @@ class LocalPluginManager(PluginManager):
 
         return results, total_count
 
-    def get_plugin_versions(self, repo_info: dict, plugin_id: str, domain_id: str):
-        plugin_vo = self.plugin_model.get(plugin_id=plugin_id, domain_id=domain_id)
+    def list_plugins_by_cursor(
+        self, repo_info: dict, query: dict, params: dict, cursor: dict = None
+    ):
+        self._make_plugin_query(query, params)
+        plugin_vos, total_count = query_by_keyset(self.plugin_model, query, cursor)
+
+        results = []
+        for plugin_vo in plugin_vos:
+            plugin_info = plugin_vo.to_dict()
+            results.append(self.change_response(plugin_info, repo_info))
+
+        return results, total_count
+
+    def advance_cursor(self, cursor: dict, sort: list, consumed_rows: list) -> dict:
+        return make_cursor(consumed_rows[-1], sort, "_id")
+
+    def _make_plugin_query(self, query: dict, params: dict) -> dict:
+        domain_id = params.get("domain_id")
+        keyword = query.pop("keyword", None)
+        query_filter = query.get("filter", [])
+        query["filter"] = self._append_domain_filter(query_filter, domain_id)
+        if "repository" in query.get("only", []):
+            query["only"].remove("repository")
+
+        scores = {}
+        if keyword:
+            # Keyword matches are resolved to plugin_ids by the search index
+            search_index = self.get_search_index(domain_id)
+            scores = search_index.scores(keyword)
+            query["filter"].append(
+                {"k": "plugin_id", "v": list(scores.keys()), "o": "in"}
+            )
+
+        return scores
+
+    def suggest_plugins(self, repo_info: dict, prefix: str, limit: int, params: dict):
+        search_index, suggest_index = self._get_indexes(params.get("domain_id"))
+        return suggest_index.suggest(prefix, limit, params.get("resource_type"))
 
-        registry_url = (
-            config.get_global("REGISTRY_INFO", {})
-            .get(plugin_vo.registry_type)
-            .get("url")
+    def get_search_index(self, domain_id: str = None) -> SearchIndex:
+        search_index, suggest_index = self._get_indexes(domain_id)
+        return search_index
+
+    @staticmethod
+    def delete_search_index(domain_id: str = None) -> None:
+        # Indexes without a domain filter contain plugins of every domain
+        for index_domain_id in {domain_id, None}:
+            bump_generation(_make_search_index_name(index_domain_id))
+
+            with _SEARCH_INDEX_LOCK:
+                _SEARCH_INDEXES.pop(index_domain_id, None)
+
+    def _get_indexes(self, domain_id: str = None) -> tuple:
+        # Read before the scan, so a change during the build is not missed
+        generation = get_generation(_make_search_index_name(domain_id))
+
+        with _SEARCH_INDEX_LOCK:
+            if domain_id in _SEARCH_INDEXES:
+                search_index, suggest_index, built_generation, built_at = (
+                    _SEARCH_INDEXES[domain_id]
+                )
+                if (
+                    built_generation == generation
+                    and time.time() - built_at < self.search_index_ttl
+                ):
+                    return search_index, suggest_index
+
+        search_index, suggest_index = self._build_indexes(domain_id)
+
+        with _SEARCH_INDEX_LOCK:
+            _SEARCH_INDEXES[domain_id] = (
+                search_index,
+                suggest_index,
+                generation,
+                time.time(),
+            )
+
+        return search_index, suggest_index
+
+    def _build_indexes(self, domain_id: str = None) -> tuple:
+        query_filter = self._append_domain_filter([], domain_id)
+        plugin_vos, total_count = self.plugin_model.query(
+            filter=query_filter,
+            only=["plugin_id", "name", "labels", "tags", "provider", "resource_type"],
         )
-        registry_connector = _REGISTRY_CONNECTOR_MAP[plugin_vo.registry_type]
-
-        try:
-            connector = self.locator.get_connector(registry_connector)
-            tags = connector.get_tags(registry_url, plugin_vo.image)
-        except Exception as e:
-            _LOGGER.error(f"[get_plugin_versions] get_tags error: {e}", exc_info=True)
-            raise e
-        else:
-            return tags
+
+        records = [
+            {
+                "plugin_id": plugin_vo.plugin_id,
+                "name": plugin_vo.name,
+                "labels": plugin_vo.labels,
+                "tags": plugin_vo.tags,
+                "provider": plugin_vo.provider,
+                "resource_type": plugin_vo.resource_type,
+            }
+            for plugin_vo in plugin_vos
+        ]
+
+        search_index = SearchIndex(
+            ((record["plugin_id"], record) for record in records), PLUGIN_SEARCH_FIELDS
+        )
+        return search_index, SuggestIndex(records)
+
+    def _list_plugins_by_relevance(self, query: dict, scores: dict) -> tuple:
+        # Only plugin_ids are loaded to rank all matches, then the plugins of the page
+        page = query.pop("page", None)
+        plugin_id_vos, total_count = self.plugin_model.query(
+            **{**query, "only": ["plugin_id"]}
+        )
+        ids = [
+            plugin_id_vo.id
+            for plugin_id_vo in self._rank_plugin_vos(scores, list(plugin_id_vos), page)
+        ]
+
+        if not ids:
+            return [], total_count
+
+        query["filter"].append({"k": "id", "v": ids, "o": "in"})
+        plugin_vos, _ = self.plugin_model.query(**query)
+        plugin_vos = sorted(plugin_vos, key=lambda plugin_vo: ids.index(plugin_vo.id))
+        return plugin_vos, total_count
+
+    @staticmethod
+    def _rank_plugin_vos(scores: dict, plugin_vos: list, page: dict = None) -> list:
+        # Stable sort, so equally relevant plugins keep the model ordering
+        plugin_vos.sort(key=lambda plugin_vo: -scores.get(plugin_vo.plugin_id, 0.0))
+
+        if page and (limit := page.get("limit")):
+            start = page.get("start", 1) - 1
+            plugin_vos = plugin_vos[start : start + limit]
+
+        return plugin_vos
+
+    def get_plugin_versions(self, repo_info: dict, plugin_id: str, domain_id: str):
+        plugin_vo = self.plugin_model.get(plugin_id=plugin_id, domain_id=domain_id)
+        return self.registry_mgr.get_tags(plugin_vo.registry_type, plugin_vo.image)
 
     @staticmethod
     def _append_domain_filter(query_filter, domain_id=None):
@@ -123,9 +259,6 @@ class LocalPluginManager(PluginManager):
 
         return query_filter
 
-    @staticmethod
-    def _append_keyword_filter(query_filter_or, keyword):
-        if keyword:
-            query_filter_or.append({"k": "name", "v": keyword, "o": "contain"})
 
-        return query_filter_or
+def _make_search_index_name(domain_id: str = None) -> str:
+    return f"local-plugin-search:{domain_id}"
@@ -1,31 +1,112 @@
 import logging
 import os
-import copy
-import pandas as pd
-import re
+import threading
+import time
 
-from spaceone.core import utils, config
+from spaceone.core import config
 from spaceone.repository.error import *
+from spaceone.repository.lib.catalog import Catalog
+from spaceone.repository.lib.cursor import make_cursor
+from spaceone.repository.lib import catalog_snapshot
+from spaceone.repository.lib.query import project
+from spaceone.repository.lib.search import PLUGIN_SEARCH_FIELDS
+from spaceone.repository.lib.suggest import SuggestIndex
+from spaceone.repository.manager.not_found_cache_manager import NotFoundCacheManager
 from spaceone.repository.manager.plugin_manager import PluginManager
+from spaceone.repository.manager.registry_manager import RegistryManager
 from spaceone.repository.manager.repository_manager import RepositoryManager
 
 __all__ = ["ManagedPluginManager"]
 
 _LOGGER = logging.getLogger(__name__)
-_REGISTRY_CONNECTOR_MAP = {
-    "DOCKER_HUB": "DockerHubConnector",
-    "AWS_PRIVATE_ECR": "AWSPrivateECRConnector",
-    "HARBOR": "HarborConnector",
-    "GCP_PRIVATE_GCR": "GCPPrivateGCRConnector"
-}
-_BASE_DIR = os.path.join(os.path.dirname(__file__), "../../managed_resource/plugin/")
-_MANAGED_PLUGINS = []
-
-for filename in os.listdir(_BASE_DIR):
-    if filename.endswith(".yaml"):
-        file_path = os.path.join(_BASE_DIR, filename)
-        plugin_info = utils.load_yaml_from_file(file_path)
-        _MANAGED_PLUGINS.append(plugin_info)
+_INDEX_KEYS = ["plugin_id", "name", "resource_type", "provider"]
+
+
+def _load_managed_plugin_catalog(generation: int = 0) -> Catalog:
+    managed_plugins = catalog_snapshot.load_records(
+        catalog_snapshot.MANAGED_PLUGIN_DIR,
+        catalog_snapshot.MANAGED_PLUGIN_SNAPSHOT_PATH,
+    )
+    return Catalog(
+        managed_plugins,
+        index_keys=_INDEX_KEYS,
+        generation=generation,
+        search_fields=PLUGIN_SEARCH_FIELDS,
+    )
+
+
+def _get_source_signature() -> tuple:
+    base_dir = catalog_snapshot.MANAGED_PLUGIN_DIR
+    signature = []
+    for filename in sorted(os.listdir(base_dir)):
+        if filename.endswith(".yaml"):
+            stat = os.stat(os.path.join(base_dir, filename))
+            signature.append((filename, stat.st_mtime_ns, stat.st_size))
+
+    return tuple(signature)
+
+
+_MANAGED_PLUGIN_CATALOG = _load_managed_plugin_catalog()
+_CATALOG_RELOAD_LOCK = threading.Lock()
+_CATALOG_SOURCE_SIGNATURE = _get_source_signature()
+_CATALOG_WATCHER = None
+
+# (catalog generation, SuggestIndex)
+_SUGGEST_INDEX = (None, None)
+
+
+def get_managed_plugin_catalog() -> Catalog:
+    return _MANAGED_PLUGIN_CATALOG
+
+
+def reload_managed_plugin_catalog() -> Catalog:
+    """Rebuild the catalog from managed_resource/plugin and swap it in
+
+    The new catalog is built aside and replaced with a single assignment,
+    so requests keep using a consistent catalog while it is rebuilt.
+    """
+
+    global _MANAGED_PLUGIN_CATALOG, _CATALOG_SOURCE_SIGNATURE
+
+    with _CATALOG_RELOAD_LOCK:
+        source_signature = _get_source_signature()
+        catalog = _load_managed_plugin_catalog(_MANAGED_PLUGIN_CATALOG.generation + 1)
+
+        _MANAGED_PLUGIN_CATALOG = catalog
+        _CATALOG_SOURCE_SIGNATURE = source_signature
+        NotFoundCacheManager.delete_not_found("Plugin")
+
+        _LOGGER.info(
+            f"[reload_managed_plugin_catalog] {len(catalog)} managed plugins "
+            f"(generation = {catalog.generation})"
+        )
+        return catalog
+
+
+def start_managed_plugin_watcher(interval: int) -> None:
+    global _CATALOG_WATCHER
+
+    with _CATALOG_RELOAD_LOCK:
+        if _CATALOG_WATCHER is None:
+            _CATALOG_WATCHER = threading.Thread(
+                target=_watch_managed_plugins,
+                args=(interval,),
+                name="managed-plugin-watcher",
+                daemon=True,
+            )
+            _CATALOG_WATCHER.start()
+
+
+def _watch_managed_plugins(interval: int) -> None:
+    # mtime polling keeps the watcher free of platform specific dependencies
+    while True:
+        time.sleep(interval)
+
+        try:
+            if _get_source_signature() != _CATALOG_SOURCE_SIGNATURE:
+                reload_managed_plugin_catalog()
+        except Exception as e:
+            _LOGGER.error(f"[_watch_managed_plugins] failed to reload catalog: {e}")
 
 
 class ManagedPluginManager(PluginManager):
@@ -38,130 +119,150 @@ class ManagedPluginManager(PluginManager):
         self.managed_plugin_image_prefix = config.get_global(
             "MANAGED_PLUGIN_IMAGE_PREFIX", "cloudforet"
         )
-        self.managed_plugin_df = self._load_managed_plugins()
+        self.managed_plugin_catalog: Catalog = get_managed_plugin_catalog()
+
+        if reload_interval := config.get_global("MANAGED_PLUGIN_RELOAD_INTERVAL", 0):
+            start_managed_plugin_watcher(reload_interval)
+
+        self.registry_mgr: RegistryManager = self.locator.get_manager("RegistryManager")
 
     def get_plugin(self, repo_info: dict, plugin_id: str, domain_id: str):
-        managed_plugin_df = self._filter_managed_plugins(plugin_id)
+        positions = self.managed_plugin_catalog.lookup("plugin_id", plugin_id)
 
-        if len(managed_plugin_df) == 0:
+        if len(positions) == 0:
             raise ERROR_NOT_FOUND(key="plugin_id", value=plugin_id)
 
-        managed_plugins_info = managed_plugin_df.to_dict("records")
+        managed_plugins_info = self.managed_plugin_catalog.materialize(positions[:1])
 
         return self.change_managed_plugin_info(
             managed_plugins_info[0], repo_info, domain_id
         )
 
+    def has_plugin(self, plugin_id: str) -> bool:
+        return len(self.managed_plugin_catalog.lookup("plugin_id", plugin_id)) > 0
+
     def list_plugins(self, repo_info: dict, query: dict, params: dict):
-        plugin_id = params.get("plugin_id")
-        name = params.get("name")
-        resource_type = params.get("resource_type")
-        provider = params.get("provider")
         domain_id = params.get("domain_id")
         sort = query.get("sort", [])
         page = query.get("page", {})
         keyword = query.get("keyword")
+        fields = self._make_response_fields(repo_info, domain_id)
+
+        positions = self._filter_positions(query, params, fields)
 
-        managed_plugin_df = self._filter_managed_plugins(
-            plugin_id, name, resource_type, provider, keyword
+        if keyword and not sort:
+            positions = self.managed_plugin_catalog.rank(positions, keyword)
+        else:
+            positions = self.managed_plugin_catalog.sort(positions, sort, fields=fields)
+
+        total_count = len(positions)
+        positions = self.managed_plugin_catalog.page(positions, page)
+
+        results = self._make_results(
+            positions, query.get("only", []), repo_info, domain_id
         )
-        managed_plugin_df = self._sort_managed_plugins(managed_plugin_df, sort)
-        total_count = len(managed_plugin_df)
-        managed_plugin_df = self._page_managed_plugins(managed_plugin_df, page)
+        return results, total_count
 
-        results = []
-        for managed_plugin_info in managed_plugin_df.to_dict("records"):
-            results.append(
-                self.change_managed_plugin_info(
-                    managed_plugin_info, repo_info, domain_id
-                )
+    def list_plugins_by_cursor(
+        self, repo_info: dict, query: dict, params: dict, cursor: dict = None
+    ):
+        domain_id = params.get("domain_id")
+        sort = query["sort"] + [{"key": "plugin_id"}]
+        fields = self._make_response_fields(repo_info, domain_id)
+
+        positions = self._filter_positions(query, params, fields)
+        total_count = len(positions)
+        positions = self.managed_plugin_catalog.sort(positions, sort, fields=fields)
+
+        if cursor:
+            positions = self.managed_plugin_catalog.seek(
+                positions, query["sort"], cursor, "plugin_id", fields=fields
             )
 
+        positions = positions[: query["page"]["limit"]]
+
+        # plugin_id is the tie-breaker of the cursor, the service removes it when not requested
+        only = list(query.get("only", []))
+        if only and "plugin_id" not in only:
+            only.append("plugin_id")
+
+        results = self._make_results(positions, only, repo_info, domain_id)
         return results, total_count
 
-    def get_plugin_versions(self, repo_info: dict, plugin_id: str, domain_id: str):
-        managed_plugin_info = self.get_plugin(repo_info, plugin_id, domain_id)
-        registry_type = managed_plugin_info["registry_type"]
-        image = managed_plugin_info["image"]
+    def advance_cursor(self, cursor: dict, sort: list, consumed_rows: list) -> dict:
+        return make_cursor(consumed_rows[-1], sort, "plugin_id")
 
-        registry_url = (
-            config.get_global("REGISTRY_INFO", {}).get(registry_type).get("url")
+    def _filter_positions(self, query: dict, params: dict, fields: dict) -> list:
+        positions = self.managed_plugin_catalog.filter(
+            keyword=query.get("keyword"),
+            plugin_id=params.get("plugin_id"),
+            name=params.get("name"),
+            resource_type=params.get("resource_type"),
+            provider=params.get("provider"),
+        )
+        return self.managed_plugin_catalog.query(
+            positions,
+            filter=query.get("filter", []),
+            filter_or=query.get("filter_or", []),
+            fields=fields,
         )
-        registry_connector = _REGISTRY_CONNECTOR_MAP[registry_type]
 
-        try:
-            connector = self.locator.get_connector(registry_connector)
-            tags = connector.get_tags(registry_url, image)
-        except Exception as e:
-            _LOGGER.error(f"[get_plugin_versions] get_tags error: {e}", exc_info=True)
-            raise e
-        else:
-            return tags
+    def _make_results(
+        self, positions: list, only: list, repo_info: dict, domain_id: str
+    ) -> list:
+        results = []
+        for managed_plugin_info in self.managed_plugin_catalog.materialize(
+            positions, only=only
+        ):
+            managed_plugin_info = self.change_managed_plugin_info(
+                managed_plugin_info, repo_info, domain_id
+            )
 
-    @staticmethod
-    def _load_managed_plugins():
-        managed_plugin_df = pd.DataFrame(copy.deepcopy(_MANAGED_PLUGINS))
-        return managed_plugin_df.fillna("")
+            if only:
+                # registry_type is always required to make the response
+                managed_plugin_info = project(
+                    managed_plugin_info, only + ["registry_type"]
+                )
 
-    def _filter_managed_plugins(
-        self, plugin_id=None, name=None, resource_type=None, provider=None, keyword=None
-    ):
-        managed_plugin_df = copy.deepcopy(self.managed_plugin_df)
-
-        if plugin_id:
-            managed_plugin_df = managed_plugin_df[
-                managed_plugin_df["plugin_id"] == plugin_id
-            ]
-
-        if name:
-            managed_plugin_df = managed_plugin_df[managed_plugin_df["name"] == name]
-
-        if resource_type:
-            managed_plugin_df = managed_plugin_df[
-                managed_plugin_df["resource_type"] == resource_type
-            ]
-
-        if provider:
-            managed_plugin_df = managed_plugin_df[
-                managed_plugin_df["provider"] == provider
-            ]
-
-        if keyword:
-            managed_plugin_df = managed_plugin_df[
-                managed_plugin_df["name"].str.contains(keyword, flags=re.IGNORECASE)
-            ]
-
-        return managed_plugin_df
-
-    @staticmethod
-    def _sort_managed_plugins(managed_plugin_df: pd.DataFrame, sort: list):
-        for sort_condition in sort:
-            if sort_key := sort_condition.get("key"):
-                desc = sort_condition.get("desc", False)
-                try:
-                    return managed_plugin_df.sort_values(
-                        by=sort_key, ascending=not desc
-                    )
-                except Exception as e:
-                    raise ERROR_SORT_KEY(sort_key=sort_key)
-        else:
-            return managed_plugin_df
+            results.append(managed_plugin_info)
 
-    @staticmethod
-    def _page_managed_plugins(managed_plugin_df: pd.DataFrame, page: dict):
-        if limit := page.get("limit"):
-            start = page.get("start", 1) - 1
-            return managed_plugin_df[start : start + limit]
-        else:
-            return managed_plugin_df
+        return results
+
+    def suggest_plugins(self, repo_info: dict, prefix: str, limit: int, params: dict):
+        suggest_index = self._get_suggest_index()
+        return suggest_index.suggest(prefix, limit, params.get("resource_type"))
+
+    def _get_suggest_index(self) -> SuggestIndex:
+        global _SUGGEST_INDEX
+
+        catalog = self.managed_plugin_catalog
+        generation, suggest_index = _SUGGEST_INDEX
+
+        # Rebuilt once per catalog generation
+        if generation != catalog.generation or suggest_index is None:
+            suggest_index = SuggestIndex(
+                catalog.get_record(position) for position in range(len(catalog))
+            )
+            _SUGGEST_INDEX = (catalog.generation, suggest_index)
+
+        return suggest_index
+
+    def get_catalog_generation(self) -> int:
+        return self.managed_plugin_catalog.generation
+
+    def get_plugin_versions(self, repo_info: dict, plugin_id: str, domain_id: str):
+        managed_plugin_info = self.get_plugin(repo_info, plugin_id, domain_id)
+        registry_type = managed_plugin_info["registry_type"]
+        image = managed_plugin_info["image"]
+
+        return self.registry_mgr.get_tags(registry_type, image)
 
     def change_managed_plugin_info(self, plugin_info: dict, repo_info: dict, domain_id):
         plugin_info["state"] = "ENABLED"
         plugin_info["registry_type"] = self.managed_registry_type
         plugin_info["registry_config"] = self.managed_registry_config
-        plugin_info[
-            "image"
-        ] = f"{self.managed_plugin_image_prefix}/{plugin_info['image']}"
+        if "image" in plugin_info:
+            plugin_info["image"] = self._get_image(plugin_info)
 
         if repo_info:
             plugin_info["repository_info"] = {
@@ -174,3 +275,28 @@ class ManagedPluginManager(PluginManager):
             plugin_info["domain_id"] = domain_id
 
         return plugin_info
+
+    def _get_image(self, plugin_info: dict) -> str:
+        return f"{self.managed_plugin_image_prefix}/{plugin_info['image']}"
+
+    def _make_response_fields(self, repo_info: dict, domain_id: str) -> dict:
+        # Fields added by change_managed_plugin_info, so that they can be queried
+        fields = {
+            "state": lambda plugin_info: "ENABLED",
+            "registry_type": lambda plugin_info: self.managed_registry_type,
+            "registry_config": lambda plugin_info: self.managed_registry_config,
+            "image": self._get_image,
+        }
+
+        if repo_info:
+            repository_info = {
+                "repository_id": repo_info["repository_id"],
+                "name": repo_info["name"],
+                "repository_type": repo_info["repository_type"],
+            }
+            fields["repository_info"] = lambda plugin_info: repository_info
+
+        if domain_id:
+            fields["domain_id"] = lambda plugin_info: domain_id
+
+        return fields
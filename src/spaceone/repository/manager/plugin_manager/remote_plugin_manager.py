@@ -1,62 +1,112 @@
 import logging
 
-from spaceone.core.connector.space_connector import SpaceConnector
-
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE
+
+from spaceone.repository.connector.remote_repository_connector import (
+    RemoteRepositoryConnector,
+)
+from spaceone.repository.lib.response_cache import ResponseCache, make_cache_key
+from spaceone.repository.manager.remote_mirror_manager import RemoteMirrorManager
 from spaceone.repository.manager.plugin_manager import PluginManager
 
 __all__ = ["RemotePluginManager"]
 
 _LOGGER = logging.getLogger(__name__)
+_RESPONSE_CACHE = ResponseCache()
+_UNREACHABLE_ERROR_CODES = ["ERROR_GRPC_CONNECTION", "ERROR_GRPC_TIMEOUT"]
 
 
 class RemotePluginManager(PluginManager):
     def get_plugin(self, repo_info: dict, plugin_id: str, domain_id: str = None):
+        mirror_mgr: RemoteMirrorManager = self.locator.get_manager("RemoteMirrorManager")
+        repository_id = repo_info["repository_id"]
+
+        if mirror_mgr.is_fresh(repository_id, "Plugin"):
+            plugin_info = mirror_mgr.get_resource(repository_id, "Plugin", plugin_id)
+            if plugin_info:
+                return self.change_response(plugin_info, repo_info)
+
+        try:
+            plugin_info = self._get_remote_plugin(repo_info, plugin_id)
+        except ERROR_BASE as e:
+            # Serve an outdated mirror while the remote repository is unreachable
+            if e.error_code in _UNREACHABLE_ERROR_CODES:
+                plugin_info = mirror_mgr.get_resource(repository_id, "Plugin", plugin_id)
+                if plugin_info:
+                    return self.change_response(plugin_info, repo_info)
+            raise e
+
+        return self.change_response(plugin_info, repo_info)
+
+    def _get_remote_plugin(self, repo_info: dict, plugin_id: str) -> dict:
         endpoint = repo_info["endpoint"]
         market_place_token = repo_info["token"]
 
-        remote_repo_conn: SpaceConnector = self.locator.get_connector(
-            SpaceConnector, endpoint=endpoint, token=market_place_token
+        remote_repo_conn: RemoteRepositoryConnector = self.locator.get_connector(
+            "RemoteRepositoryConnector", endpoint=endpoint, token=market_place_token
         )
 
-        plugin_info: dict = remote_repo_conn.dispatch(
+        return remote_repo_conn.dispatch(
             "Plugin.get", {"plugin_id": plugin_id, "repository_id": "repo-local"}
         )
 
-        return self.change_response(plugin_info, repo_info)
-
     def list_plugins(self, repo_info: dict, query: dict, params: dict):
+        mirror_mgr: RemoteMirrorManager = self.locator.get_manager("RemoteMirrorManager")
+        repository_id = repo_info["repository_id"]
+
+        # Keyword search is ranked by the remote repository
+        use_mirror = not query.get("keyword")
+
+        if use_mirror and mirror_mgr.is_fresh(repository_id, "Plugin"):
+            return self._list_mirror_plugins(mirror_mgr, repo_info, query)
+
         try:
             endpoint = repo_info["endpoint"]
             market_place_token = repo_info["token"]
 
             _LOGGER.debug(f"[list_plugins] Remote Repository endpoint: {endpoint}")
 
-            remote_repo_conn: SpaceConnector = self.locator.get_connector(
-                SpaceConnector, endpoint=endpoint, token=market_place_token
-            )
-
-            response = remote_repo_conn.dispatch(
-                "Plugin.list", {"query": query, "repository_id": "repo-local"}
+            remote_repo_conn: RemoteRepositoryConnector = self.locator.get_connector(
+                "RemoteRepositoryConnector", endpoint=endpoint, token=market_place_token
             )
 
+            response = self._list_with_cache(remote_repo_conn, repo_info, query)
             plugins_info = response.get("results", [])
             total_count = response.get("total_count", 0)
             results = []
 
             for plugin_info in plugins_info:
-                results.append(self.change_response(plugin_info, repo_info))
+                results.append(self.change_response(dict(plugin_info), repo_info))
 
             return results, total_count
         except Exception as e:
             _LOGGER.error(f"[list_plugins] {e}")
-            return [], 0
+
+            # Serve an outdated mirror while the remote repository is unreachable
+            if use_mirror and mirror_mgr.has_mirror(repository_id, "Plugin"):
+                self.partial = True
+                return self._list_mirror_plugins(mirror_mgr, repo_info, query)
+
+            # The caller reports the repository as skipped
+            raise e
+
+    def _list_mirror_plugins(
+        self, mirror_mgr: RemoteMirrorManager, repo_info: dict, query: dict
+    ) -> tuple:
+        plugins_info, total_count = mirror_mgr.list_resources(
+            repo_info["repository_id"], "Plugin", query
+        )
+        return [
+            self.change_response(plugin_info, repo_info) for plugin_info in plugins_info
+        ], total_count
 
     def get_plugin_versions(self, repo_info: dict, plugin_id: str, domain_id: str):
         endpoint = repo_info["endpoint"]
         market_place_token = repo_info["token"]
 
-        remote_repo_conn: SpaceConnector = self.locator.get_connector(
-            SpaceConnector, endpoint=endpoint, token=market_place_token
+        remote_repo_conn: RemoteRepositoryConnector = self.locator.get_connector(
+            "RemoteRepositoryConnector", endpoint=endpoint, token=market_place_token
         )
         response = remote_repo_conn.dispatch(
             "Plugin.get_versions",
@@ -69,3 +119,43 @@ class RemotePluginManager(PluginManager):
         _LOGGER.debug(f"[get_plugin_version] total version count: {total_count}")
 
         return versions
+
+    @staticmethod
+    def _list_with_cache(
+        remote_repo_conn: RemoteRepositoryConnector, repo_info: dict, query: dict
+    ) -> dict:
+        def _fetch():
+            return remote_repo_conn.dispatch(
+                "Plugin.list",
+                {"query": query, "repository_id": "repo-local"},
+                hedge=True,
+            )
+
+        def _get_revision():
+            # Count and last update of the remote catalog, one row transferred
+            response = remote_repo_conn.dispatch(
+                "Plugin.list",
+                {
+                    "query": {
+                        "sort": [{"key": "updated_at", "desc": True}],
+                        "page": {"limit": 1},
+                        "only": ["updated_at"],
+                    },
+                    "repository_id": "repo-local",
+                },
+            )
+            results = response.get("results", [])
+            return (
+                response.get("total_count", 0),
+                results[0].get("updated_at") if results else None,
+            )
+
+        return _RESPONSE_CACHE.get(
+            make_cache_key(repo_info, "Plugin.list", query),
+            _fetch,
+            config.get_global("REMOTE_REPOSITORY_CACHE_TTL", 60),
+            config.get_global("REMOTE_REPOSITORY_CACHE_SIZE", 1000),
+            _get_revision
+            if config.get_global("REMOTE_REPOSITORY_REVISION_CHECK", False)
+            else None,
+        )
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from spaceone.core import cache, config
+from spaceone.core.manager import BaseManager
+
+from spaceone.repository.lib.single_flight import SingleFlight
+from spaceone.repository.lib.version import sort_tags
+
+__all__ = ["RegistryManager"]
+
+_LOGGER = logging.getLogger(__name__)
+_REGISTRY_CONNECTOR_MAP = {
+    "DOCKER_HUB": "DockerHubConnector",
+    "AWS_PRIVATE_ECR": "AWSPrivateECRConnector",
+    "HARBOR": "HarborConnector",
+    "GITHUB": "GithubContainerRegistryConnector",
+    "GCP_PRIVATE_GCR": "GCPPrivateGCRConnector",
+    "OCI_REGISTRY": "OCIRegistryConnector",
+}
+_TAGS_CACHE_KEY_PREFIX = "repository:registry-tags"
+
+_TAGS_SINGLE_FLIGHT = SingleFlight()
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_EXECUTOR = None
+_REFRESHING_KEYS = set()
+
+# "registry_type:registry_url" : time of the last delete_tags_cache without an image,
+# for cache backends that can not delete by pattern
+_INVALIDATED_AT = {}
+
+
+class RegistryManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tags_cache_ttl = config.get_global("REGISTRY_TAGS_CACHE_TTL", 300)
+        self.serve_stale = config.get_global("REGISTRY_TAGS_CACHE_SERVE_STALE", False)
+        self.max_stale = config.get_global("REGISTRY_TAGS_CACHE_MAX_STALE", 3600)
+        self.refresh_workers = config.get_global("REGISTRY_TAGS_REFRESH_WORKERS", 4)
+
+    def get_tags(self, registry_type: str, image: str) -> list:
+        registry_url = self.get_registry_url(registry_type)
+        cache_key = self._make_tags_cache_key(registry_type, registry_url, image)
+
+        if self._is_tags_cache_enabled():
+            tags_cache = cache.get(cache_key)
+            if self._is_valid_tags_cache(tags_cache, registry_type, registry_url):
+                age = time.time() - tags_cache["cached_at"]
+                if age < self.tags_cache_ttl:
+                    return tags_cache["tags"]
+
+                if self.serve_stale:
+                    self._refresh_tags_in_background(
+                        cache_key, registry_type, registry_url, image
+                    )
+                    return tags_cache["tags"]
+
+        return self._fetch_and_cache_tags(cache_key, registry_type, registry_url, image)
+
+    def delete_tags_cache(self, registry_type: str, image: str = None) -> None:
+        if not cache.is_set():
+            return
+
+        registry_url = self.get_registry_url(registry_type)
+        if image:
+            try:
+                cache.delete(
+                    self._make_tags_cache_key(registry_type, registry_url, image)
+                )
+            except KeyError:
+                # LocalCache raises KeyError for keys that are not cached
+                pass
+        elif _supports_cache_expire():
+            cache.delete_pattern(
+                self._make_tags_cache_key(registry_type, registry_url, "*")
+            )
+        else:
+            _INVALIDATED_AT[f"{registry_type}:{registry_url}"] = time.time()
+
+    @staticmethod
+    def get_registry_url(registry_type: str) -> str:
+        return config.get_global("REGISTRY_INFO", {}).get(registry_type).get("url")
+
+    def _fetch_and_cache_tags(
+        self, cache_key: str, registry_type: str, registry_url: str, image: str
+    ) -> list:
+        # Concurrent lookups of the same image share one upstream registry call
+        return _TAGS_SINGLE_FLIGHT.do(
+            (registry_type, registry_url, image),
+            self._fetch_and_set_tags_cache,
+            cache_key,
+            registry_type,
+            registry_url,
+            image,
+        )
+
+    def _fetch_and_set_tags_cache(
+        self, cache_key: str, registry_type: str, registry_url: str, image: str
+    ) -> list:
+        # Tags are ordered once here, so cached lists are served as is
+        tags = sort_tags(self._fetch_tags(registry_type, registry_url, image))
+
+        # Empty results are not cached so that newly pushed images are found
+        if self._is_tags_cache_enabled() and len(tags) > 0:
+            tags_cache = {"tags": tags, "cached_at": time.time()}
+
+            if _supports_cache_expire():
+                cache.set(cache_key, tags_cache, expire=self._get_cache_expire())
+            else:
+                # Expiry is checked against cached_at when the tags are read
+                cache.set(cache_key, tags_cache)
+
+        return tags
+
+    def _fetch_tags(self, registry_type: str, registry_url: str, image: str) -> list:
+        registry_connector = _REGISTRY_CONNECTOR_MAP[registry_type]
+
+        try:
+            connector = self.locator.get_connector(registry_connector)
+            return connector.get_tags(registry_url, image)
+        except Exception as e:
+            _LOGGER.error(f"[_fetch_tags] get_tags error: {e}", exc_info=True)
+            raise e
+
+    def _refresh_tags_in_background(
+        self, cache_key: str, registry_type: str, registry_url: str, image: str
+    ) -> None:
+        global _REFRESH_EXECUTOR
+
+        with _REFRESH_LOCK:
+            if cache_key in _REFRESHING_KEYS:
+                return
+
+            if _REFRESH_EXECUTOR is None:
+                _REFRESH_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix="registry-tags-refresh",
+                )
+
+            _REFRESHING_KEYS.add(cache_key)
+
+        _REFRESH_EXECUTOR.submit(
+            self._refresh_tags, cache_key, registry_type, registry_url, image
+        )
+
+    def _refresh_tags(
+        self, cache_key: str, registry_type: str, registry_url: str, image: str
+    ) -> None:
+        try:
+            self._fetch_and_cache_tags(cache_key, registry_type, registry_url, image)
+        except Exception as e:
+            _LOGGER.warning(f"[_refresh_tags] failed to refresh tags ({image}): {e}")
+        finally:
+            with _REFRESH_LOCK:
+                _REFRESHING_KEYS.discard(cache_key)
+
+    def _get_cache_expire(self) -> int:
+        if self.serve_stale:
+            return max(self.max_stale, self.tags_cache_ttl)
+        else:
+            return self.tags_cache_ttl
+
+    def _is_valid_tags_cache(
+        self, tags_cache, registry_type: str, registry_url: str
+    ) -> bool:
+        if not isinstance(tags_cache, dict):
+            return False
+
+        cached_at = tags_cache.get("cached_at", 0)
+        if time.time() - cached_at >= self._get_cache_expire():
+            return False
+
+        invalidated_at = _INVALIDATED_AT.get(f"{registry_type}:{registry_url}", 0)
+        return cached_at > invalidated_at
+
+    def _is_tags_cache_enabled(self) -> bool:
+        return self.tags_cache_ttl > 0 and cache.is_set()
+
+    @staticmethod
+    def _make_tags_cache_key(registry_type: str, registry_url: str, image: str) -> str:
+        return f"{_TAGS_CACHE_KEY_PREFIX}:{registry_type}:{registry_url}:{image}"
+
+
+def _supports_cache_expire() -> bool:
+    # LocalCache rejects expire and delete_pattern and evicts by its own ttl
+    engine = config.get_global("CACHES", {}).get("default", {}).get("engine")
+    return engine != "LocalCache"
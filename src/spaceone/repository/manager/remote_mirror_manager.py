@@ -0,0 +1,310 @@
+import copy
+import datetime
+import logging
+import threading
+import time
+
+from spaceone.core import config, utils
+from spaceone.core.manager import BaseManager
+
+from spaceone.repository.connector.remote_repository_connector import (
+    RemoteRepositoryConnector,
+)
+from spaceone.repository.model.remote_mirror_model import RemoteSyncState
+
+__all__ = ["RemoteMirrorManager"]
+
+_LOGGER = logging.getLogger(__name__)
+_MIRROR_RESOURCES = {
+    "Plugin": {"model": "RemotePlugin", "id_key": "plugin_id"},
+    "DashboardTemplate": {"model": "RemoteDashboardTemplate", "id_key": "template_id"},
+}
+_DATETIME_FIELDS = ["created_at", "updated_at"]
+
+# Raised when mirror fields are added, so the next sync pulls every resource again
+_SCHEMA_VERSION = 2
+
+# (repository_id, resource_type) : (synced_at or None, checked_at)
+_SYNCED_AT = {}
+_SYNCED_AT_LOCK = threading.Lock()
+
+
+class RemoteMirrorManager(BaseManager):
+    """Local mirror of plugins and dashboard templates in REMOTE repositories
+
+    The mirror is written by the sync task only. Reads use it while the last
+    successful sync is younger than REMOTE_MIRROR_MAX_AGE; an older mirror is
+    still served when the remote repository can not be reached. The time of
+    the last sync is read from MongoDB at most once per
+    REMOTE_MIRROR_STATE_CACHE_TTL in each process.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state_model: RemoteSyncState = self.locator.get_model("RemoteSyncState")
+        self.max_age = config.get_global("REMOTE_MIRROR_MAX_AGE", 3600)
+        self.page_size = config.get_global("REMOTE_MIRROR_PAGE_SIZE", 500)
+        self.state_cache_ttl = config.get_global("REMOTE_MIRROR_STATE_CACHE_TTL", 300)
+
+    def sync(self, repo_info: dict, resource_type: str) -> dict:
+        """Pull resources updated since the last sync and drop deleted ones"""
+
+        mirror_model = self._get_mirror_model(resource_type)
+        id_key = _MIRROR_RESOURCES[resource_type]["id_key"]
+        repository_id = repo_info["repository_id"]
+
+        remote_repo_conn: RemoteRepositoryConnector = self.locator.get_connector(
+            "RemoteRepositoryConnector",
+            endpoint=repo_info["endpoint"],
+            token=repo_info["token"],
+        )
+
+        state_vo = self.get_state(repository_id, resource_type)
+        last_updated_at = None
+        if state_vo and state_vo.schema_version == _SCHEMA_VERSION:
+            last_updated_at = state_vo.last_updated_at
+        synced_at = datetime.datetime.utcnow()
+
+        query = {}
+        if last_updated_at:
+            # Equal timestamps are pulled again, so rows updated in the same
+            # instant as the last sync are not missed
+            query["filter"] = [
+                {
+                    "k": "updated_at",
+                    "v": utils.datetime_to_iso8601(last_updated_at),
+                    "o": "datetime_gte",
+                }
+            ]
+
+        updated_count = 0
+        for remote_info in self._list_remote(
+            remote_repo_conn, resource_type, query, id_key
+        ):
+            data = self._make_mirror_data(
+                mirror_model, remote_info, repository_id, synced_at
+            )
+            self._upsert(mirror_model, id_key, data)
+            updated_count += 1
+
+            if data.get("updated_at") and (
+                last_updated_at is None or data["updated_at"] > last_updated_at
+            ):
+                last_updated_at = data["updated_at"]
+
+        # updated_at does not reveal deletions, so the IDs are compared
+        remote_ids = [
+            remote_info.get(id_key)
+            for remote_info in self._list_remote(
+                remote_repo_conn, resource_type, {"only": [id_key]}, id_key
+            )
+        ]
+
+        # An empty list is far more likely a broken response than a remote
+        # repository without any resources, so nothing is deleted then
+        if remote_ids:
+            deleted_count = mirror_model.objects(
+                repository_id=repository_id, **{f"{id_key}__nin": remote_ids}
+            ).delete()
+        else:
+            _LOGGER.warning(
+                f"[sync] {resource_type} of {repository_id}: "
+                f"no IDs returned, deletions are skipped"
+            )
+            deleted_count = 0
+
+        self._set_state(state_vo, repository_id, resource_type, last_updated_at, synced_at)
+
+        _LOGGER.info(
+            f"[sync] {resource_type} of {repository_id}: "
+            f"{updated_count} updated, {deleted_count} deleted"
+        )
+        return {"updated_count": updated_count, "deleted_count": deleted_count}
+
+    def get_state(self, repository_id: str, resource_type: str):
+        return self.state_model.filter(
+            repository_id=repository_id, resource_type=resource_type
+        ).first()
+
+    def is_fresh(self, repository_id: str, resource_type: str) -> bool:
+        synced_at = self._get_synced_at(repository_id, resource_type)
+        if synced_at is None or self.max_age <= 0:
+            return False
+
+        age = datetime.datetime.utcnow() - synced_at
+        return age.total_seconds() < self.max_age
+
+    def has_mirror(self, repository_id: str, resource_type: str) -> bool:
+        return self._get_synced_at(repository_id, resource_type) is not None
+
+    def _get_synced_at(self, repository_id: str, resource_type: str):
+        key = (repository_id, resource_type)
+
+        if self.state_cache_ttl > 0:
+            with _SYNCED_AT_LOCK:
+                if key in _SYNCED_AT:
+                    synced_at, checked_at = _SYNCED_AT[key]
+                    if time.time() - checked_at < self.state_cache_ttl:
+                        return synced_at
+
+        state_vo = self.get_state(repository_id, resource_type)
+        synced_at = state_vo.synced_at if state_vo else None
+        self._set_synced_at(repository_id, resource_type, synced_at)
+        return synced_at
+
+    @staticmethod
+    def _set_synced_at(repository_id: str, resource_type: str, synced_at) -> None:
+        with _SYNCED_AT_LOCK:
+            _SYNCED_AT[(repository_id, resource_type)] = (synced_at, time.time())
+
+    def get_resource(
+        self, repository_id: str, resource_type: str, resource_id: str
+    ) -> dict:
+        mirror_model = self._get_mirror_model(resource_type)
+        id_key = _MIRROR_RESOURCES[resource_type]["id_key"]
+
+        mirror_vo = mirror_model.filter(
+            repository_id=repository_id, **{id_key: resource_id}
+        ).first()
+
+        return self._to_remote_info(mirror_vo) if mirror_vo else None
+
+    def list_resources(
+        self, repository_id: str, resource_type: str, query: dict
+    ) -> tuple:
+        mirror_model = self._get_mirror_model(resource_type)
+
+        query = copy.deepcopy(query)
+        query["filter"] = query.get("filter", []) + [
+            {"k": "repository_id", "v": repository_id, "o": "eq"}
+        ]
+        if "repository" in query.get("only", []):
+            query["only"].remove("repository")
+
+        mirror_vos, total_count = mirror_model.query(**query)
+        return [self._to_remote_info(mirror_vo) for mirror_vo in mirror_vos], total_count
+
+    def _list_remote(
+        self,
+        remote_repo_conn: RemoteRepositoryConnector,
+        resource_type: str,
+        query: dict,
+        id_key: str,
+    ):
+        # Pages are read by keyset on (updated_at, id), so rows updated during
+        # the sync only move forward and are never skipped like with offsets
+        last_info = None
+        while True:
+            response = remote_repo_conn.dispatch(
+                f"{resource_type}.list",
+                {
+                    "query": self._make_page_query(query, id_key, last_info),
+                    "repository_id": "repo-local",
+                },
+            )
+            results = response.get("results", [])
+
+            yield from results
+
+            if len(results) < self.page_size:
+                break
+
+            last_info = results[-1]
+
+    def _make_page_query(self, query: dict, id_key: str, last_info: dict = None) -> dict:
+        page_query = copy.deepcopy(query)
+        page_query["sort"] = [{"key": "updated_at"}, {"key": id_key}]
+        page_query["page"] = {"limit": self.page_size}
+
+        if only := page_query.get("only"):
+            for key in ["updated_at", id_key]:
+                if key not in only:
+                    only.append(key)
+
+        if last_info:
+            updated_at = last_info.get("updated_at")
+            after_id = {"k": id_key, "v": last_info[id_key], "o": "gt"}
+
+            if updated_at is None:
+                # null is the lowest value: (null, > id) or any updated_at
+                page_query["filter_or"] = [
+                    {"k": "updated_at", "v": None, "o": "not"},
+                    after_id,
+                ]
+            else:
+                # updated_at >= last and (updated_at > last or id > last id)
+                page_query["filter"] = page_query.get("filter", []) + [
+                    {"k": "updated_at", "v": updated_at, "o": "datetime_gte"}
+                ]
+                page_query["filter_or"] = [
+                    {"k": "updated_at", "v": updated_at, "o": "datetime_gt"},
+                    after_id,
+                ]
+
+        return page_query
+
+    @staticmethod
+    def _make_mirror_data(
+        mirror_model, remote_info: dict, repository_id: str, synced_at
+    ) -> dict:
+        # Fields missing in a remote response are empty, so they are reset
+        data = {}
+        for key, field in mirror_model._fields.items():
+            if key in ["id", "repository_id", "synced_at"]:
+                continue
+
+            if key in remote_info:
+                value = remote_info[key]
+                if key in _DATETIME_FIELDS and isinstance(value, str):
+                    # Stored as naive UTC like the other datetimes in MongoDB
+                    value = utils.iso8601_to_datetime(value)
+                    value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            else:
+                value = field.default() if callable(field.default) else field.default
+
+            data[key] = value
+
+        data["repository_id"] = repository_id
+        data["synced_at"] = synced_at
+        return data
+
+    @staticmethod
+    def _upsert(mirror_model, id_key: str, data: dict) -> None:
+        mirror_model.objects(
+            repository_id=data["repository_id"],
+            domain_id=data.get("domain_id"),
+            **{id_key: data[id_key]},
+        ).update_one(upsert=True, **{f"set__{key}": value for key, value in data.items()})
+
+    def _set_state(
+        self, state_vo, repository_id: str, resource_type: str, last_updated_at, synced_at
+    ) -> None:
+        data = {
+            "last_updated_at": last_updated_at,
+            "synced_at": synced_at,
+            "schema_version": _SCHEMA_VERSION,
+        }
+
+        if state_vo is None:
+            self.state_model.create(
+                {"repository_id": repository_id, "resource_type": resource_type, **data}
+            )
+        else:
+            state_vo.update(data)
+
+        self._set_synced_at(repository_id, resource_type, synced_at)
+
+    @staticmethod
+    def _to_remote_info(mirror_vo) -> dict:
+        info = mirror_vo.to_dict()
+        for key in ["_id", "repository_id", "synced_at"]:
+            info.pop(key, None)
+
+        # Like a live response without it, the local registry url is used then
+        if info.get("registry_url") is None:
+            info.pop("registry_url", None)
+
+        return info
+
+    def _get_mirror_model(self, resource_type: str):
+        return self.locator.get_model(_MIRROR_RESOURCES[resource_type]["model"])
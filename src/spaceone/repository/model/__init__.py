@@ -1,2 +1,3 @@
 from spaceone.repository.model.plugin_model import *
 from spaceone.repository.model.dashboard_template_model import *
+from spaceone.repository.model.remote_mirror_model import *
@@ -0,0 +1,104 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ["RemotePlugin", "RemoteDashboardTemplate", "RemoteSyncState"]
+
+
+class RemotePlugin(MongoModel):
+    """
+    Read-only mirror of plugins in REMOTE repositories (written by sync only)
+    """
+
+    plugin_id = StringField(max_length=255, unique_with=["repository_id", "domain_id"])
+    name = StringField(max_length=255)
+    state = StringField(max_length=40, default="ENABLED")
+    image = StringField(max_length=255)
+    registry_type = StringField(max_length=255, default="DOCKER_HUB")
+    registry_url = StringField(max_length=255, default=None, null=True)
+    registry_config = DictField()
+    resource_type = StringField(max_length=255)
+    provider = StringField(max_length=255, default=None, null=True)
+    capability = DictField()
+    labels = ListField(StringField(max_length=255))
+    tags = DictField()
+    docs = DictField(null=True, default=None)
+    domain_id = StringField(max_length=255)
+    repository_id = StringField(max_length=40)
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    synced_at = DateTimeField()
+
+    meta = {
+        "updatable_fields": [],
+        "minimal_fields": [
+            "plugin_id",
+            "name",
+            "state",
+            "image",
+            "registry_type",
+            "resource_type",
+            "provider",
+        ],
+        "ordering": ["name"],
+        "indexes": [
+            "plugin_id",
+            "state",
+            "resource_type",
+            "provider",
+            "repository_id",
+            "updated_at",
+        ],
+    }
+
+
+class RemoteDashboardTemplate(MongoModel):
+    """
+    Read-only mirror of dashboard templates in REMOTE repositories (written by sync only)
+    """
+
+    template_id = StringField(
+        max_length=255, unique_with=["repository_id", "domain_id"]
+    )
+    name = StringField(max_length=255)
+    state = StringField(max_length=40, default="ENABLED")
+    template_type = StringField(max_length=255, default="SINGLE")
+    dashboards = ListField(DictField())
+    labels = ListField(StringField(max_length=255))
+    tags = DictField()
+    domain_id = StringField(max_length=255)
+    repository_id = StringField(max_length=40)
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    synced_at = DateTimeField()
+
+    meta = {
+        "updatable_fields": [],
+        "minimal_fields": [
+            "template_id",
+            "name",
+            "state",
+            "template_type",
+        ],
+        "ordering": ["name"],
+        "indexes": [
+            "template_id",
+            "state",
+            "template_type",
+            "repository_id",
+            "updated_at",
+        ],
+    }
+
+
+class RemoteSyncState(MongoModel):
+    repository_id = StringField(max_length=40, unique_with="resource_type")
+    resource_type = StringField(max_length=40)
+    last_updated_at = DateTimeField(default=None, null=True)
+    synced_at = DateTimeField()
+    schema_version = IntField(default=1)
+
+    meta = {
+        "updatable_fields": ["last_updated_at", "synced_at", "schema_version"],
+        "indexes": ["repository_id"],
+    }
@@ -1,3 +1,4 @@
 from spaceone.repository.service.repository_service import *
 from spaceone.repository.service.plugin_service import *
 from spaceone.repository.service.dashboard_template_service import *
+from spaceone.repository.service.remote_repository_sync_service import *
@@ -6,9 +6,19 @@ from spaceone.core.service import *
 from spaceone.core import config, utils
 
 from spaceone.repository.error import *
+from spaceone.repository.lib.cursor import CursorPage
+from spaceone.repository.lib.merge import (
+    make_repository_query,
+    merge_results,
+    remove_added_keys,
+)
 from spaceone.repository.manager.dashboard_template_manager.local_dashboard_template_manager import (
     LocalDashboardTemplateManager,
 )
+from spaceone.repository.manager.not_found_cache_manager import (
+    NotFoundCacheManager,
+    is_not_found_error,
+)
 from spaceone.repository.manager.repository_manager import RepositoryManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,6 +30,7 @@ _LOGGER = logging.getLogger(__name__)
 @event_handler
 class DashboardTemplateService(BaseService):
     resource = "DashboardTemplate"
+    next_token = None
 
     @transaction(permission="repository:DashboardTemplate.write", role_types=["DOMAIN_ADMIN"])
     @check_required(["name", "domain_id"])
@@ -162,6 +173,15 @@ class DashboardTemplateService(BaseService):
         repo_id = params.get("repository_id")
         domain_id = params.get("domain_id")
 
+        not_found_cache_mgr: NotFoundCacheManager = self.locator.get_manager(
+            "NotFoundCacheManager"
+        )
+        if not_found_cache_mgr.is_not_found(
+            "DashboardTemplate", template_id, repo_id, domain_id
+        ):
+            raise ERROR_NO_DASHBOARD_TEMPLATE(template_id=template_id)
+
+        is_not_found = True
         repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
         repos_info = repo_mgr.get_repositories(repo_id)
         for repo_info in repos_info:
@@ -178,6 +198,14 @@ class DashboardTemplateService(BaseService):
                     f"[get] Can not find template({template_id}) at {repo_info['name']}"
                 )
 
+                if not is_not_found_error(e):
+                    is_not_found = False
+
+        if is_not_found:
+            not_found_cache_mgr.set_not_found(
+                "DashboardTemplate", template_id, repo_id, domain_id
+            )
+
         raise ERROR_NO_DASHBOARD_TEMPLATE(template_id=template_id)
 
     @transaction(
@@ -199,17 +227,24 @@ class DashboardTemplateService(BaseService):
                 'state': 'str',
                 'dashboard_type': 'str',
                 'domain_id': 'str',
-                'query': 'dict (spaceone.api.core.v1.Query)'
+                'query': 'dict (spaceone.api.core.v1.Query)',
+                'next_token': 'str'         # cursor pagination ('' for the first page)
             }
 
         Returns:
             results (list): 'list of template_info'
             total_count (int)
+
+            With next_token, the token of the next page is set to
+            self.next_token ('' on the last page).
         """
 
         query = params.get("query", {})
         query["only"] = query.get("only", [])
 
+        if "next_token" in params:
+            return self._list_by_cursor(query, params)
+
         repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
         if repository_id := params.get("repository_id"):
             repo_info = repo_mgr.get_repository(repository_id)
@@ -217,35 +252,72 @@ class DashboardTemplateService(BaseService):
 
             return template_mgr.list_templates(repo_info, query, params)
         else:
-            all_templates_info = []
-            template_total_count = 0
-            query_page = None
-            if "page" in query:
-                query_page = query["page"]
-                del query["page"]
+            # Each repository returns only the rows up to the end of the page
+            repo_query = make_repository_query(query)
 
+            results_list = []
+            template_total_count = 0
             repos_info: list = repo_mgr.get_repositories()
             for repo_info in repos_info:
                 template_mgr = self._get_template_manager_by_repo(
                     repo_info["repository_type"]
                 )
                 templates_info, total_count = template_mgr.list_templates(
-                    repo_info, copy.deepcopy(query), params
+                    repo_info, copy.deepcopy(repo_query), params
                 )
-                all_templates_info += templates_info
+                results_list.append(templates_info)
                 template_total_count += total_count
 
-            if query_page:
-                page_start = query_page.get("start", 1) - 1
-                page_limit = query_page.get("limit")
-
-                if page_limit:
-                    all_templates_info = all_templates_info[
-                        page_start : page_start + page_limit
-                    ]
+            all_templates_info = merge_results(
+                results_list, query.get("sort"), query.get("page")
+            )
 
+            # Sort keys were added to only to merge the results
+            sort_keys = [
+                sort_condition["key"] for sort_condition in query.get("sort") or []
+            ]
+            remove_added_keys(all_templates_info, query.get("only"), sort_keys)
             return all_templates_info, template_total_count
 
+    def _list_by_cursor(self, query: dict, params: dict):
+        repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
+        repos_info = repo_mgr.get_repositories(params.get("repository_id"))
+        cursor_page = CursorPage(query, params["next_token"])
+
+        responses = []
+        for repo_info in repos_info:
+            repository_id = repo_info["repository_id"]
+            if cursor_page.is_done(repository_id):
+                responses.append(None)
+                continue
+
+            template_mgr = self._get_template_manager_by_repo(
+                repo_info["repository_type"]
+            )
+            responses.append(
+                template_mgr.list_templates_by_cursor(
+                    repo_info,
+                    copy.deepcopy(cursor_page.repo_query),
+                    params,
+                    cursor_page.get_cursor(repository_id),
+                )
+            )
+
+        def _advance_cursor(repo_info: dict, cursor: dict, consumed_rows: list):
+            template_mgr = self._get_template_manager_by_repo(
+                repo_info["repository_type"]
+            )
+            return template_mgr.advance_cursor(cursor, cursor_page.sort, consumed_rows)
+
+        results, total_count, self.next_token = cursor_page.merge(
+            repos_info, responses, _advance_cursor
+        )
+
+        # Sort keys are kept until the cursors are advanced
+        sort_keys = [sort_condition["key"] for sort_condition in cursor_page.sort]
+        remove_added_keys(results, query.get("only"), sort_keys)
+        return results, total_count
+
     def _get_template_manager_by_repo(self, repository_type: str):
         if repository_type == "LOCAL":
             return self.locator.get_manager("LocalDashboardTemplateManager")
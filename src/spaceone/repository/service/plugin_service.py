@@ -6,28 +6,59 @@ from spaceone.core.service import *
 from spaceone.core import config
 
 from spaceone.repository.error import *
+from spaceone.repository.lib.cursor import CursorPage
+from spaceone.repository.lib.fan_out import FanOut
+from spaceone.repository.lib.merge import (
+    make_repository_query,
+    merge_results,
+    remove_added_keys,
+)
+from spaceone.repository.lib.suggest import rank_key
+from spaceone.repository.lib.version import resolve_version
 from spaceone.repository.manager.plugin_manager.local_plugin_manager import (
     LocalPluginManager,
 )
+from spaceone.repository.manager.not_found_cache_manager import NotFoundCacheManager
+from spaceone.repository.manager.plugin_location_manager import PluginLocationManager
 from spaceone.repository.manager.repository_manager import RepositoryManager
 
 _LOGGER = logging.getLogger(__name__)
 
 MAX_IMAGE_NAME_LENGTH = 48
+DEFAULT_SUGGEST_LIMIT = 10
 REGISTRY_MAP = {
     "DOCKER_HUB": "DockerHubConnector",
     "AWS_PRIVATE_ECR": "AWSPrivateECRConnector",
     "HARBOR": "HarborConnector",
     "GCP_PRIVATE_GCR": "GCPPrivateGCRConnector",
+    "OCI_REGISTRY": "OCIRegistryConnector",
 }
 
 
+_REPOSITORY_FAN_OUT = None
+
+
+def _get_repository_fan_out() -> FanOut:
+    global _REPOSITORY_FAN_OUT
+
+    if _REPOSITORY_FAN_OUT is None:
+        _REPOSITORY_FAN_OUT = FanOut(
+            config.get_global("REPOSITORY_FAN_OUT_WORKERS", 16),
+            thread_name_prefix="repository-fan-out",
+        )
+
+    return _REPOSITORY_FAN_OUT
+
+
 @authentication_handler
 @authorization_handler
 @mutation_handler
 @event_handler
 class PluginService(BaseService):
     resource = "Plugin"
+    next_token = None
+    skipped_repositories = None
+    partial_repositories = None
 
     @transaction(permission="repository:Plugin.write", role_types=["DOMAIN_ADMIN"])
     @check_required(["name", "resource_type", "image", "domain_id"])
@@ -186,23 +217,35 @@ class PluginService(BaseService):
         domain_id = params.get("domain_id")
         repo_id = params.get("repository_id")
 
-        repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
-        repos_info = repo_mgr.get_repositories(repo_id)
+        return self._get_plugin_versions(plugin_id, repo_id, domain_id)
 
-        for repo_info in repos_info:
-            _LOGGER.debug(
-                f"[get] find at name: {repo_info['name']}"
-                f"(repo_type: {repo_info['repository_type']})"
-            )
-            plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
-            try:
-                return plugin_mgr.get_plugin_versions(repo_info, plugin_id, domain_id)
-            except Exception as e:
-                _LOGGER.debug(
-                    f"[get_versions] Cannot find plugin: {plugin_id} at {repo_info['name']}"
-                )
+    @transaction(
+        permission="repository:Plugin.read",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @check_required(["plugin_id"])
+    def resolve_version(self, params):
+        """Resolve a version constraint to a single plugin version (all repositories)
 
-        raise ERROR_NO_PLUGIN(plugin_id=plugin_id)
+        Args:
+            params (dict): {
+                'plugin_id': 'str',         # required
+                'version': 'str',           # latest | latest-stable | >=1.12,<2 | 1.12.0 (default: latest)
+                'repository_id': 'str',
+                'domain_id': 'str'          # injected from auth
+            }
+
+        Returns:
+            version (str)
+        """
+
+        plugin_id = params["plugin_id"]
+        domain_id = params.get("domain_id")
+        repo_id = params.get("repository_id")
+        constraint = params.get("version", "latest")
+
+        versions = self._get_plugin_versions(plugin_id, repo_id, domain_id)
+        return resolve_version(versions, constraint)
 
     @transaction(
         permission="repository:Plugin.read",
@@ -228,22 +271,7 @@ class PluginService(BaseService):
         repo_id = params.get("repository_id")
         domain_id = params.get("domain_id")
 
-        repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
-        repos_info = repo_mgr.get_repositories(repo_id)
-        for repo_info in repos_info:
-            _LOGGER.debug(
-                f"[get] find at name: {repo_info['name']} "
-                f"(repo_type: {repo_info['repository_type']})"
-            )
-            plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
-            try:
-                return plugin_mgr.get_plugin(repo_info, plugin_id, domain_id)
-            except Exception as e:
-                _LOGGER.debug(
-                    f"[get] Can not find plugin({plugin_id}) at {repo_info['name']}"
-                )
-
-        raise ERROR_NO_PLUGIN(plugin_id=plugin_id)
+        return self._find_plugin("get_plugin", plugin_id, repo_id, domain_id)
 
     @transaction(
         permission="repository:Plugin.read",
@@ -267,12 +295,22 @@ class PluginService(BaseService):
                 'provider': 'str',
                 'project_id': 'str', // deprecated
                 'domain_id': 'str',
-                'query': 'dict (spaceone.api.core.v1.Query)'
+                'query': 'dict (spaceone.api.core.v1.Query)',
+                'next_token': 'str',        # cursor pagination ('' for the first page)
+                'time_remaining': 'float'   # seconds until the caller's deadline
             }
 
         Returns:
             results (list): 'list of plugin_info'
             total_count (int)
+
+            With next_token, the token of the next page is set to
+            self.next_token ('' on the last page).
+
+            IDs of remote repositories that did not answer in time or failed
+            are set to self.skipped_repositories, and of remote repositories
+            answered from an outdated mirror to self.partial_repositories.
+            Errors of LOCAL and MANAGED repositories are raised.
         """
 
         query = params.get("query", {})
@@ -281,41 +319,275 @@ class PluginService(BaseService):
         if "registry_url" in query["only"]:
             query["only"].remove("registry_url")
 
+        self.skipped_repositories = []
+        self.partial_repositories = []
+
+        if "next_token" in params:
+            return self._list_by_cursor(query, params)
+
         repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
         if repository_id := params.get("repository_id"):
             repo_info = repo_mgr.get_repository(repository_id)
-            plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
+            responses = self._fan_out(
+                [(self._list_plugins_by_repo, (repo_info, query, params))],
+                [repo_info],
+                params,
+            )
 
-            return plugin_mgr.list_plugins(repo_info, query, params)
+            return responses[0] or ([], 0)
         else:
-            all_plugins_info = []
-            plugin_total_count = 0
-            query_page = None
-            if "page" in query:
-                query_page = query["page"]
-                del query["page"]
+            # Each repository returns only the rows up to the end of the page
+            repo_query = make_repository_query(query)
 
+            # Repositories are queried concurrently and merged in repository order
             repos_info: list = repo_mgr.get_repositories()
-            for repo_info in repos_info:
-                plugin_mgr = self._get_plugin_manager_by_repo(
-                    repo_info["repository_type"]
+            responses = self._fan_out(
+                [
+                    (self._list_plugins_by_repo, (repo_info, repo_query, params))
+                    for repo_info in repos_info
+                ],
+                repos_info,
+                params,
+            )
+
+            results_list = []
+            plugin_total_count = 0
+            for response in responses:
+                if response is None:
+                    continue
+
+                plugins_info, total_count = response
+                results_list.append(plugins_info)
+                plugin_total_count += total_count
+
+            all_plugins_info = merge_results(
+                results_list, query.get("sort"), query.get("page")
+            )
+
+            # Sort keys were added to only to merge the results
+            sort_keys = [
+                sort_condition["key"] for sort_condition in query.get("sort") or []
+            ]
+            remove_added_keys(all_plugins_info, query.get("only"), sort_keys)
+            return all_plugins_info, plugin_total_count
+
+    @transaction(
+        permission="repository:Plugin.read",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER", "USER"],
+    )
+    @check_required(["prefix"])
+    def suggest(self, params):
+        """Suggest plugin names, labels and providers by prefix (all repositories)
+
+        Args:
+            params (dict): {
+                'prefix': 'str',            # required
+                'resource_type': 'str',
+                'repository_id': 'str',
+                'limit': 'int',             # default: 10
+                'domain_id': 'str'          # injected from auth (optional)
+            }
+
+        Returns:
+            suggestions (list): [{'type': 'name|label|provider', 'value': 'str', 'plugin_id': 'str'}]
+        """
+
+        prefix = params["prefix"]
+        limit = params.get("limit", DEFAULT_SUGGEST_LIMIT)
+        repo_id = params.get("repository_id")
+
+        repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
+        repos_info = repo_mgr.get_repositories(repo_id)
+
+        suggestions = {}
+        for repo_info in repos_info:
+            plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
+            for suggestion in plugin_mgr.suggest_plugins(
+                repo_info, prefix, limit, params
+            ):
+                key = (
+                    suggestion["type"],
+                    suggestion["value"],
+                    suggestion.get("plugin_id"),
                 )
-                plugins_info, total_count = plugin_mgr.list_plugins(
-                    repo_info, copy.deepcopy(query), params
+                suggestions.setdefault(key, suggestion)
+
+        return sorted(
+            suggestions.values(), key=lambda suggestion: rank_key(prefix, suggestion)
+        )[:limit]
+
+    def _list_by_cursor(self, query: dict, params: dict):
+        repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
+        repos_info = repo_mgr.get_repositories(params.get("repository_id"))
+        cursor_page = CursorPage(query, params["next_token"])
+
+        active_repos_info = [
+            repo_info
+            for repo_info in repos_info
+            if not cursor_page.is_done(repo_info["repository_id"])
+        ]
+        responses = self._fan_out(
+            [
+                (
+                    self._list_plugins_by_cursor,
+                    (
+                        repo_info,
+                        cursor_page.repo_query,
+                        params,
+                        cursor_page.get_cursor(repo_info["repository_id"]),
+                    ),
                 )
-                all_plugins_info += plugins_info
-                plugin_total_count += total_count
+                for repo_info in active_repos_info
+            ],
+            active_repos_info,
+            params,
+        )
 
-            if query_page:
-                page_start = query_page.get("start", 1) - 1
-                page_limit = query_page.get("limit")
+        repo_responses = {}
+        for repo_info, response in zip(active_repos_info, responses):
+            if response is not None:
+                repo_responses[repo_info["repository_id"]] = response
 
-                if page_limit:
-                    all_plugins_info = all_plugins_info[
-                        page_start : page_start + page_limit
-                    ]
+        def _advance_cursor(repo_info: dict, cursor: dict, consumed_rows: list):
+            plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
+            return plugin_mgr.advance_cursor(cursor, cursor_page.sort, consumed_rows)
 
-            return all_plugins_info, plugin_total_count
+        results, total_count, self.next_token = cursor_page.merge(
+            repos_info,
+            [repo_responses.get(repo_info["repository_id"]) for repo_info in repos_info],
+            _advance_cursor,
+        )
+
+        # Cursor keys are kept until the cursors are advanced
+        cursor_keys = [sort_condition["key"] for sort_condition in cursor_page.sort]
+        remove_added_keys(results, query.get("only"), cursor_keys + ["plugin_id"])
+        return results, total_count
+
+    def _fan_out(self, calls: list, repos_info: list, params: dict) -> list:
+        """Run one list call per repository within the caller's deadline
+
+        Returns:
+            the response of each repository, None for a skipped repository
+        """
+
+        # Only remote repositories can hang, so the others do not wait for
+        # a worker behind them
+        responses = _get_repository_fan_out().run(
+            calls,
+            timeout=self._get_repository_timeout(params),
+            inline=[
+                index
+                for index, repo_info in enumerate(repos_info)
+                if repo_info["repository_type"] != "REMOTE"
+            ],
+        )
+
+        results = []
+        for repo_info, (response, error) in zip(repos_info, responses):
+            if error:
+                # Remote repositories are outside of this service, so their
+                # failures only drop their rows. The others run inline without
+                # a timeout and only fail with their own errors.
+                if repo_info["repository_type"] != "REMOTE":
+                    raise error
+
+                _LOGGER.warning(
+                    f"[list] skip repository: {repo_info['name']} ({error})"
+                )
+                self.skipped_repositories.append(repo_info["repository_id"])
+                results.append(None)
+                continue
+
+            response, partial = response
+            if partial:
+                self.partial_repositories.append(repo_info["repository_id"])
+
+            results.append(response)
+
+        return results
+
+    @staticmethod
+    def _get_repository_timeout(params: dict) -> float:
+        timeout = config.get_global("REPOSITORY_TIMEOUT", 10)
+
+        # Leave time to merge the results before the caller gives up
+        if (time_remaining := params.get("time_remaining")) is not None:
+            margin = config.get_global("REPOSITORY_DEADLINE_MARGIN", 0.5)
+            timeout = min(timeout, round(max(time_remaining - margin, 0), 3))
+
+        return timeout
+
+    def _list_plugins_by_cursor(
+        self, repo_info: dict, query: dict, params: dict, cursor: dict = None
+    ):
+        plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
+        response = plugin_mgr.list_plugins_by_cursor(
+            repo_info, copy.deepcopy(query), params, cursor
+        )
+        return response, plugin_mgr.partial
+
+    def _list_plugins_by_repo(self, repo_info: dict, query: dict, params: dict):
+        plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
+        response = plugin_mgr.list_plugins(repo_info, copy.deepcopy(query), params)
+        return response, plugin_mgr.partial
+
+    def _get_plugin_versions(self, plugin_id: str, repo_id: str, domain_id: str):
+        return self._find_plugin("get_plugin_versions", plugin_id, repo_id, domain_id)
+
+    def _find_plugin(
+        self, method_name: str, plugin_id: str, repo_id: str, domain_id: str
+    ):
+        not_found_cache_mgr: NotFoundCacheManager = self.locator.get_manager(
+            "NotFoundCacheManager"
+        )
+        if not_found_cache_mgr.is_not_found("Plugin", plugin_id, repo_id, domain_id):
+            raise ERROR_NO_PLUGIN(plugin_id=plugin_id)
+
+        repo_mgr: RepositoryManager = self.locator.get_manager("RepositoryManager")
+        location_mgr: PluginLocationManager = self.locator.get_manager(
+            "PluginLocationManager"
+        )
+
+        # Repositories skipped by the location index do not have the plugin
+        is_not_found = True
+        repos_info = location_mgr.sort_repositories(
+            repo_mgr.get_repositories(repo_id), plugin_id, domain_id
+        )
+
+        for repo_info in repos_info:
+            _LOGGER.debug(
+                f"[{method_name}] find at name: {repo_info['name']} "
+                f"(repo_type: {repo_info['repository_type']})"
+            )
+            plugin_mgr = self._get_plugin_manager_by_repo(repo_info["repository_type"])
+            try:
+                response = getattr(plugin_mgr, method_name)(
+                    repo_info, plugin_id, domain_id
+                )
+            except Exception as e:
+                _LOGGER.debug(
+                    f"[{method_name}] Can not find plugin({plugin_id}) at {repo_info['name']}: {e}"
+                )
+
+                if location_mgr.is_not_found(e):
+                    location_mgr.set_missing(
+                        plugin_id, domain_id, repo_info["repository_id"]
+                    )
+                else:
+                    is_not_found = False
+                continue
+
+            if repo_info["repository_type"] != "MANAGED":
+                location_mgr.set_location(
+                    plugin_id, domain_id, repo_info["repository_id"]
+                )
+
+            return response
+
+        if is_not_found:
+            not_found_cache_mgr.set_not_found("Plugin", plugin_id, repo_id, domain_id)
+
+        raise ERROR_NO_PLUGIN(plugin_id=plugin_id)
 
     def _get_plugin_manager_by_repo(self, repository_type: str):
         if repository_type == "LOCAL":
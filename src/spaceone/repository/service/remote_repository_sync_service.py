@@ -0,0 +1,48 @@
+import logging
+
+from spaceone.core.service import *
+
+from spaceone.repository.manager.remote_mirror_manager import RemoteMirrorManager
+from spaceone.repository.manager.repository_manager import RepositoryManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_SYNC_RESOURCE_TYPES = ["Plugin", "DashboardTemplate"]
+
+
+@authentication_handler
+@authorization_handler
+@mutation_handler
+@event_handler
+class RemoteRepositorySyncService(BaseService):
+    resource = "RemoteRepository"
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def sync(self, params):
+        """Mirror plugins and dashboard templates of REMOTE repositories (scheduler task)
+
+        Args:
+            params (dict): {
+                'repository_id': 'str'
+            }
+
+        Returns:
+            None
+        """
+
+        mirror_mgr: RemoteMirrorManager = self.locator.get_manager("RemoteMirrorManager")
+        repos_info = RepositoryManager.get_repositories(
+            repository_id=params.get("repository_id"), repository_type="REMOTE"
+        )
+
+        for repo_info in repos_info:
+            for resource_type in _SYNC_RESOURCE_TYPES:
+                # A failed repository keeps its mirror and is retried next time
+                try:
+                    mirror_mgr.sync(repo_info, resource_type)
+                except Exception as e:
+                    _LOGGER.error(
+                        f"[sync] failed to sync {resource_type} of "
+                        f"{repo_info['repository_id']}: {e}",
+                        exc_info=True,
+                    )
@@ -0,0 +1,115 @@
+import base64
+import json
+import threading
+import unittest
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from spaceone.core import config
+from spaceone.repository.connector import registry_connector
+from spaceone.repository.connector.registry_connector import OCIRegistryConnector
+
+_TAGS = [f"1.{i}.0" for i in range(25)]
+_TOKEN = "registry-token"
+_BASIC_AUTH = base64.b64encode(b"admin:password").decode("utf-8")
+
+
+class _RegistryHandler(BaseHTTPRequestHandler):
+    token_requests = 0
+    tags_requests = 0
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+
+        if url.path == "/token":
+            if self.headers.get("authorization") != f"Basic {_BASIC_AUTH}":
+                return self._send(401, {})
+
+            _RegistryHandler.token_requests += 1
+            return self._send(200, {"token": _TOKEN, "expires_in": 300})
+
+        if url.path == "/v2/cloudforet/plugin-b/tags/list":
+            # Ignores last and does not send Link headers
+            n = int(query.get("n", len(_TAGS)))
+            return self._send(200, {"name": "cloudforet/plugin-b", "tags": _TAGS[:n]})
+
+        if url.path == "/v2/cloudforet/plugin-a/tags/list":
+            if self.headers.get("authorization") != f"Bearer {_TOKEN}":
+                realm = f"http://{self.headers['host']}/token"
+                return self._send(
+                    401,
+                    {},
+                    {"WWW-Authenticate": f'Bearer realm="{realm}",service="registry"'},
+                )
+
+            _RegistryHandler.tags_requests += 1
+            n = int(query.get("n", len(_TAGS)))
+            start = _TAGS.index(query["last"]) + 1 if "last" in query else 0
+            tags = _TAGS[start : start + n]
+            headers = {}
+            if start + n < len(_TAGS):
+                headers["Link"] = (
+                    f'</v2/cloudforet/plugin-a/tags/list?n={n}&last={tags[-1]}>; rel="next"'
+                )
+            return self._send(200, {"name": "cloudforet/plugin-a", "tags": tags}, headers)
+
+        self._send(404, {})
+
+    def _send(self, status_code, body, headers=None):
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+class TestOCIRegistryConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _RegistryHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        config.set_global(
+            CONNECTORS={
+                "OCIRegistryConnector": {
+                    "base_url": cls.base_url,
+                    "username": "admin",
+                    "password": "password",
+                    "page_size": 10,
+                }
+            }
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.server.shutdown()
+        registry_connector._OCI_AUTH_CHALLENGES.clear()
+        registry_connector._OCI_TOKENS.clear()
+
+    def test_get_tags(self):
+        tags = OCIRegistryConnector().get_tags("", "cloudforet/plugin-a")
+        self.assertEqual(tags, _TAGS)
+        self.assertEqual(_RegistryHandler.tags_requests, 3)
+
+        # Cached bearer token is reused without a new auth negotiation
+        OCIRegistryConnector().get_tags("", "cloudforet/plugin-a")
+        self.assertEqual(_RegistryHandler.token_requests, 1)
+        self.assertEqual(_RegistryHandler.tags_requests, 6)
+
+    def test_get_tags_stops_when_last_is_ignored(self):
+        tags = OCIRegistryConnector().get_tags("", "cloudforet/plugin-b")
+        self.assertEqual(tags, _TAGS[:10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+from spaceone.core import config
+from spaceone.repository.error import *
+from spaceone.repository.connector import registry_connector
+from spaceone.repository.connector.registry_connector import (
+    AWSPrivateECRConnector,
+    DockerHubConnector,
+    GCPPrivateGCRConnector,
+    GithubContainerRegistryConnector,
+)
+
+
+def _make_response(status_code=200, json_data=None, headers=None, links=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    response.headers = headers or {}
+    response.links = links or {}
+    return response
+
+
+class TestDockerHubConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        super().setUpClass()
+
+    @patch("spaceone.repository.connector.registry_connector._get_http_session")
+    def test_get_tags_follows_next_pages(self, mock_get_http_session):
+        session = MagicMock()
+        session.get.side_effect = [
+            _make_response(
+                json_data={
+                    "results": [{"name": "1.2.0"}, {"name": "1.1.0"}],
+                    "next": "https://registry.hub.docker.com/v2/repositories/a/b/tags?page=2&page_size=100",
+                }
+            ),
+            _make_response(json_data={"results": [{"name": "1.0.0"}], "next": None}),
+        ]
+        mock_get_http_session.return_value = session
+
+        tags = DockerHubConnector().get_tags("registry.hub.docker.com", "a/b")
+
+        self.assertEqual(tags, ["1.2.0", "1.1.0", "1.0.0"])
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(session.get.call_args_list[0].kwargs["params"], {"page_size": 100})
+
+
+class TestGithubContainerRegistryConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        super().setUpClass()
+
+    def tearDown(self):
+        registry_connector._GITHUB_RATE_LIMITS.clear()
+
+    @patch("spaceone.repository.connector.registry_connector._get_http_session")
+    def test_get_tags_follows_link_header(self, mock_get_http_session):
+        next_url = "https://api.github.com/orgs/cloudforet-io/packages/container/plugin-a/versions?per_page=100&page=2"
+        rate_limit_headers = {
+            "X-RateLimit-Remaining": "4000",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+        session = MagicMock()
+        session.get.side_effect = [
+            _make_response(
+                json_data=[{"metadata": {"container": {"tags": ["1.1.0"]}}}],
+                headers=rate_limit_headers,
+                links={"next": {"url": next_url}},
+            ),
+            _make_response(
+                json_data=[{"metadata": {"container": {"tags": ["1.0.0", "latest"]}}}],
+                headers=rate_limit_headers,
+            ),
+        ]
+        mock_get_http_session.return_value = session
+
+        tags = GithubContainerRegistryConnector().get_tags("ghcr.io", "cloudforet-io/plugin-a")
+
+        self.assertEqual(tags, ["1.1.0", "1.0.0", "latest"])
+        self.assertEqual(session.get.call_args_list[0].kwargs["params"], {"per_page": 100})
+        self.assertEqual(session.get.call_args_list[1].args[0], next_url)
+
+    @patch("spaceone.repository.connector.registry_connector._get_http_session")
+    def test_get_tags_backs_off_before_rate_limit(self, mock_get_http_session):
+        github_token = GithubContainerRegistryConnector().config.get("github_token")
+        registry_connector._GITHUB_RATE_LIMITS[github_token] = (0, int(time.time()) + 3600)
+
+        with self.assertRaises(ERROR_REGISTRY_RATE_LIMITED):
+            GithubContainerRegistryConnector().get_tags("ghcr.io", "cloudforet-io/plugin-a")
+
+        mock_get_http_session.return_value.get.assert_not_called()
+
+    @patch("spaceone.repository.connector.registry_connector.time.sleep")
+    @patch("spaceone.repository.connector.registry_connector._get_http_session")
+    def test_get_tags_does_not_wait_long_for_rate_limit(
+        self, mock_get_http_session, mock_sleep
+    ):
+        github_token = GithubContainerRegistryConnector().config.get("github_token")
+        registry_connector._GITHUB_RATE_LIMITS[github_token] = (0, int(time.time()) + 30)
+
+        with self.assertRaises(ERROR_REGISTRY_RATE_LIMITED):
+            GithubContainerRegistryConnector().get_tags("ghcr.io", "cloudforet-io/plugin-a")
+
+        mock_sleep.assert_not_called()
+
+
+class TestAWSPrivateECRConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        config.set_global(
+            CONNECTORS={
+                "AWSPrivateECRConnector": {
+                    "aws_access_key_id": "AKIA",
+                    "aws_secret_access_key": "secret",
+                    "region_name": "ap-northeast-2",
+                    "account_id": "123456789012",
+                }
+            }
+        )
+        super().setUpClass()
+
+    @patch("spaceone.repository.connector.registry_connector._get_ecr_client")
+    def test_get_tags_newest_images(self, mock_get_ecr_client):
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {
+                "imageDetails": [
+                    {"imagePushedAt": datetime(2024, 1, 1), "imageTags": ["1.0.0"]},
+                    {"imagePushedAt": datetime(2024, 3, 1), "imageTags": ["1.2.0", "latest"]},
+                    {"imagePushedAt": datetime(2024, 4, 1), "imageTags": ["sha-abc"]},
+                ]
+            },
+            # A patch of an older release pushed last
+            {"imageDetails": [{"imagePushedAt": datetime(2024, 5, 1), "imageTags": ["1.1.0"]}]},
+        ]
+        mock_get_ecr_client.return_value.get_paginator.return_value = paginator
+
+        ecr_connector = AWSPrivateECRConnector()
+        self.assertEqual(
+            ecr_connector.get_tags("", "plugin-a"),
+            ["1.2.0", "1.1.0", "1.0.0", "latest", "sha-abc"],
+        )
+
+        ecr_connector.config = dict(ecr_connector.config, max_images=2)
+        self.assertEqual(ecr_connector.get_tags("", "plugin-a"), ["1.2.0", "1.1.0", "latest"])
+
+
+class TestGCPPrivateGCRConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        config.set_global(
+            CONNECTORS={
+                "GCPPrivateGCRConnector": {
+                    "location": "asia-northeast3",
+                    "repository_id": "plugins",
+                    "service_account_key": "c2VydmljZV9hY2NvdW50X2tleQ==",
+                }
+            }
+        )
+        super().setUpClass()
+
+    @patch("spaceone.repository.connector.registry_connector._start_gcp_credentials_refresher")
+    @patch("spaceone.repository.connector.registry_connector.artifactregistry_v1")
+    @patch(
+        "spaceone.repository.connector.registry_connector._load_gcp_credentials",
+        return_value=(MagicMock(), "my-project"),
+    )
+    def test_client_is_reused(self, mock_load_gcp_credentials, mock_artifactregistry_v1, *args):
+        registry_connector._GCP_CLIENTS.clear()
+
+        first_connector = GCPPrivateGCRConnector()
+        second_connector = GCPPrivateGCRConnector()
+
+        self.assertIs(first_connector.client, second_connector.client)
+        self.assertEqual(second_connector.project, "my-project")
+        mock_load_gcp_credentials.assert_called_once()
+        mock_artifactregistry_v1.ArtifactRegistryClient.assert_called_once()
+        registry_connector._GCP_CLIENTS.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
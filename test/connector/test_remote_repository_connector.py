@@ -0,0 +1,131 @@
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_GRPC_CONNECTION, ERROR_GRPC_TIMEOUT
+
+from spaceone.repository.connector import remote_repository_connector
+from spaceone.repository.connector.remote_repository_connector import (
+    RemoteRepositoryConnector,
+)
+
+ENDPOINT = "grpc://marketplace:50051"
+
+
+def _make_client(response=None, side_effect=None):
+    client = MagicMock()
+    client.api_resources = {"Plugin": ["get", "list"]}
+    client.Plugin.get.return_value = response
+    client.Plugin.get.side_effect = side_effect
+    return client
+
+
+class TestRemoteRepositoryConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self):
+        self.patchers = [
+            patch.object(remote_repository_connector, "_CHANNEL_POOL", {}),
+            patch.object(remote_repository_connector.grpc, "insecure_channel"),
+            patch.object(remote_repository_connector.grpc, "channel_ready_future"),
+            patch.object(remote_repository_connector, "MessageToDict", lambda m, **k: m),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+        client_patcher = patch.object(remote_repository_connector, "GRPCClient")
+        self.mock_grpc_client = client_patcher.start()
+        self.patchers.append(client_patcher)
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_channel_is_reused(self):
+        self.mock_grpc_client.return_value = _make_client({"plugin_id": "a"})
+
+        for _ in range(3):
+            connector = RemoteRepositoryConnector(endpoint=ENDPOINT, token="token-a")
+            response = connector.dispatch("Plugin.get", {"plugin_id": "a"})
+
+        self.assertEqual(response, {"plugin_id": "a"})
+        self.assertEqual(self.mock_grpc_client.call_count, 1)
+        self.assertEqual(remote_repository_connector.grpc.insecure_channel.call_count, 1)
+
+        options = dict(
+            remote_repository_connector.grpc.insecure_channel.call_args.kwargs["options"]
+        )
+        self.assertIn("grpc.keepalive_time_ms", options)
+
+    def test_tokens_share_channel(self):
+        client = _make_client({"plugin_id": "a"})
+        self.mock_grpc_client.return_value = client
+
+        RemoteRepositoryConnector(endpoint=ENDPOINT, token="token-a").dispatch(
+            "Plugin.get", {}
+        )
+        RemoteRepositoryConnector(endpoint=ENDPOINT, token="token-b").dispatch(
+            "Plugin.get", {}
+        )
+
+        self.assertEqual(self.mock_grpc_client.call_count, 1)
+        self.assertEqual(
+            [dict(call.kwargs["metadata"])["token"] for call in client.Plugin.get.call_args_list],
+            ["token-a", "token-b"],
+        )
+
+    def test_connection_error_discards_channel(self):
+        self.mock_grpc_client.return_value = _make_client(
+            side_effect=ERROR_GRPC_CONNECTION(channel=ENDPOINT, message="unavailable")
+        )
+
+        connector = RemoteRepositoryConnector(endpoint=ENDPOINT, token="token-a")
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            connector.dispatch("Plugin.get", {})
+
+        self.assertNotIn(ENDPOINT, remote_repository_connector._CHANNEL_POOL)
+
+    def test_channel_not_ready(self):
+        remote_repository_connector.grpc.channel_ready_future.return_value.result.side_effect = (
+            Exception()
+        )
+
+        connector = RemoteRepositoryConnector(endpoint=ENDPOINT, token="token-a")
+        with self.assertRaises(ERROR_GRPC_CONNECTION):
+            connector.dispatch("Plugin.get", {})
+
+        self.assertNotIn(ENDPOINT, remote_repository_connector._CHANNEL_POOL)
+
+    def test_call_timeout_is_cut_to_deadline(self):
+        call_details = MagicMock(timeout=180)
+        continuation = MagicMock()
+
+        with patch.object(
+            remote_repository_connector,
+            "get_deadline",
+            return_value=time.monotonic() + 2,
+        ):
+            remote_repository_connector._DeadlineInterceptor().intercept_unary_unary(
+                continuation, call_details, {}
+            )
+
+        self.assertLessEqual(continuation.call_args.args[0].timeout, 2)
+
+    def test_deadline_passed(self):
+        self.mock_grpc_client.return_value = _make_client({"plugin_id": "a"})
+
+        connector = RemoteRepositoryConnector(endpoint=ENDPOINT, token="token-a")
+        with patch.object(
+            remote_repository_connector, "get_deadline", return_value=time.monotonic()
+        ):
+            with self.assertRaises(ERROR_GRPC_TIMEOUT):
+                connector.dispatch("Plugin.get", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
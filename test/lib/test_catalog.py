@@ -0,0 +1,104 @@
+import unittest
+
+from spaceone.repository.error import *
+from spaceone.repository.lib.catalog import Catalog
+
+_RECORDS = [
+    {"plugin_id": "plugin-aws-ec2", "name": "AWS EC2 Collector", "provider": "aws", "resource_type": "inventory.Collector"},
+    {"plugin_id": "plugin-azure-vm", "name": "Azure VM Collector", "provider": "azure", "resource_type": "inventory.Collector"},
+    {"plugin_id": "plugin-aws-cloudwatch", "name": "AWS CloudWatch", "provider": "aws", "resource_type": "monitoring.DataSource"},
+    {"plugin_id": "plugin-email", "name": "Email Notification", "resource_type": "notification.Protocol", "docs": {"ko": "..."}},
+]
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = Catalog(_RECORDS, index_keys=["plugin_id", "name", "resource_type", "provider"])
+
+    def test_lookup(self):
+        positions = self.catalog.lookup("plugin_id", "plugin-azure-vm")
+
+        self.assertEqual(self.catalog.materialize(positions)[0]["name"], "Azure VM Collector")
+        self.assertEqual(self.catalog.lookup("plugin_id", "plugin-unknown"), ())
+
+    def test_missing_values_are_filled(self):
+        record = self.catalog.get_record(0)
+
+        self.assertEqual(record["docs"], "")
+        self.assertEqual(self.catalog.lookup("provider", ""), (3,))
+
+    def test_filter(self):
+        self.assertEqual(self.catalog.filter(provider="aws"), [0, 2])
+        self.assertEqual(self.catalog.filter(provider="aws", resource_type="inventory.Collector"), [0])
+        self.assertEqual(self.catalog.filter(keyword="collector"), [0, 1])
+        self.assertEqual(self.catalog.filter(provider="gcp"), [])
+        self.assertEqual(self.catalog.filter(name=None), [0, 1, 2, 3])
+
+    def test_sort_and_page(self):
+        positions = self.catalog.sort(self.catalog.filter(), [{"key": "name", "desc": True}])
+
+        self.assertEqual(positions, [3, 1, 0, 2])
+        self.assertEqual(self.catalog.page(positions, {"start": 2, "limit": 2}), [1, 0])
+
+        with self.assertRaises(ERROR_SORT_KEY):
+            self.catalog.sort(positions, [{"key": "unknown"}])
+
+    def test_multi_key_sort(self):
+        positions = self.catalog.sort(
+            self.catalog.filter(),
+            [{"key": "provider"}, {"key": "name", "desc": True}],
+        )
+
+        self.assertEqual(positions, [3, 0, 2, 1])
+
+    def test_query(self):
+        positions = self.catalog.query(
+            filter=[
+                {"k": "provider", "v": ["aws", "azure"], "o": "in"},
+                {"k": "name", "v": "collector", "o": "contain"},
+            ],
+            filter_or=[
+                {"k": "plugin_id", "v": "plugin-azure-vm", "o": "eq"},
+                {"k": "plugin_id", "v": "plugin-aws-ec2", "o": "eq"},
+            ],
+        )
+        self.assertEqual(positions, [0, 1])
+
+        positions = self.catalog.query(
+            [0, 2, 3], filter=[{"k": "state", "v": "ENABLED", "o": "eq"}],
+            fields={"state": lambda record: "ENABLED"},
+        )
+        self.assertEqual(positions, [0, 2, 3])
+
+    def test_keyword_search(self):
+        catalog = Catalog(
+            _RECORDS, index_keys=["plugin_id"], search_fields={"name": 1.0, "provider": 1.0}
+        )
+
+        self.assertEqual(catalog.filter(keyword="aws"), [0, 2])
+        self.assertEqual(catalog.filter(keyword="coll", provider="azure"), [1])
+        self.assertEqual(catalog.rank([1, 0], "aws collector"), [0, 1])
+
+    def test_materialize_only(self):
+        records = self.catalog.materialize([0], only=["plugin_id", "provider"])
+
+        self.assertEqual(records, [{"plugin_id": "plugin-aws-ec2", "provider": "aws"}])
+
+    def test_materialize_does_not_change_catalog(self):
+        plugin_info = self.catalog.materialize([0])[0]
+        plugin_info["image"] = "changed"
+
+        self.assertNotIn("image", self.catalog.get_record(0))
+
+    def test_materialize_does_not_share_nested_values(self):
+        plugin_info = self.catalog.materialize([3])[0]
+        plugin_info["docs"]["en"] = "changed"
+
+        self.assertEqual(self.catalog.materialize([3])[0]["docs"], {"ko": "..."})
+        self.assertEqual(
+            self.catalog.materialize([3], only=["docs"])[0]["docs"], {"ko": "..."}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
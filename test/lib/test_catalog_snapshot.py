@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from spaceone.repository.lib import catalog_snapshot
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = os.path.join(self.temp_dir.name, "plugin")
+        self.snapshot_path = os.path.join(self.temp_dir.name, "plugin.snapshot")
+        os.mkdir(self.base_dir)
+        self._write_yaml("plugin-a.yaml", "plugin_id: plugin-a\nname: Plugin A\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_yaml(self, filename, content):
+        with open(os.path.join(self.base_dir, filename), "w") as f:
+            f.write(content)
+
+    def test_load_records_from_snapshot(self):
+        catalog_snapshot.build_snapshot(self.base_dir, self.snapshot_path)
+
+        with patch.object(catalog_snapshot, "load_yaml_records") as mock_load_yaml_records:
+            records = catalog_snapshot.load_records(self.base_dir, self.snapshot_path)
+
+        self.assertEqual(records, [{"plugin_id": "plugin-a", "name": "Plugin A"}])
+        mock_load_yaml_records.assert_not_called()
+
+    def test_load_records_when_snapshot_is_outdated(self):
+        catalog_snapshot.build_snapshot(self.base_dir, self.snapshot_path)
+        self._write_yaml("plugin-b.yaml", "plugin_id: plugin-b\nname: Plugin B\n")
+
+        records = catalog_snapshot.load_records(self.base_dir, self.snapshot_path)
+
+        self.assertEqual([record["plugin_id"] for record in records], ["plugin-a", "plugin-b"])
+
+    def test_load_records_without_snapshot(self):
+        records = catalog_snapshot.load_records(self.base_dir, self.snapshot_path)
+
+        self.assertEqual(records, [{"plugin_id": "plugin-a", "name": "Plugin A"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import datetime
+import unittest
+
+from bson import ObjectId
+from spaceone.core.error import *
+
+from spaceone.repository.lib.cursor import (
+    CursorPage,
+    compare_keyset,
+    decode_token,
+    encode_token,
+    make_cursor,
+)
+
+_SORT = [{"key": "name"}]
+_REPOSITORIES = {
+    "repo-managed": [{"id": f"m{i}", "name": f"plugin-{i:02d}"} for i in range(0, 10, 2)],
+    "repo-local": [{"id": f"l{i}", "name": f"plugin-{i:02d}"} for i in range(1, 10, 2)],
+}
+_REPOS_INFO = [{"repository_id": repository_id} for repository_id in _REPOSITORIES]
+
+
+def _list_by_cursor(repo_info, query, cursor):
+    rows = _REPOSITORIES[repo_info["repository_id"]]
+    if cursor:
+        rows = [row for row in rows if compare_keyset(row, cursor, query["sort"], "id") > 0]
+
+    return rows[: query["page"]["limit"]], len(_REPOSITORIES[repo_info["repository_id"]])
+
+
+def _advance_cursor(repo_info, cursor, consumed_rows):
+    return make_cursor(consumed_rows[-1], _SORT, "id")
+
+
+class TestCursor(unittest.TestCase):
+    def test_token(self):
+        state = {
+            "values": [datetime.datetime(2024, 1, 2, 3, 4, 5)],
+            "id": ObjectId("65a1b2c3d4e5f60718293a4b"),
+        }
+
+        self.assertEqual(decode_token(encode_token(state)), state)
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            decode_token("not-a-token")
+
+    def _list_page(self, query, next_token):
+        cursor_page = CursorPage(query, next_token)
+        responses = [
+            None
+            if cursor_page.is_done(repo_info["repository_id"])
+            else _list_by_cursor(
+                repo_info,
+                cursor_page.repo_query,
+                cursor_page.get_cursor(repo_info["repository_id"]),
+            )
+            for repo_info in _REPOS_INFO
+        ]
+        return cursor_page.merge(_REPOS_INFO, responses, _advance_cursor)
+
+    def test_list_all_pages(self):
+        query = {"sort": _SORT, "page": {"limit": 4}}
+        names = []
+        next_token = ""
+
+        for _ in range(5):
+            results, total_count, next_token = self._list_page(query, next_token)
+            names += [result["name"] for result in results]
+            self.assertEqual(total_count, 10)
+
+            if next_token == "":
+                break
+
+        self.assertEqual(names, [f"plugin-{i:02d}" for i in range(10)])
+
+    def test_token_is_bound_to_query(self):
+        results, total_count, next_token = self._list_page(
+            {"sort": _SORT, "page": {"limit": 4}}, ""
+        )
+
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            CursorPage({"sort": [{"key": "id"}], "page": {"limit": 4}}, next_token)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import threading
+import time
+import unittest
+
+from spaceone.core.transaction import create_transaction, delete_transaction, get_transaction
+
+from spaceone.repository.lib.fan_out import FanOut, FanOutTimeout, get_deadline
+
+
+class TestFanOut(unittest.TestCase):
+    def setUp(self):
+        self.fan_out = FanOut(max_workers=4)
+        create_transaction(
+            thread_id=str(threading.current_thread().ident), meta={"domain_id": "domain-1"}
+        )
+
+    def tearDown(self):
+        delete_transaction()
+
+    def test_results_in_call_order(self):
+        def _sleep_and_return(value, seconds):
+            time.sleep(seconds)
+            return value
+
+        responses = self.fan_out.run(
+            [(_sleep_and_return, ("a", 0.1)), (_sleep_and_return, ("b", 0))]
+        )
+
+        self.assertEqual(responses, [("a", None), ("b", None)])
+
+    def test_timeout_and_error(self):
+        def _raise_error():
+            raise ValueError("failed")
+
+        responses = self.fan_out.run(
+            [(time.sleep, (0.5,)), (_raise_error, ())], timeout=0.1
+        )
+
+        self.assertIsInstance(responses[0][1], FanOutTimeout)
+        self.assertIsInstance(responses[1][1], ValueError)
+
+    def test_transaction_is_propagated(self):
+        def _get_domain_id():
+            return get_transaction().get_meta("domain_id")
+
+        responses = self.fan_out.run([(_get_domain_id, ()), (_get_domain_id, ())])
+
+        self.assertEqual(responses, [("domain-1", None), ("domain-1", None)])
+
+    def test_call_without_transaction(self):
+        future = self.fan_out._get_executor().submit(
+            FanOut._call_in_transaction, None, None, lambda: "a", ()
+        )
+
+        self.assertEqual(future.result(), "a")
+
+    def test_inline_calls_do_not_wait_for_workers(self):
+        fan_out = FanOut(max_workers=1)
+        caller_thread = threading.current_thread()
+
+        def _is_caller_thread():
+            return threading.current_thread() is caller_thread
+
+        # The only worker is busy with the hung call
+        responses = fan_out.run(
+            [(time.sleep, (0.3,)), (time.sleep, (0.3,)), (_is_caller_thread, ())],
+            timeout=0.1,
+            inline=[2],
+        )
+
+        self.assertIsInstance(responses[0][1], FanOutTimeout)
+        self.assertIsInstance(responses[1][1], FanOutTimeout)
+        self.assertEqual(responses[2], (True, None))
+
+    def test_deadline_is_visible_to_calls(self):
+        started_at = time.monotonic()
+        responses = self.fan_out.run([(get_deadline, ()), (get_deadline, ())], timeout=5)
+
+        for deadline, error in responses:
+            self.assertAlmostEqual(deadline - started_at, 5, delta=0.5)
+
+        self.assertIsNone(get_deadline())
+
+    def test_hedge(self):
+        delays = [0.5, 0]
+
+        def _call():
+            delay = delays.pop(0)
+            time.sleep(delay)
+            return delay
+
+        # The second call is sent after 0.05s and finishes first
+        self.assertEqual(self.fan_out.hedge(_call, (), delay=0.05), 0)
+
+    def test_hedge_not_sent_for_fast_call(self):
+        calls = []
+
+        def _call():
+            calls.append(get_transaction().get_meta("domain_id"))
+            return "ok"
+
+        self.assertEqual(self.fan_out.hedge(_call, (), delay=1), "ok")
+        self.assertEqual(calls, ["domain-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
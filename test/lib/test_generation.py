@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.repository.lib import generation
+from spaceone.repository.lib.generation import bump_generation, get_generation
+
+
+class _MockCache:
+    def __init__(self, is_set=True):
+        self.data = {}
+        self._is_set = is_set
+
+    def is_set(self, alias="default"):
+        return self._is_set
+
+    def get(self, key, alias="default"):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None, alias="default"):
+        self.data[key] = value
+
+
+class TestGeneration(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(generation, "_LOCAL_GENERATIONS", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_shared_generation(self):
+        mock_cache = _MockCache()
+        with patch.object(generation, "cache", mock_cache):
+            self.assertIsNone(get_generation("plugin"))
+
+            first = bump_generation("plugin")
+            self.assertEqual(get_generation("plugin"), first)
+            self.assertIn("repository:generation:plugin", mock_cache.data)
+
+            self.assertNotEqual(bump_generation("plugin"), first)
+            self.assertIsNone(get_generation("template"))
+
+    def test_local_generation_without_cache(self):
+        with patch.object(generation, "cache", _MockCache(is_set=False)):
+            current = bump_generation("plugin")
+            self.assertEqual(get_generation("plugin"), current)
+            self.assertEqual(generation._LOCAL_GENERATIONS, {"plugin": current})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import datetime
+import unittest
+
+from spaceone.repository.lib.merge import (
+    compare_values,
+    make_repository_query,
+    merge_results,
+    remove_added_keys,
+)
+
+_MANAGED = [
+    {"name": "AWS EC2", "provider": "aws"},
+    {"name": "Azure VM", "provider": "azure"},
+    {"name": "Email", "provider": None},
+]
+_LOCAL = [
+    {"name": "AWS Lambda", "provider": "aws"},
+    {"name": "Slack", "provider": "slack"},
+]
+
+
+class TestMerge(unittest.TestCase):
+    def test_make_repository_query(self):
+        query = {
+            "sort": [{"key": "provider"}],
+            "page": {"start": 3, "limit": 2},
+            "only": ["name"],
+        }
+
+        repo_query = make_repository_query(query)
+
+        self.assertEqual(repo_query["page"], {"start": 1, "limit": 4})
+        self.assertEqual(repo_query["only"], ["name", "provider"])
+        self.assertEqual(query["page"], {"start": 3, "limit": 2})
+
+    def test_merge_sorted_results(self):
+        results = merge_results(
+            [sorted(_MANAGED, key=lambda r: r["name"]), _LOCAL],
+            sort=[{"key": "name"}],
+            page={"start": 2, "limit": 3},
+        )
+
+        self.assertEqual(
+            [result["name"] for result in results], ["AWS Lambda", "Azure VM", "Email"]
+        )
+
+    def test_merge_multi_key_desc(self):
+        sort = [{"key": "provider", "desc": True}, {"key": "name"}]
+        managed = [_MANAGED[1], _MANAGED[0], _MANAGED[2]]
+        local = [_LOCAL[1], _LOCAL[0]]
+
+        results = merge_results([managed, local], sort=sort)
+
+        self.assertEqual(
+            [result["name"] for result in results],
+            ["Slack", "Azure VM", "AWS EC2", "AWS Lambda", "Email"],
+        )
+
+    def test_merge_without_sort(self):
+        results = merge_results([_MANAGED, _LOCAL], page={"start": 3, "limit": 2})
+
+        self.assertEqual([result["name"] for result in results], ["Email", "AWS Lambda"])
+
+    def test_remove_added_keys(self):
+        results = [{"name": "AWS EC2", "provider": "aws", "plugin_id": "plugin-1"}]
+
+        remove_added_keys(results, ["name"], ["provider", "plugin_id", "name"])
+        self.assertEqual(results, [{"name": "AWS EC2"}])
+
+        results = [{"name": "AWS EC2", "provider": "aws"}]
+        remove_added_keys(results, [], ["provider"])
+        self.assertEqual(results, [{"name": "AWS EC2", "provider": "aws"}])
+
+    def test_merge_datetimes_and_iso_strings(self):
+        local = [{"name": "Local", "updated_at": datetime.datetime(2024, 1, 2)}]
+        remote = [
+            {"name": "Remote 1", "updated_at": "2024-01-01T00:00:00Z"},
+            {"name": "Remote 2", "updated_at": "2024-01-03T09:00:00+09:00"},
+        ]
+
+        results = merge_results([local, remote], sort=[{"key": "updated_at"}])
+
+        self.assertEqual(
+            [result["name"] for result in results], ["Remote 1", "Local", "Remote 2"]
+        )
+        self.assertEqual(
+            compare_values(datetime.datetime(2024, 1, 1), "2024-01-01T00:00:00Z"), 0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
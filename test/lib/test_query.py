@@ -0,0 +1,62 @@
+import unittest
+
+from spaceone.core.error import *
+from spaceone.repository.lib.query import MISSING, get_value, make_matcher, project
+
+_RECORD = {
+    "plugin_id": "plugin-aws-ec2",
+    "name": "AWS EC2 Collector",
+    "labels": ["Compute", "EC2"],
+    "tags": {"description": "Collect EC2 instances", "priority": 3},
+    "capability": {"supported_schema": [{"name": "aws_access_key"}]},
+    "docs": "",
+}
+
+
+class TestQuery(unittest.TestCase):
+    def _match(self, key, value, operator):
+        return make_matcher({"k": key, "v": value, "o": operator})(_RECORD)
+
+    def test_get_value(self):
+        self.assertEqual(get_value(_RECORD, "tags.priority"), 3)
+        self.assertEqual(
+            get_value(_RECORD, "capability.supported_schema.name"), ["aws_access_key"]
+        )
+        self.assertIs(get_value(_RECORD, "tags.unknown"), MISSING)
+
+    def test_operators(self):
+        self.assertTrue(self._match("plugin_id", "plugin-aws-ec2", "eq"))
+        self.assertTrue(self._match("labels", "EC2", "eq"))
+        self.assertTrue(self._match("labels", "Storage", "not"))
+        self.assertTrue(self._match("name", "ec2", "contain"))
+        self.assertTrue(self._match("name", ["azure", "gcp"], "not_contain_in"))
+        self.assertTrue(self._match("labels", ["Storage", "Compute"], "in"))
+        self.assertFalse(self._match("labels", ["Storage"], "in"))
+        self.assertTrue(self._match("tags.priority", 2, "gt"))
+        self.assertFalse(self._match("tags.priority", 3, "lt"))
+        self.assertTrue(self._match("name", "^aws", "regex"))
+        self.assertTrue(self._match("docs", False, "exists"))
+        self.assertTrue(self._match("tags.description", True, "exists"))
+        self.assertTrue(
+            self._match("capability.supported_schema", {"name": "aws_access_key"}, "match")
+        )
+
+    def test_invalid_conditions(self):
+        with self.assertRaises(ERROR_DB_QUERY):
+            make_matcher({"k": "name", "v": "aws", "o": "unknown"})
+
+        with self.assertRaises(ERROR_OPERATOR_LIST_VALUE_TYPE):
+            make_matcher({"k": "name", "v": "aws", "o": "in"})
+
+        with self.assertRaises(ERROR_OPERATOR_VALUE_TYPE):
+            make_matcher({"k": "name", "v": ["aws"], "o": "eq"})
+
+    def test_project(self):
+        self.assertEqual(
+            project(_RECORD, ["plugin_id", "tags.priority", "unknown"]),
+            {"plugin_id": "plugin-aws-ec2", "tags": {"priority": 3}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import MagicMock
+
+from spaceone.repository.lib.response_cache import ResponseCache, make_cache_key
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.response_cache = ResponseCache()
+
+    def test_make_cache_key(self):
+        repo_info = {"endpoint": "grpc://a", "repository_id": "repo-a", "token": "token-a"}
+
+        self.assertEqual(
+            make_cache_key(repo_info, "Plugin.list", {"filter": [], "sort": []}),
+            make_cache_key(repo_info, "Plugin.list", {"sort": [], "filter": []}),
+        )
+        for changed in [
+            {"endpoint": "grpc://b"},
+            {"repository_id": "repo-b"},
+            {"token": "token-b"},
+        ]:
+            self.assertNotEqual(
+                make_cache_key(repo_info, "Plugin.list", {}),
+                make_cache_key({**repo_info, **changed}, "Plugin.list", {}),
+            )
+
+        self.assertNotIn("token-a", str(make_cache_key(repo_info, "Plugin.list", {})))
+
+    def test_cached_until_ttl(self):
+        fetch_fn = MagicMock(side_effect=[{"total_count": 1}, {"total_count": 2}])
+
+        for _ in range(3):
+            response = self.response_cache.get("key", fetch_fn, ttl=60)
+
+        self.assertEqual(response, {"total_count": 1})
+        self.assertEqual(fetch_fn.call_count, 1)
+
+    def test_disabled(self):
+        fetch_fn = MagicMock(return_value={})
+
+        self.response_cache.get("key", fetch_fn, ttl=0)
+        self.response_cache.get("key", fetch_fn, ttl=0)
+
+        self.assertEqual(fetch_fn.call_count, 2)
+
+    def test_revision_check(self):
+        fetch_fn = MagicMock(side_effect=[{"total_count": 1}, {"total_count": 2}])
+        revision_fn = MagicMock(side_effect=[(1, "a"), (1, "a"), (2, "b")])
+
+        # Expired right away, so every call checks the revision
+        responses = [
+            self.response_cache.get("key", fetch_fn, ttl=1e-9, revision_fn=revision_fn)
+            for _ in range(3)
+        ]
+
+        self.assertEqual(
+            responses, [{"total_count": 1}, {"total_count": 1}, {"total_count": 2}]
+        )
+        self.assertEqual(fetch_fn.call_count, 2)
+
+    def test_fetch_error_is_not_cached(self):
+        fetch_fn = MagicMock(side_effect=[Exception("unavailable"), {"total_count": 1}])
+
+        with self.assertRaises(Exception):
+            self.response_cache.get("key", fetch_fn, ttl=60)
+
+        self.assertEqual(
+            self.response_cache.get("key", fetch_fn, ttl=60), {"total_count": 1}
+        )
+
+    def test_max_size(self):
+        for key in ["a", "b", "c"]:
+            self.response_cache.get(key, lambda: key, ttl=60, max_size=2)
+
+        self.assertEqual(len(self.response_cache._entries), 2)
+        self.assertIn("c", self.response_cache._entries)
+
+
+if __name__ == "__main__":
+    unittest.main()
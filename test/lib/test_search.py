@@ -0,0 +1,55 @@
+import unittest
+
+from spaceone.repository.lib.search import SearchIndex, tokenize
+
+_DOCUMENTS = [
+    ("plugin-aws-ec2", {"name": "AWS EC2 Collector", "labels": ["Compute"], "tags": {"description": "Collect EC2 instances"}}),
+    ("plugin-aws-cloudwatch", {"name": "AWS CloudWatch", "labels": ["Monitoring"], "tags": {"description": "Metrics of EC2 and RDS"}}),
+    ("plugin-azure-vm", {"name": "Azure VM Collector", "labels": ["Compute"], "tags": {"long_description": "Virtual machines"}}),
+]
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.search_index = SearchIndex(_DOCUMENTS)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("AWS-EC2 Collector"), ["aws", "ec2", "collector"])
+        self.assertEqual(tokenize(["Compute", None]), ["compute"])
+        self.assertEqual(tokenize("AWS 비용 수집기"), ["aws", "비용", "수집기"])
+
+    def test_search_ranks_name_matches_first(self):
+        self.assertEqual(
+            self.search_index.search("ec2"), ["plugin-aws-ec2", "plugin-aws-cloudwatch"]
+        )
+
+    def test_search_matches_all_tokens_by_prefix(self):
+        self.assertEqual(self.search_index.search("collect comp"), ["plugin-aws-ec2", "plugin-azure-vm"])
+        self.assertEqual(self.search_index.search("virtual azure"), ["plugin-azure-vm"])
+        self.assertEqual(self.search_index.search("gcp"), [])
+        self.assertEqual(self.search_index.search(""), [])
+
+    def test_search_non_ascii(self):
+        search_index = SearchIndex([("plugin-cost", {"name": "AWS 비용 수집기"})])
+
+        self.assertEqual(search_index.search("비용"), ["plugin-cost"])
+        self.assertEqual(search_index.search("수집"), ["plugin-cost"])
+
+    def test_search_matches_substring(self):
+        # No token starts with "ws", so the names are matched as substrings
+        self.assertEqual(
+            self.search_index.search("ws"), ["plugin-aws-ec2", "plugin-aws-cloudwatch"]
+        )
+        self.assertEqual(self.search_index.search("zure vm"), ["plugin-azure-vm"])
+
+    def test_search_ranks_token_matches_before_substring_matches(self):
+        search_index = SearchIndex(_DOCUMENTS + [("plugin-wso2", {"name": "WSO2 Gateway"})])
+
+        self.assertEqual(
+            search_index.search("ws"),
+            ["plugin-wso2", "plugin-aws-ec2", "plugin-aws-cloudwatch"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import threading
+import time
+import unittest
+
+from spaceone.repository.lib.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_result(self):
+        single_flight = SingleFlight()
+        call_count = []
+        results = []
+
+        def _get_tags():
+            call_count.append(1)
+            time.sleep(0.2)
+            return ["1.0.0"]
+
+        def _worker():
+            results.append(single_flight.do("plugin-a", _get_tags))
+
+        threads = [threading.Thread(target=_worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(call_count), 1)
+        self.assertEqual(results, [["1.0.0"]] * 10)
+        self.assertFalse(single_flight.in_flight("plugin-a"))
+
+    def test_concurrent_calls_share_exception(self):
+        single_flight = SingleFlight()
+        errors = []
+
+        def _get_tags():
+            time.sleep(0.2)
+            raise ValueError("registry error")
+
+        def _worker():
+            try:
+                single_flight.do("plugin-a", _get_tags)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 5)
+        self.assertEqual(len(set(map(id, errors))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
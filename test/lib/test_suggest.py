@@ -0,0 +1,44 @@
+import unittest
+
+from spaceone.repository.lib.suggest import SuggestIndex
+
+_RECORDS = [
+    {"plugin_id": "plugin-aws-ec2", "name": "AWS EC2 Collector", "labels": ["Compute"], "provider": "aws", "resource_type": "inventory.Collector"},
+    {"plugin_id": "plugin-aws-cloudwatch", "name": "AWS CloudWatch", "labels": ["Monitoring"], "provider": "aws", "resource_type": "monitoring.DataSource"},
+    {"plugin_id": "plugin-azure-vm", "name": "Azure VM Collector", "labels": ["Compute"], "provider": "azure", "resource_type": "inventory.Collector"},
+]
+
+
+class TestSuggestIndex(unittest.TestCase):
+    def setUp(self):
+        self.suggest_index = SuggestIndex(_RECORDS)
+
+    def test_suggest(self):
+        suggestions = self.suggest_index.suggest("AW", limit=3)
+
+        self.assertEqual(
+            suggestions,
+            [
+                {"type": "name", "value": "AWS CloudWatch", "plugin_id": "plugin-aws-cloudwatch"},
+                {"type": "name", "value": "AWS EC2 Collector", "plugin_id": "plugin-aws-ec2"},
+                {"type": "provider", "value": "aws"},
+            ],
+        )
+
+    def test_suggest_word_start(self):
+        values = [suggestion["value"] for suggestion in self.suggest_index.suggest("coll")]
+
+        self.assertEqual(values, ["AWS EC2 Collector", "Azure VM Collector"])
+
+    def test_suggest_by_resource_type(self):
+        values = [
+            suggestion["value"]
+            for suggestion in self.suggest_index.suggest("a", resource_type="inventory.Collector")
+        ]
+
+        self.assertEqual(values, ["AWS EC2 Collector", "Azure VM Collector", "aws", "azure"])
+        self.assertEqual(self.suggest_index.suggest(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
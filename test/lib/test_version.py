@@ -0,0 +1,44 @@
+import unittest
+
+from spaceone.repository.error import *
+from spaceone.repository.lib.version import parse_version, sort_tags, resolve_version
+
+
+class TestVersion(unittest.TestCase):
+    def test_sort_tags(self):
+        tags = ["1.2.0", "latest", "1.10.0", "sha-3f2a1b", "1.10.0rc1", "v1.9.1", "1.2"]
+
+        self.assertEqual(
+            sort_tags(tags),
+            ["1.10.0", "1.10.0rc1", "v1.9.1", "1.2.0", "1.2", "latest", "sha-3f2a1b"],
+        )
+
+    def test_sort_tags_is_deterministic(self):
+        tags = ["latest", "dev", "1.0.0", "stable"]
+
+        self.assertEqual(sort_tags(tags), sort_tags(list(reversed(tags))))
+
+    def test_parse_version(self):
+        self.assertIsNone(parse_version("latest"))
+        self.assertIs(parse_version("1.0.0"), parse_version("1.0.0"))
+
+    def test_resolve_version(self):
+        tags = ["latest", "1.11.3", "1.12.0", "1.12.1", "2.0.0rc1", "sha-3f2a1b"]
+
+        self.assertEqual(resolve_version(tags, "latest"), "2.0.0rc1")
+        self.assertEqual(resolve_version(tags, "latest-stable"), "1.12.1")
+        self.assertEqual(resolve_version(tags, ">=1.11,<1.12.1"), "1.12.0")
+        self.assertEqual(resolve_version(tags, "sha-3f2a1b"), "sha-3f2a1b")
+
+    def test_resolve_version_errors(self):
+        tags = ["1.0.0", "latest"]
+
+        with self.assertRaises(ERROR_NO_MATCHING_VERSION):
+            resolve_version(tags, ">=2")
+
+        with self.assertRaises(ERROR_INVALID_VERSION_CONSTRAINT):
+            resolve_version(tags, "newest")
+
+
+if __name__ == "__main__":
+    unittest.main()
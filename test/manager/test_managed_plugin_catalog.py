@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from spaceone.repository.lib import catalog_snapshot
+from spaceone.repository.manager.plugin_manager import managed_plugin_manager
+
+
+class TestManagedPluginCatalogReload(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = os.path.join(self.temp_dir.name, "plugin")
+        os.mkdir(self.base_dir)
+        self._write_yaml("plugin-a.yaml", "plugin_id: plugin-a\nname: Plugin A\n")
+
+        self.patchers = [
+            patch.object(catalog_snapshot, "MANAGED_PLUGIN_DIR", self.base_dir),
+            patch.object(
+                catalog_snapshot,
+                "MANAGED_PLUGIN_SNAPSHOT_PATH",
+                os.path.join(self.temp_dir.name, "plugin.snapshot"),
+            ),
+            patch.object(
+                managed_plugin_manager,
+                "_MANAGED_PLUGIN_CATALOG",
+                managed_plugin_manager.get_managed_plugin_catalog(),
+            ),
+            patch.object(managed_plugin_manager, "_CATALOG_SOURCE_SIGNATURE", ()),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+        self.temp_dir.cleanup()
+
+    def _write_yaml(self, filename, content):
+        with open(os.path.join(self.base_dir, filename), "w") as f:
+            f.write(content)
+
+    def test_reload_swaps_catalog(self):
+        old_catalog = managed_plugin_manager.get_managed_plugin_catalog()
+
+        new_catalog = managed_plugin_manager.reload_managed_plugin_catalog()
+
+        self.assertIs(managed_plugin_manager.get_managed_plugin_catalog(), new_catalog)
+        self.assertEqual(new_catalog.generation, old_catalog.generation + 1)
+        self.assertEqual(new_catalog.lookup("plugin_id", "plugin-a"), (0,))
+
+        # The previous catalog is left untouched for in-flight requests
+        self.assertEqual(old_catalog.lookup("plugin_id", "plugin-a"), ())
+
+    def test_source_signature_changes_with_files(self):
+        managed_plugin_manager.reload_managed_plugin_catalog()
+        signature = managed_plugin_manager._CATALOG_SOURCE_SIGNATURE
+        self.assertEqual(managed_plugin_manager._get_source_signature(), signature)
+
+        self._write_yaml("plugin-b.yaml", "plugin_id: plugin-b\nname: Plugin B\n")
+
+        self.assertNotEqual(managed_plugin_manager._get_source_signature(), signature)
+
+
+if __name__ == "__main__":
+    unittest.main()
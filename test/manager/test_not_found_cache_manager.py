@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.error import ERROR_NOT_FOUND, ERROR_UNKNOWN
+
+from spaceone.repository.lib import generation
+from spaceone.repository.manager import not_found_cache_manager
+from spaceone.repository.manager.not_found_cache_manager import (
+    NotFoundCacheManager,
+    is_not_found_error,
+)
+
+
+class TestNotFoundCacheManager(unittest.TestCase):
+    def setUp(self):
+        self.patcher = patch.object(not_found_cache_manager, "_NOT_FOUND", {})
+        self.patcher.start()
+        self.generation_patcher = patch.object(generation, "_LOCAL_GENERATIONS", {})
+        self.generation_patcher.start()
+        self.not_found_cache_mgr = NotFoundCacheManager()
+
+    def tearDown(self):
+        self.generation_patcher.stop()
+        self.patcher.stop()
+
+    def test_set_not_found(self):
+        self.not_found_cache_mgr.set_not_found("Plugin", "plugin-a", None, "domain-a")
+
+        self.assertTrue(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-a", None, "domain-a")
+        )
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-a", None, "domain-b")
+        )
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found(
+                "DashboardTemplate", "plugin-a", None, "domain-a"
+            )
+        )
+
+    def test_expired(self):
+        self.not_found_cache_mgr.not_found_cache_ttl = 0
+        self.not_found_cache_mgr.set_not_found("Plugin", "plugin-a", None, "domain-a")
+
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-a", None, "domain-a")
+        )
+
+    def test_delete_not_found(self):
+        for plugin_id in ["plugin-a", "plugin-b"]:
+            self.not_found_cache_mgr.set_not_found("Plugin", plugin_id, None, None)
+        self.not_found_cache_mgr.set_not_found("DashboardTemplate", "plugin-a", None, None)
+
+        NotFoundCacheManager.delete_not_found("Plugin", "plugin-a")
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-a", None, None)
+        )
+        self.assertTrue(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-b", None, None)
+        )
+
+        NotFoundCacheManager.delete_not_found("Plugin")
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-b", None, None)
+        )
+        self.assertTrue(
+            self.not_found_cache_mgr.is_not_found(
+                "DashboardTemplate", "plugin-a", None, None
+            )
+        )
+
+    def test_registered_on_other_replica(self):
+        self.not_found_cache_mgr.set_not_found("Plugin", "plugin-a", None, None)
+        self.not_found_cache_mgr.set_not_found("Plugin", "plugin-b", None, None)
+
+        # Registering through another replica only bumps the shared generation
+        generation.bump_generation("not-found:Plugin:plugin-a")
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-a", None, None)
+        )
+        self.assertTrue(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-b", None, None)
+        )
+
+        generation.bump_generation("not-found:Plugin")
+        self.assertFalse(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-b", None, None)
+        )
+
+    def test_size_limit(self):
+        self.not_found_cache_mgr.not_found_cache_size = 2
+        for plugin_id in ["plugin-a", "plugin-b", "plugin-c"]:
+            self.not_found_cache_mgr.set_not_found("Plugin", plugin_id, None, None)
+
+        self.assertLessEqual(len(not_found_cache_manager._NOT_FOUND), 2)
+        self.assertTrue(
+            self.not_found_cache_mgr.is_not_found("Plugin", "plugin-c", None, None)
+        )
+
+    def test_is_not_found_error(self):
+        self.assertTrue(is_not_found_error(ERROR_NOT_FOUND(key="plugin_id", value="a")))
+        self.assertTrue(
+            is_not_found_error(ERROR_UNKNOWN(message="ERROR_NO_DASHBOARD_TEMPLATE"))
+        )
+        self.assertFalse(is_not_found_error(ERROR_UNKNOWN(message="timeout")))
+        self.assertFalse(is_not_found_error(ValueError()))
+
+
+if __name__ == "__main__":
+    unittest.main()
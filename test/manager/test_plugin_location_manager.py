@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core.error import ERROR_NOT_FOUND, ERROR_UNKNOWN
+
+from spaceone.repository.lib import generation
+from spaceone.repository.manager import plugin_location_manager
+from spaceone.repository.manager.plugin_location_manager import PluginLocationManager
+
+REPOS_INFO = [
+    {"repository_id": "repo-remote", "name": "Remote", "repository_type": "REMOTE"},
+    {"repository_id": "repo-local", "name": "Local", "repository_type": "LOCAL"},
+]
+
+
+class TestPluginLocationManager(unittest.TestCase):
+    def setUp(self):
+        self.patcher = patch.object(plugin_location_manager, "_LOCATIONS", {})
+        self.patcher.start()
+        self.generation_patcher = patch.object(generation, "_LOCAL_GENERATIONS", {})
+        self.generation_patcher.start()
+        self.location_mgr = PluginLocationManager()
+
+    def tearDown(self):
+        self.generation_patcher.stop()
+        self.patcher.stop()
+
+    def _sort(self, plugin_id="plugin-a", domain_id="domain-a"):
+        repos_info = self.location_mgr.sort_repositories(
+            REPOS_INFO, plugin_id, domain_id
+        )
+        return [repo_info["repository_id"] for repo_info in repos_info]
+
+    def test_unknown_plugin_keeps_order(self):
+        self.assertEqual(self._sort(), ["repo-remote", "repo-local"])
+
+    def test_owner_first_and_missing_skipped(self):
+        self.location_mgr.set_location("plugin-a", "domain-a", "repo-local")
+        self.assertEqual(self._sort(), ["repo-local", "repo-remote"])
+
+        self.location_mgr.set_missing("plugin-a", "domain-a", "repo-remote")
+        self.assertEqual(self._sort(), ["repo-local"])
+        self.assertEqual(self._sort(domain_id="domain-b"), ["repo-remote", "repo-local"])
+
+    def test_expired_entries(self):
+        self.location_mgr.missing_ttl = -1
+        self.location_mgr.set_missing("plugin-a", "domain-a", "repo-remote")
+        self.assertEqual(self._sort(), ["repo-remote", "repo-local"])
+
+    def test_delete_location(self):
+        self.location_mgr.set_missing("plugin-a", "domain-a", "repo-local")
+        self.location_mgr.set_missing("plugin-a", None, "repo-local")
+        PluginLocationManager.delete_location("plugin-a", "domain-a")
+
+        self.assertEqual(self._sort(), ["repo-remote", "repo-local"])
+        self.assertEqual(self._sort(domain_id=None), ["repo-remote", "repo-local"])
+
+    def test_location_of_other_generation_is_ignored(self):
+        self.location_mgr.set_missing("plugin-a", "domain-a", "repo-local")
+        self.assertEqual(self._sort(), ["repo-remote"])
+
+        # A plugin registered through another replica bumps the shared generation
+        generation.bump_generation("plugin-location")
+        self.assertEqual(self._sort(), ["repo-remote", "repo-local"])
+
+    def test_is_not_found(self):
+        self.assertTrue(
+            PluginLocationManager.is_not_found(
+                ERROR_NOT_FOUND(key="plugin_id", value="plugin-a")
+            )
+        )
+        self.assertTrue(
+            PluginLocationManager.is_not_found(
+                ERROR_UNKNOWN(message="ERROR_NO_PLUGIN: Plugin not exists.")
+            )
+        )
+        self.assertFalse(
+            PluginLocationManager.is_not_found(ERROR_UNKNOWN(message="timeout"))
+        )
+        self.assertFalse(PluginLocationManager.is_not_found(ValueError()))
+
+
+if __name__ == "__main__":
+    unittest.main()
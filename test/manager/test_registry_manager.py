@@ -0,0 +1,131 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import cache, config
+from spaceone.repository.manager.registry_manager import RegistryManager
+
+
+class _MockCache:
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self, alias="default"):
+        return True
+
+    def get(self, key, alias="default"):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None, alias="default"):
+        self.data[key] = value
+
+    def delete(self, *keys, alias="default"):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class TestRegistryManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self):
+        self.cache = _MockCache()
+        patcher = patch("spaceone.repository.manager.registry_manager.cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(RegistryManager, "_fetch_tags", return_value=["1.1.0", "1.0.0"])
+    def test_get_tags_cached(self, mock_fetch_tags):
+        registry_mgr = RegistryManager()
+
+        self.assertEqual(
+            registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a"), ["1.1.0", "1.0.0"]
+        )
+        self.assertEqual(
+            registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a"), ["1.1.0", "1.0.0"]
+        )
+        self.assertEqual(mock_fetch_tags.call_count, 1)
+
+    @patch.object(RegistryManager, "_fetch_tags", return_value=["1.0.0"])
+    def test_delete_tags_cache(self, mock_fetch_tags):
+        registry_mgr = RegistryManager()
+
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a")
+        registry_mgr.delete_tags_cache("DOCKER_HUB", "cloudforet/plugin-a")
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a")
+
+        self.assertEqual(mock_fetch_tags.call_count, 2)
+
+    @patch.object(RegistryManager, "_fetch_tags", return_value=[])
+    def test_empty_tags_not_cached(self, mock_fetch_tags):
+        registry_mgr = RegistryManager()
+
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a")
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a")
+
+        self.assertEqual(mock_fetch_tags.call_count, 2)
+
+    @patch.object(RegistryManager, "_fetch_tags", return_value=["1.1.0", "1.0.0"])
+    def test_serve_stale_tags(self, mock_fetch_tags):
+        registry_mgr = RegistryManager()
+        registry_mgr.serve_stale = True
+        cache_key = registry_mgr._make_tags_cache_key(
+            "DOCKER_HUB", "registry.hub.docker.com", "cloudforet/plugin-a"
+        )
+        self.cache.set(cache_key, {"tags": ["1.0.0"], "cached_at": time.time() - 600})
+
+        with patch.object(RegistryManager, "_refresh_tags_in_background") as mock_refresh:
+            tags = registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a")
+
+        self.assertEqual(tags, ["1.0.0"])
+        mock_refresh.assert_called_once()
+        mock_fetch_tags.assert_not_called()
+
+        registry_mgr._refresh_tags(
+            cache_key, "DOCKER_HUB", "registry.hub.docker.com", "cloudforet/plugin-a"
+        )
+        self.assertEqual(
+            registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-a"), ["1.1.0", "1.0.0"]
+        )
+
+
+class TestRegistryManagerWithLocalCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        config.set_global_force(CACHES={"default": {"engine": "LocalCache"}})
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        config.set_global_force(CACHES={"default": {}})
+
+    @patch.object(RegistryManager, "_fetch_tags", return_value=["1.0.0"])
+    def test_get_tags_cached(self, mock_fetch_tags):
+        registry_mgr = RegistryManager()
+
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-b")
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-b")
+
+        self.assertEqual(mock_fetch_tags.call_count, 1)
+
+    @patch.object(RegistryManager, "_fetch_tags", return_value=["1.0.0"])
+    def test_delete_all_tags_cache(self, mock_fetch_tags):
+        registry_mgr = RegistryManager()
+
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-c")
+        registry_mgr.delete_tags_cache("DOCKER_HUB", "cloudforet/plugin-d")
+        registry_mgr.delete_tags_cache("DOCKER_HUB")
+        registry_mgr.get_tags("DOCKER_HUB", "cloudforet/plugin-c")
+
+        self.assertEqual(mock_fetch_tags.call_count, 2)
+        self.assertTrue(cache.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
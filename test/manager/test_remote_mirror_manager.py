@@ -0,0 +1,204 @@
+import datetime
+import unittest
+from unittest.mock import MagicMock
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config
+
+from spaceone.repository.manager import remote_mirror_manager
+from spaceone.repository.manager.remote_mirror_manager import RemoteMirrorManager
+from spaceone.repository.model.remote_mirror_model import RemotePlugin, RemoteSyncState
+
+REPO_INFO = {
+    "repository_id": "repo-remote",
+    "name": "Marketplace",
+    "repository_type": "REMOTE",
+    "endpoint": "grpc://marketplace:50051",
+    "token": "token",
+}
+
+
+def _make_plugin(plugin_id, updated_at, **kwargs):
+    return {
+        "plugin_id": plugin_id,
+        "name": plugin_id,
+        "domain_id": "domain-market",
+        "updated_at": updated_at,
+        **kwargs,
+    }
+
+
+class TestRemoteMirrorManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.repository")
+        config.set_service_config()
+        connect("test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        RemotePlugin.objects.delete()
+        RemoteSyncState.objects.delete()
+        remote_mirror_manager._SYNCED_AT.clear()
+
+        self.remote_plugins = [
+            _make_plugin(
+                "plugin-a",
+                "2024-01-01T00:00:00.000Z",
+                labels=["aws"],
+                registry_type="GITHUB",
+                registry_url="ghcr.io",
+            ),
+            _make_plugin("plugin-b", "2024-01-02T00:00:00.000Z"),
+        ]
+        self.conn = MagicMock()
+        self.conn.dispatch.side_effect = self._dispatch
+
+        self.mirror_mgr = RemoteMirrorManager()
+        self.mirror_mgr.locator = MagicMock()
+        self.mirror_mgr.locator.get_connector.return_value = self.conn
+        self.mirror_mgr.locator.get_model.side_effect = {
+            "RemotePlugin": RemotePlugin,
+            "RemoteSyncState": RemoteSyncState,
+        }.get
+        self.mirror_mgr.state_model = RemoteSyncState
+
+    def _dispatch(self, method, params):
+        query = params["query"]
+        plugins = [p for p in self.remote_plugins if self._match(p, query)]
+        plugins.sort(key=lambda p: [p[sort["key"]] for sort in query["sort"]])
+
+        if only := query.get("only"):
+            plugins = [{key: p[key] for key in only} for p in plugins]
+
+        return {
+            "results": plugins[: query["page"]["limit"]],
+            "total_count": len(plugins),
+        }
+
+    @staticmethod
+    def _match(plugin, query):
+        operators = {
+            "datetime_gte": lambda a, b: a >= b,
+            "datetime_gt": lambda a, b: a > b,
+            "gt": lambda a, b: a > b,
+        }
+
+        def _match_condition(condition):
+            return operators[condition["o"]](plugin[condition["k"]], condition["v"])
+
+        filter_or = query.get("filter_or", [])
+        return all(map(_match_condition, query.get("filter", []))) and (
+            not filter_or or any(map(_match_condition, filter_or))
+        )
+
+    def _get_remote_filters(self):
+        return [
+            call.args[1]["query"].get("filter")
+            for call in self.conn.dispatch.call_args_list
+            if "only" not in call.args[1]["query"]
+        ]
+
+    def test_sync(self):
+        result = self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.assertEqual(result, {"updated_count": 2, "deleted_count": 0})
+        self.assertEqual(RemotePlugin.objects.count(), 2)
+        self.assertTrue(self.mirror_mgr.is_fresh("repo-remote", "Plugin"))
+
+        plugin_info = self.mirror_mgr.get_resource("repo-remote", "Plugin", "plugin-a")
+        self.assertEqual(plugin_info["labels"], ["aws"])
+        self.assertEqual(plugin_info["registry_url"], "ghcr.io")
+        self.assertNotIn(
+            "registry_url", self.mirror_mgr.get_resource("repo-remote", "Plugin", "plugin-b")
+        )
+        self.assertEqual(plugin_info["updated_at"], datetime.datetime(2024, 1, 1))
+        self.assertNotIn("repository_id", plugin_info)
+
+    def test_incremental_sync(self):
+        self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.remote_plugins = [
+            _make_plugin("plugin-b", "2024-01-02T00:00:00.000Z"),
+            _make_plugin("plugin-c", "2024-01-03T00:00:00.000Z"),
+        ]
+        self.conn.dispatch.reset_mock()
+        result = self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.assertEqual(
+            self._get_remote_filters()[0][0]["v"], "2024-01-02T00:00:00.000Z"
+        )
+        self.assertEqual(result, {"updated_count": 2, "deleted_count": 1})
+
+        plugins_info, total_count = self.mirror_mgr.list_resources(
+            "repo-remote", "Plugin", {"sort": [{"key": "name"}]}
+        )
+        self.assertEqual(total_count, 2)
+        self.assertEqual(
+            [plugin_info["plugin_id"] for plugin_info in plugins_info],
+            ["plugin-b", "plugin-c"],
+        )
+
+    def test_sync_pages_by_keyset(self):
+        self.mirror_mgr.page_size = 2
+        self.remote_plugins.append(_make_plugin("plugin-c", "2024-01-02T00:00:00.000Z"))
+        self.remote_plugins.append(_make_plugin("plugin-d", "2024-01-03T00:00:00.000Z"))
+
+        result = self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.assertEqual(result, {"updated_count": 4, "deleted_count": 0})
+        self.assertEqual(
+            self.conn.dispatch.call_args_list[1].args[1]["query"]["filter_or"],
+            [
+                {"k": "updated_at", "v": "2024-01-02T00:00:00.000Z", "o": "datetime_gt"},
+                {"k": "plugin_id", "v": "plugin-b", "o": "gt"},
+            ],
+        )
+
+    def test_empty_remote_ids_do_not_delete(self):
+        self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.remote_plugins = []
+        result = self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.assertEqual(result, {"updated_count": 0, "deleted_count": 0})
+        self.assertEqual(RemotePlugin.objects.count(), 2)
+
+    def test_full_sync_after_schema_change(self):
+        self.mirror_mgr.sync(REPO_INFO, "Plugin")
+        self.mirror_mgr.get_state("repo-remote", "Plugin").update({"schema_version": 1})
+
+        self.conn.dispatch.reset_mock()
+        self.mirror_mgr.sync(REPO_INFO, "Plugin")
+
+        self.assertEqual(self._get_remote_filters(), [None])
+
+    def test_sync_state_is_cached(self):
+        self.mirror_mgr.sync(REPO_INFO, "Plugin")
+        RemoteSyncState.objects.delete()
+
+        self.assertTrue(self.mirror_mgr.is_fresh("repo-remote", "Plugin"))
+
+        self.mirror_mgr.state_cache_ttl = 0
+        self.assertFalse(self.mirror_mgr.has_mirror("repo-remote", "Plugin"))
+
+    def test_not_synced(self):
+        self.assertFalse(self.mirror_mgr.is_fresh("repo-remote", "Plugin"))
+        self.assertFalse(self.mirror_mgr.has_mirror("repo-remote", "Plugin"))
+
+    def test_stale_mirror(self):
+        self.mirror_mgr.sync(REPO_INFO, "Plugin")
+        self.mirror_mgr.max_age = 0
+
+        self.assertFalse(self.mirror_mgr.is_fresh("repo-remote", "Plugin"))
+        self.assertTrue(self.mirror_mgr.has_mirror("repo-remote", "Plugin"))
+
+
+if __name__ == "__main__":
+    unittest.main()